@@ -13,105 +13,37 @@ Example:
 """
 
 import argparse
+import fnmatch
+import io
+import os
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Final
 
+# The build package is only needed to build in-process, subprocess builds are used without it
+try:
+    import pyproject_hooks
+    from build import BuildBackendException, BuildException, ProjectBuilder
+    from build.env import DefaultIsolatedEnv
+except ImportError:
+    ProjectBuilder = None
 
-def clean_build_directories():
-    """Remove existing build artifacts."""
-    dirs_to_clean = ["warg_common", "build", "dist", "*.egg-info"]
-    for dir_pattern in dirs_to_clean:
-        for path in Path(".").glob(dir_pattern):
-            if path.exists():
-                print(f"Cleaning {path}")
-                if path.is_dir():
-                    shutil.rmtree(path)
-                else:
-                    path.unlink()
-
-
-def copy_module(module_name: str, source_dir: Path, target_dir: Path):
-    """Copy a module from source to target directory."""
-    source_module = source_dir / module_name
+# Serializes progress output from worker threads
+print_lock = threading.Lock()
 
-    if not source_module.exists():
-        print(f"Warning: Module '{module_name}' not found in {source_dir}")
-        return False
-
-    target_module = target_dir / module_name
+# Larger chunks for shutil's read/write copy loop on platforms without a
+# zero-copy fast path (the default is 64 KiB, or 1 MiB on Windows)
+shutil.COPY_BUFSIZE = 4 * 1024 * 1024
 
-    if source_module.is_dir():
-        shutil.copytree(source_module, target_module)
-        print(f"Copied module: {module_name}/")
-    else:
-        shutil.copy2(source_module, target_module)
-        print(f"Copied module: {module_name}")
 
-    return True
-
-
-def create_package_structure(modules: list[str]):
-    """Create the warg_common package structure with specified modules."""
-    warg_common_dir = Path("warg_common")
-    warg_common_dir.mkdir(exist_ok=True)
-
-    # Create __init__.py for the package
-    init_file = warg_common_dir / "__init__.py"
-    init_file.write_text(
-        '"""WARG Common package with shared modules."""\n\n__version__ = "0.1.0"\n'
-    )
-
-    # Copy each specified module
-    modules_dir = Path("modules")
-    copied_modules = []
-
-    for module in modules:
-        if copy_module(module, modules_dir, warg_common_dir):
-            copied_modules.append(module)
-
-    # Copy module-level files if they exist
-    for file_name in ["__init__.py"] + [
-        f for f in modules_dir.glob("*.py") if f.name != "__init__.py"
-    ]:
-        if file_name == "__init__.py":
-            continue  # We already created our own __init__.py
-        source_file = modules_dir / file_name if isinstance(file_name, str) else file_name
-        if source_file.exists() and source_file.is_file():
-            target_file = warg_common_dir / source_file.name
-            shutil.copy2(source_file, target_file)
-            print(f"Copied: {source_file.name}")
-
-    return copied_modules
-
-
-def build_wheel():
-    """Build the Python wheel package."""
-    print("\nBuilding wheel...")
-    result = subprocess.run(
-        [sys.executable, "-m", "build", "--wheel"],
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode == 0:
-        print("✓ Wheel built successfully!")
-        print(f"\nOutput in dist/:")
-        for wheel in Path("dist").glob("*.whl"):
-            print(f"  - {wheel.name}")
-        return True
-    else:
-        print("✗ Build failed!")
-        print(result.stderr)
-        return False
-
-
-def generate_modules_rst(copied_modules: list[str]):
-    """Generate modules.rst based on which modules were actually copied."""
-    # Module documentation templates
-    module_docs = {
-        "camera": """
+# API reference sections for each module, in modules.rst
+MODULE_DOCS: Final[dict[str, str]] = {
+    "camera": """
 Camera Module
 -------------
 
@@ -120,7 +52,7 @@ Camera Module
    :undoc-members:
    :show-inheritance:
 """,
-        "network": """
+    "network": """
 Network Module
 --------------
 
@@ -140,7 +72,7 @@ UDP
    :undoc-members:
    :show-inheritance:
 """,
-        "logger": """
+    "logger": """
 Logger Module
 -------------
 
@@ -149,7 +81,7 @@ Logger Module
    :undoc-members:
    :show-inheritance:
 """,
-        "data_encoding": """
+    "data_encoding": """
 Data Encoding Module
 --------------------
 
@@ -158,7 +90,7 @@ Data Encoding Module
    :undoc-members:
    :show-inheritance:
 """,
-        "image_encoding": """
+    "image_encoding": """
 Image Encoding Module
 ---------------------
 
@@ -167,7 +99,7 @@ Image Encoding Module
    :undoc-members:
    :show-inheritance:
 """,
-        "qr": """
+    "qr": """
 QR Module
 ---------
 
@@ -176,7 +108,7 @@ QR Module
    :undoc-members:
    :show-inheritance:
 """,
-        "kml": """
+    "kml": """
 KML Module
 ----------
 
@@ -185,7 +117,7 @@ KML Module
    :undoc-members:
    :show-inheritance:
 """,
-        "read_yaml": """
+    "read_yaml": """
 Read YAML Module
 ----------------
 
@@ -194,7 +126,7 @@ Read YAML Module
    :undoc-members:
    :show-inheritance:
 """,
-        "hitl": """
+    "hitl": """
 HITL Module
 -----------
 
@@ -203,7 +135,7 @@ HITL Module
    :undoc-members:
    :show-inheritance:
 """,
-        "mavlink": """
+    "mavlink": """
 MAVLink Module
 --------------
 
@@ -212,19 +144,19 @@ MAVLink Module
    :undoc-members:
    :show-inheritance:
 """,
-    }
-
-    # Build the modules.rst content
-    content = ["API Reference", "=============", "",
-               "This page contains the API reference for all modules in the WARG Common package.", ""]
-
-    # Add documentation for each copied module
-    for module in copied_modules:
-        if module in module_docs:
-            content.append(module_docs[module])
-
-    # Always include data types section (these are standalone files)
-    content.append("""
+}
+
+MODULES_RST_HEADER: Final[str] = (
+    "API Reference\n"
+    "=============\n"
+    "\n"
+    "This page contains the API reference for all modules in the WARG Common package.\n"
+    "\n"
+)
+
+# Data types section, always included since these are standalone files
+DATA_TYPES_RST: Final[str] = (
+    """
 Data Types
 ----------
 
@@ -275,36 +207,509 @@ Orientation
    :members:
    :undoc-members:
    :show-inheritance:
-""")
+"""
+)
+
+
+def log(message: str):
+    """Print a message without interleaving output from other threads."""
+    with print_lock:
+        print(message)
+
+
+def report_clean_error(_function, path: str, exc_info):
+    """Report a path that could not be removed instead of aborting the clean."""
+    print(f"Warning: Could not remove {path}: {exc_info[1]}")
+
+
+def clean_build_directories():
+    """Remove existing build artifacts."""
+    dirs_to_clean = ["warg_common", "build", "dist", "*.egg-info"]
+    # A single directory scan, reusing the cached entry type instead of stat-ing each match
+    with os.scandir(".") as entries:
+        for entry in entries:
+            if not any(fnmatch.fnmatch(entry.name, pattern) for pattern in dirs_to_clean):
+                continue
+
+            print(f"Cleaning {entry.name}")
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, onerror=report_clean_error)
+            else:
+                os.unlink(entry.path)
+
+
+def copy_tree(source: Path, target: Path):
+    """
+    Copy a directory tree, preferring the platform's native copier.
+
+    robocopy (Windows) and cp (POSIX) enumerate and copy directories far faster
+    than shutil.copytree, and cp clones files copy-on-write where the filesystem
+    supports it. Falls back to shutil.copytree if the tool is missing or fails.
+    An existing target, e.g. staged by an earlier --no-clean run, is replaced.
+    """
+    # cp would copy into an existing directory (target/<module>/<module>) and robocopy
+    # would merge with stale files, so every copier starts without a target
+    remove_staged_path(target)
+
+    if sys.platform == "win32":
+        if shutil.which("robocopy"):
+            result = subprocess.run(
+                [
+                    "robocopy",
+                    str(source),
+                    str(target),
+                    "/S",
+                    "/NFL",
+                    "/NDL",
+                    "/NJH",
+                    "/NJS",
+                    "/MT:8",
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+            # robocopy return codes 0-3 indicate success
+            if result.returncode <= 3:
+                return
+    elif shutil.which("cp"):
+        # Ask cp for copy-on-write clones so no file data is copied on btrfs/XFS/APFS
+        if sys.platform == "darwin":
+            command = ["cp", "-c", "-a", str(source), str(target)]
+        else:
+            command = ["cp", "--reflink=auto", "-a", str(source), str(target)]
+        result = subprocess.run(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        if result.returncode == 0:
+            return
+
+    # Remove anything a failed native copy left behind
+    if target.exists():
+        shutil.rmtree(target)
+    shutil.copytree(source, target, copy_function=clone_file)
+
+
+def remove_staged_path(target: Path):
+    """
+    Remove a previously staged file, directory or link, without following links.
+
+    Links staged by --link point back into modules/, so copying over one without
+    removing it first would overwrite the source it points to.
+    """
+    if target.is_symlink():
+        target.unlink()
+    elif getattr(target, "is_junction", lambda: False)():
+        # Removes the junction itself, not the directory it points to
+        os.rmdir(target)
+    elif target.is_dir():
+        shutil.rmtree(target)
+    elif target.exists():
+        # Also breaks a hard link made by --link on Windows instead of writing through it
+        target.unlink()
+
+
+def clone_file(source: str | Path, target: str | Path) -> str | Path:
+    """
+    Copy a single file, letting the kernel share extents where supported.
+
+    Uses os.copy_file_range where available, which reflinks on filesystems that
+    support it. Falls back to shutil.copy2 otherwise, which itself uses the
+    os.sendfile zero-copy path on Linux.
+    """
+    remove_staged_path(Path(target))
+
+    if not hasattr(os, "copy_file_range"):
+        return shutil.copy2(source, target)
+
+    try:
+        with open(source, "rb") as source_file, open(target, "wb") as target_file:
+            remaining = os.fstat(source_file.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(source_file.fileno(), target_file.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError:
+        return shutil.copy2(source, target)
+
+    shutil.copystat(source, target)
+    return target
+
+
+def link_path(source: Path, target: Path):
+    """
+    Link target to source instead of copying it.
+
+    Uses a symlink where possible. On Windows without symlink privileges,
+    directories fall back to a junction and files to a hard link.
+    """
+    # Replacing an already staged link, file or tree keeps --no-clean usable in link mode
+    remove_staged_path(target)
+
+    source = source.resolve()
+    try:
+        os.symlink(source, target, target_is_directory=source.is_dir())
+    except OSError:
+        if sys.platform != "win32":
+            raise
+        if source.is_dir():
+            import _winapi  # pylint: disable=import-outside-toplevel
+
+            _winapi.CreateJunction(str(source), str(target))
+        else:
+            os.link(source, target)
+
+
+def copy_module(
+    module_name: str, source_dir: Path, target_dir: Path, link: bool = False
+) -> tuple[str, bool]:
+    """Copy (or link, if `link` is set) a module from source to target directory."""
+    source_module = source_dir / module_name
+
+    if not source_module.exists():
+        log(f"Warning: Module '{module_name}' not found in {source_dir}")
+        return module_name, False
+
+    target_module = target_dir / module_name
+
+    if link:
+        link_path(source_module, target_module)
+        log(f"Linked module: {module_name}")
+    elif source_module.is_dir():
+        copy_tree(source_module, target_module)
+        log(f"Copied module: {module_name}/")
+    else:
+        clone_file(source_module, target_module)
+        log(f"Copied module: {module_name}")
+
+    return module_name, True
 
-    # Write the generated content
+
+def copy_file(source_file: Path, target_dir: Path, link: bool = False):
+    """Copy (or link, if `link` is set) a single module-level file into the target directory."""
+    if link:
+        link_path(source_file, target_dir / source_file.name)
+        log(f"Linked: {source_file.name}")
+    else:
+        clone_file(source_file, target_dir / source_file.name)
+        log(f"Copied: {source_file.name}")
+
+
+def create_package_structure(
+    modules: list[str],
+    jobs: int | None = None,
+    warg_common_dir: Path = Path("warg_common"),
+    link: bool = False,
+):
+    """
+    Create the warg_common package structure with specified modules.
+
+    Module trees are independent of each other, so they are copied concurrently
+    on a thread pool of up to `jobs` workers (defaults to the CPU count). With
+    `link`, modules are linked back to modules/ instead of copied, so edits are
+    picked up without restaging.
+    """
+    warg_common_dir.mkdir(parents=True, exist_ok=True)
+
+    # Create __init__.py for the package
+    init_file = warg_common_dir / "__init__.py"
+    init_file.write_text(
+        '"""WARG Common package with shared modules."""\n\n__version__ = "0.1.0"\n',
+        encoding="utf-8",
+    )
+
+    modules_dir = Path("modules")
+    copied = set()
+
+    # Module-level files, except __init__.py since we already created our own
+    module_files = [f for f in modules_dir.glob("*.py") if f.name != "__init__.py" and f.is_file()]
+
+    max_workers = max(1, min(len(modules) + len(module_files), jobs or os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        module_futures = [
+            executor.submit(copy_module, module, modules_dir, warg_common_dir, link)
+            for module in modules
+        ]
+        file_futures = [
+            executor.submit(copy_file, source_file, warg_common_dir, link)
+            for source_file in module_files
+        ]
+
+        for future in as_completed(module_futures):
+            module_name, ok = future.result()
+            if ok:
+                copied.add(module_name)
+
+        for future in as_completed(file_futures):
+            future.result()
+
+    # Preserve the order requested on the command line
+    return [module for module in modules if module in copied]
+
+
+def run_streaming(command: list[str], env: dict[str, str] | None = None) -> int:
+    """
+    Run a command, echoing its combined output as it is produced.
+
+    Returns the exit code. The output has already been shown, so it is not kept.
+    """
+    with subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+        env=env,
+    ) as process:
+        for line in process.stdout:
+            sys.stdout.write(line)
+
+    return process.returncode
+
+
+def build_environment(
+    config_dir: Path, jobs: int | None = None, mypyc: bool = False
+) -> dict[str, str]:
+    """
+    Create the environment for a wheel build subprocess.
+
+    Writes a DIST_EXTRA_CONFIG file into `config_dir` so setuptools compiles any
+    C extensions with up to `jobs` parallel workers (defaults to the CPU count).
+    Compilers are wrapped with ccache if it is installed; set CCACHE_DIR to point
+    the cache at a persistent CI location (defaults to .ccache/). With `mypyc`,
+    setup.py compiles the modules listed in its MYPYC_MODULES.
+    """
+    jobs = jobs or os.cpu_count() or 1
+
+    dist_extra_config = config_dir / "dist_extra.cfg"
+    dist_extra_config.write_text(f"[build_ext]\nparallel = {jobs}\n", encoding="utf-8")
+
+    env = {
+        **os.environ,
+        "DIST_EXTRA_CONFIG": str(dist_extra_config.resolve()),
+        "MAX_JOBS": str(jobs),
+    }
+
+    # Reuse object files from previous builds when ccache is available
+    if shutil.which("ccache"):
+        env["CC"] = "ccache " + env.get("CC", "cc")
+        env["CXX"] = "ccache " + env.get("CXX", "c++")
+        env.setdefault("CCACHE_DIR", str(Path(".ccache").resolve()))
+
+    if mypyc:
+        env["MYPYC_BUILD"] = "1"
+
+    return env
+
+
+def build_wheel_in_process(
+    source_dir: Path, output_dir: Path, env: dict[str, str]
+) -> tuple[bool, str]:
+    """
+    Build a wheel with the build package's Python API in an isolated environment.
+
+    This avoids starting a separate interpreter for the build frontend. Only the
+    backend hooks run in subprocesses, with `env` as their environment.
+    """
+
+    def runner(
+        command: list[str], cwd: str | None = None, extra_environ: dict[str, str] | None = None
+    ):
+        pyproject_hooks.default_subprocess_runner(command, cwd, {**env, **(extra_environ or {})})
+
+    try:
+        with DefaultIsolatedEnv() as isolated_env:
+            builder = ProjectBuilder.from_isolated_env(isolated_env, source_dir, runner=runner)
+            isolated_env.install(builder.build_system_requires)
+            isolated_env.install(builder.get_requires_for_build("wheel"))
+            builder.build("wheel", output_dir)
+    except (BuildException, BuildBackendException, subprocess.CalledProcessError) as exception:
+        return False, str(exception)
+
+    return True, ""
+
+
+def build_wheel(jobs: int | None = None, mypyc: bool = False):
+    """
+    Build the Python wheel package.
+
+    Any C extensions are compiled with up to `jobs` parallel workers. With
+    `mypyc`, the wheel is platform specific.
+    """
+    print("\nBuilding wheel...")
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        env = build_environment(Path(config_dir), jobs, mypyc)
+        if ProjectBuilder is None:
+            returncode = run_streaming([sys.executable, "-m", "build", "--wheel"], env)
+            success = returncode == 0
+            # The build output was streamed above
+            output = f"Exit code: {returncode}"
+        else:
+            success, output = build_wheel_in_process(Path("."), Path("dist"), env)
+
+    if success:
+        print("✓ Wheel built successfully!")
+        print(f"\nOutput in dist/:")
+        for wheel in Path("dist").glob("*.whl"):
+            print(f"  - {wheel.name}")
+        return True
+    else:
+        print("✗ Build failed!")
+        print(output)
+        return False
+
+
+def build_wheel_target(
+    project_dir: Path, dist_name: str, jobs: int | None = None, mypyc: bool = False
+) -> tuple[int, str]:
+    """
+    Build the wheel for a staged project directory into its own dist/.
+
+    The wheel's distribution is named `dist_name` instead of warg_common. Runs in
+    a worker process, so output is captured rather than streamed.
+    """
+    env = build_environment(project_dir, jobs, mypyc)
+    env["WARG_COMMON_DIST_NAME"] = dist_name
+    result = subprocess.run(
+        [sys.executable, "-m", "build", "--wheel", "--outdir", "dist"],
+        cwd=project_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    return result.returncode, result.stdout + result.stderr
+
+
+def build_wheels_parallel(
+    modules: list[str], wheel_count: int, jobs: int | None = None, mypyc: bool = False
+):
+    """
+    Build one wheel per group of modules, running the builds concurrently.
+
+    The modules are split into up to `wheel_count` groups. Each group is staged
+    into its own build/warg_common_<index>/ project and built in a separate
+    process, as a distribution named after its modules (warg_common_<modules>).
+    The `jobs` compile workers are split between the builds.
+    """
+    wheel_count = max(1, min(wheel_count, len(modules)))
+    groups = [modules[i::wheel_count] for i in range(wheel_count)]
+    worker_jobs = max(1, (jobs or os.cpu_count() or 1) // wheel_count)
+
+    print(f"\nBuilding {wheel_count} wheel(s) in parallel...")
+    project_dirs = []
+    for index, group in enumerate(groups):
+        project_dir = Path("build") / f"warg_common_{index}"
+        if project_dir.exists():
+            shutil.rmtree(project_dir)
+        create_package_structure(group, jobs, project_dir / "warg_common")
+        shutil.copy2("setup.py", project_dir / "setup.py")
+        project_dirs.append(project_dir)
+
+    success = True
+    with ProcessPoolExecutor(max_workers=wheel_count) as executor:
+        futures = {
+            executor.submit(
+                build_wheel_target,
+                project_dir,
+                "_".join(["warg_common", *group]),
+                worker_jobs,
+                mypyc,
+            ): (project_dir, group)
+            for project_dir, group in zip(project_dirs, groups)
+        }
+        for future in as_completed(futures):
+            project_dir, group = futures[future]
+            returncode, output = future.result()
+            if returncode != 0:
+                print(f"✗ Build failed for: {', '.join(group)}")
+                print(output)
+                success = False
+                continue
+
+            output_dir = Path("dist")
+            output_dir.mkdir(exist_ok=True)
+            for wheel in (project_dir / "dist").glob("*.whl"):
+                shutil.move(str(wheel), output_dir / wheel.name)
+                print(f"  - {output_dir / wheel.name}")
+
+    if success:
+        print("✓ Wheels built successfully!")
+
+    return success
+
+
+def render_modules_rst(copied_modules: list[str]) -> str:
+    """Assemble modules.rst content for the modules that were actually copied."""
+    buffer = io.StringIO()
+    buffer.write(MODULES_RST_HEADER)
+    for module in copied_modules:
+        if module in MODULE_DOCS:
+            buffer.write(MODULE_DOCS[module])
+            buffer.write("\n")
+    buffer.write(DATA_TYPES_RST)
+
+    return buffer.getvalue()
+
+
+def generate_modules_rst(copied_modules: list[str]):
+    """Generate modules.rst based on which modules were actually copied."""
+    new_content = render_modules_rst(copied_modules)
+
+    # Write the generated content, leaving the file untouched if nothing changed
+    # so that Sphinx does not treat it as outdated
     modules_rst_path = Path("docs/modules.rst")
-    modules_rst_path.write_text("\n".join(content))
+    if modules_rst_path.exists() and modules_rst_path.read_text(encoding="utf-8") == new_content:
+        print(f"modules.rst is up to date with {len(copied_modules)} module(s)")
+        return
+
+    modules_rst_path.write_text(new_content, encoding="utf-8")
     print(f"Generated modules.rst with {len(copied_modules)} module(s)")
 
 
-def build_docs(copied_modules: list[str]):
-    """Build Sphinx documentation and copy to dist/."""
+def build_docs(copied_modules: list[str], clean: bool = False):
+    """
+    Build Sphinx documentation and copy to dist/.
+
+    Sphinx reads and writes in parallel across all CPUs. The doctree cache in
+    docs/_build/doctrees is kept between runs so Sphinx only rereads changed
+    sources. Pass `clean` to force a full rebuild.
+    """
     print("\nBuilding documentation...")
 
     # Generate modules.rst based on what was copied
     generate_modules_rst(copied_modules)
 
-    # Clean previous docs build
-    docs_build_dir = Path("docs/_build")
+    # Clean previous docs build, keeping the doctrees unless a full rebuild is requested
+    docs_build_dir = Path("docs/_build") if clean else Path("docs/_build/html")
     if docs_build_dir.exists():
         shutil.rmtree(docs_build_dir)
 
     # Build HTML documentation
-    result = subprocess.run(
-        [sys.executable, "-m", "sphinx", "-b", "html", "docs", "docs/_build/html"],
-        capture_output=True,
-        text=True,
+    returncode = run_streaming(
+        [
+            sys.executable,
+            "-m",
+            "sphinx",
+            "-j",
+            "auto",
+            "-b",
+            "html",
+            "-d",
+            "docs/_build/doctrees",
+            "docs",
+            "docs/_build/html",
+        ]
     )
 
-    if result.returncode != 0:
-        print("✗ Documentation build failed!")
-        print(result.stderr)
+    if returncode != 0:
+        print(f"✗ Documentation build failed! Exit code: {returncode}")
         return False
 
     # Copy documentation to dist/
@@ -330,6 +735,34 @@ def main():
     parser.add_argument(
         "--docs", action="store_true", help="Build Sphinx documentation"
     )
+    parser.add_argument(
+        "--docs-clean",
+        action="store_true",
+        help="Discard the cached Sphinx doctrees and rebuild the documentation from scratch",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of parallel workers used for staging and compiling (default: CPU count)",
+    )
+    parser.add_argument(
+        "--link",
+        action="store_true",
+        help="Symlink modules instead of copying them and skip building a wheel",
+    )
+    parser.add_argument(
+        "--parallel-wheels",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Split the modules into N separate wheels built in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--mypyc",
+        action="store_true",
+        help="Compile the modules in setup.py MYPYC_MODULES with mypyc (platform specific wheel)",
+    )
 
     args = parser.parse_args()
 
@@ -343,8 +776,18 @@ def main():
         clean_build_directories()
 
     # Create package structure
-    print(f"\nCreating package structure with modules: {', '.join(args.modules)}")
-    copied_modules = create_package_structure(args.modules)
+    # Parallel wheels stage each group into its own project, warg_common/ is then only
+    # needed by the docs
+    if args.parallel_wheels > 1 and not args.link and not args.docs:
+        copied_modules = []
+        for module in args.modules:
+            if (Path("modules") / module).exists():
+                copied_modules.append(module)
+            else:
+                print(f"Warning: Module '{module}' not found in modules")
+    else:
+        print(f"\nCreating package structure with modules: {', '.join(args.modules)}")
+        copied_modules = create_package_structure(args.modules, args.jobs, link=args.link)
 
     if not copied_modules:
         print("\nError: No modules were copied. Aborting build.")
@@ -352,13 +795,21 @@ def main():
 
     print(f"\nSuccessfully prepared {len(copied_modules)} module(s)")
 
-    # Build the wheel
-    wheel_success = build_wheel()
+    # Build the wheel, except in link mode where the staged package is used in place
+    if args.link:
+        print(f"\nLinked package staged, add {Path('.').resolve()} to PYTHONPATH to import it")
+        wheel_success = True
+    elif args.parallel_wheels > 1:
+        wheel_success = build_wheels_parallel(
+            copied_modules, args.parallel_wheels, args.jobs, args.mypyc
+        )
+    else:
+        wheel_success = build_wheel(args.jobs, args.mypyc)
 
     # Build documentation if requested
     docs_success = True
     if args.docs:
-        docs_success = build_docs(copied_modules)
+        docs_success = build_docs(copied_modules, args.docs_clean)
 
     print("\n" + "=" * 60)
     if wheel_success and docs_success:
@@ -21,7 +21,6 @@ autodoc_mock_imports = [
     'pymavlink',
     'pyzbar',
     'PIL',
-    'simplekml',
     'pyvirtualcam',
     'yaml',
 ]
@@ -1,12 +1,29 @@
 """
 Camera module exports.
+
+Backends that load native libraries (Picamera2, ArducamEvkSDK) are imported on
+first access so that importing this package stays cheap.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .base_camera import BaseCameraDevice
 from .camera_factory import CameraOption, create_camera
 from .camera_opencv import CameraOpenCV, ConfigOpenCV
-from .camera_picamera2 import CameraPiCamera2, ConfigPiCamera2
-from .camera_arducamir import CameraArducamIR, ArducamOutput
+
+if TYPE_CHECKING:
+    # Lets type checkers and linters see the lazily exported names
+    from .camera_arducamir import ArducamOutput, CameraArducamIR
+    from .camera_picamera2 import CameraPiCamera2, ConfigPiCamera2
+
+# Exported name -> submodule providing it, imported on first access
+LAZY_EXPORTS = {
+    "CameraPiCamera2": "camera_picamera2",
+    "ConfigPiCamera2": "camera_picamera2",
+    "CameraArducamIR": "camera_arducamir",
+    "ArducamOutput": "camera_arducamir",
+}
 
 __all__ = [
     "BaseCameraDevice",
@@ -19,3 +36,24 @@ __all__ = [
     "CameraArducamIR",
     "ArducamOutput",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import lazily exported names on first access (PEP 562).
+    """
+    module_name = LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    Include lazily exported names in dir().
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -12,8 +12,14 @@ class BaseCameraDevice(abc.ABC):
     Abstract class for camera device implementations.
 
     This class provides an interface for camera devices that can capture images.
+    Hardware resources are released by close(), or by using the device as a
+    context manager.
     """
 
+    # Implementations declare their own slots so instances have no __dict__
+    # __weakref__ allows implementations to register a weakref.finalize safety net
+    __slots__ = ("__weakref__",)
+
     @classmethod
     @abc.abstractmethod
     def create(
@@ -56,12 +62,38 @@ class BaseCameraDevice(abc.ABC):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def __del__(self) -> None:
+    def close(self) -> None:
         """
-        Destructor. Release hardware resources.
+        Release hardware resources. Safe to call more than once.
         """
         raise NotImplementedError
 
+    def __enter__(self) -> "BaseCameraDevice":
+        """
+        Enter the runtime context.
+
+        Returns
+        -------
+        BaseCameraDevice
+            This camera device.
+        """
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        """
+        Exit the runtime context, releasing hardware resources.
+
+        Parameters
+        ----------
+        exc_type : object
+            Exception type, if an exception was raised.
+        exc_value : object
+            Exception instance, if an exception was raised.
+        traceback : object
+            Traceback, if an exception was raised.
+        """
+        self.close()
+
     @abc.abstractmethod
     def run(self) -> Tuple[Literal[True], NDArray[np.uint8]] | Tuple[Literal[False], None]:
         """
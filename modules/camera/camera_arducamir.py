@@ -1,6 +1,8 @@
 """ArducamIR implementation of the camera wrapper."""
 
 import enum
+import sys
+import weakref
 from typing import Optional, Tuple, Literal
 
 import cv2
@@ -15,6 +17,21 @@ from . import base_camera
 CAMERA_CONFIG_DIR = "./config/camera_config.cfg"
 
 
+def cuda_available() -> bool:
+    """
+    Check whether OpenCV was built with CUDA and a CUDA device is present.
+
+    Returns
+    -------
+    bool
+        True if cv2.cuda can be used, False otherwise.
+    """
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
 class ArducamOutput(enum.Enum):
     """
     Enum for ArducamIR output type.
@@ -39,6 +56,18 @@ class CameraArducamIR(base_camera.BaseCameraDevice):
     for Arducam RGB-IR camera modules.
     """
 
+    __slots__ = (
+        "__camera",
+        "__format_buffer",
+        "__rgb_buffer",
+        "__ir_resized_buffer",
+        "__ir_buffer",
+        "__use_cuda",
+        "__gpu_bayer",
+        "__gpu_ir",
+        "__finalizer",
+    )
+
     __create_key = object()
 
     @classmethod
@@ -90,15 +119,42 @@ class CameraArducamIR(base_camera.BaseCameraDevice):
         assert class_private_create_key is CameraArducamIR.__create_key, "Use create() method."
 
         self.__camera = camera
+        # Reused by format() to avoid allocating a new 8-bit frame per capture
+        self.__format_buffer: Optional[NDArray[np.uint8]] = None
+        # Reused by demosaic() as OpenCV destination buffers, sized on first frame
+        self.__rgb_buffer: Optional[NDArray[np.uint8]] = None
+        self.__ir_resized_buffer: Optional[NDArray[np.uint8]] = None
+        self.__ir_buffer: Optional[NDArray[np.uint8]] = None
+        # Device buffers for demosaic_gpu(), only created when CUDA is available
+        self.__use_cuda = cuda_available()
+        if self.__use_cuda:
+            self.__gpu_bayer = cv2.cuda_GpuMat()
+            self.__gpu_ir = cv2.cuda_GpuMat()
+
         self.__camera.init()
         self.__camera.start()
 
-    def __del__(self) -> None:
+        # Releases the camera if close() is never called
+        self.__finalizer = weakref.finalize(self, CameraArducamIR.__release, camera)
+
+    def close(self) -> None:
+        """
+        Release hardware resources.
         """
-        Destructor. Release hardware resources.
+        self.__finalizer()
+
+    @staticmethod
+    def __release(camera: ArducamEvkSDK.Camera) -> None:
         """
-        self.__camera.stop()
-        self.__camera.close()
+        Stop and close the camera.
+
+        Parameters
+        ----------
+        camera : ArducamEvkSDK.Camera
+            ArducamEvkSDK Camera object.
+        """
+        camera.stop()
+        camera.close()
 
     def run(self) -> Tuple[Literal[True], ArducamEvkSDK.Frame] | Tuple[Literal[False], None]:
         """
@@ -122,7 +178,8 @@ class CameraArducamIR(base_camera.BaseCameraDevice):
         Convert Bayer Pattern and IR data to OpenCV matrix.
 
         This method processes the raw sensor data and converts it to either
-        RGB or IR image format.
+        RGB or IR image format. The result is written into a buffer that is
+        reused between calls, so it is only valid until the next call.
 
         Parameters
         ----------
@@ -140,20 +197,74 @@ class CameraArducamIR(base_camera.BaseCameraDevice):
         data = self.format(image)
         # Splits raw sensor data into bayer data and IR data using GRIG (Green, Red, IR, Green) filter pattern
         bayer, ir = arducam_rgbir_remosaic.rgbir_remosaic(data, arducam_rgbir_remosaic.GRIG)
+        height, width = bayer.shape[:2]
         if output == ArducamOutput.RGB:
+            if self.__rgb_buffer is None or self.__rgb_buffer.shape[:2] != (height, width):
+                self.__rgb_buffer = np.empty((height, width, 4), np.uint8)
             # Converts Bayer data to BGRA (Blue, Green, Red, Alpha)
-            return cv2.cvtColor(bayer, cv2.COLOR_BayerRG2BGRA)
+            return cv2.cvtColor(bayer, cv2.COLOR_BayerRG2BGRA, dst=self.__rgb_buffer)
+
+        if self.__ir_buffer is None or self.__ir_buffer.shape[:2] != (height, width):
+            self.__ir_resized_buffer = np.empty((height, width), np.uint8)
+            self.__ir_buffer = np.empty((height, width, 4), np.uint8)
+        # Resize the IR image so that they are both the same size
+        # Resizing while single channel touches a quarter of the memory of resizing BGRA
+        cv2.resize(ir, (width, height), dst=self.__ir_resized_buffer)
         # Converts IR data to BGRA
-        ir_color = cv2.cvtColor(ir, cv2.COLOR_GRAY2BGRA)
+        return cv2.cvtColor(self.__ir_resized_buffer, cv2.COLOR_GRAY2BGRA, dst=self.__ir_buffer)
+
+    def demosaic_gpu(
+        self, image: ArducamEvkSDK.Frame, output: ArducamOutput
+    ) -> Optional["cv2.cuda.GpuMat"]:
+        """
+        Convert Bayer Pattern and IR data to a GPU matrix.
+
+        Same as demosaic(), but the colour conversion and resize run on the GPU
+        and the result is left in device memory. Call download() on the result
+        if the image is needed in host memory. RGB-IR remosaicing still runs on
+        the CPU since arducam_rgbir_remosaic has no GPU implementation.
+
+        Parameters
+        ----------
+        image : ArducamEvkSDK.Frame
+            Raw frame from ArducamIR camera.
+        output : ArducamOutput
+            Desired output type (RGB or IR).
+
+        Returns
+        -------
+        Optional[cv2.cuda.GpuMat]
+            Processed image in BGRA format, or None if CUDA is not available.
+        """
+        if not self.__use_cuda:
+            return None
+
+        # Convert sensor data to useable format
+        data = self.format(image)
+        # Splits raw sensor data into bayer data and IR data using GRIG (Green, Red, IR, Green) filter pattern
+        bayer, ir = arducam_rgbir_remosaic.rgbir_remosaic(data, arducam_rgbir_remosaic.GRIG)
+
+        height, width = bayer.shape[:2]
+        if output == ArducamOutput.RGB:
+            self.__gpu_bayer.upload(bayer)
+            # Converts Bayer data to BGRA (Blue, Green, Red, Alpha)
+            return cv2.cuda.cvtColor(self.__gpu_bayer, cv2.COLOR_BayerRG2BGRA)
+
+        self.__gpu_ir.upload(ir)
         # Resize the IR image so that they are both the same size
-        return cv2.resize(ir_color, (bayer.shape[1], bayer.shape[0]))
+        ir_resized = cv2.cuda.resize(self.__gpu_ir, (width, height))
+        # Converts IR data to BGRA
+        return cv2.cuda.cvtColor(ir_resized, cv2.COLOR_GRAY2BGRA)
 
     def format(self, image: ArducamEvkSDK.Frame) -> NDArray[np.uint8]:
         """
         Format byte buffer sensor input into 8-bit arrays.
 
         This method converts the raw sensor data from the camera into a
-        standardized 8-bit numpy array format.
+        standardized 8-bit numpy array format. 8-bit and 16-bit inputs are
+        returned as views of the frame data. Other higher precision inputs are
+        written into a buffer that is reused between calls, so the result is
+        only valid until the next call.
 
         Parameters
         ----------
@@ -170,10 +281,25 @@ class CameraArducamIR(base_camera.BaseCameraDevice):
         bit_depth = image.format.bit_depth
         data = image.data
 
-        if bit_depth > 8:
+        if bit_depth == 16:
+            # Reducing 16-bit to 8-bit keeps only the high byte of each pixel,
+            # which can be viewed directly in the buffer without copying
+            data = np.ndarray(
+                (height, width),
+                np.uint8,
+                buffer=data,
+                offset=1 if sys.byteorder == "little" else 0,
+                strides=(width * 2, 2),
+            )
+        elif bit_depth > 8:
             data = np.frombuffer(data, np.uint16).reshape(height, width)
-            # Reduce higher precision inputs to 8-bit arrays
-            data = (data >> (bit_depth - 8)).astype(np.uint8)
+
+            if self.__format_buffer is None or self.__format_buffer.shape != (height, width):
+                self.__format_buffer = np.empty((height, width), np.uint8)
+
+            # Reduce higher precision inputs to 8-bit arrays in a single pass
+            np.right_shift(data, bit_depth - 8, out=self.__format_buffer, casting="unsafe")
+            data = self.__format_buffer
         else:
             data = np.frombuffer(data, np.uint8).reshape(height, width)
 
@@ -1,12 +1,16 @@
 """Factory pattern for constructing camera device class at runtime."""
 
 import enum
-from typing import Union, Tuple, Literal
+import functools
+import importlib
+from typing import TYPE_CHECKING, Callable, Dict, Union, Tuple, Literal
 
 from . import base_camera
-from . import camera_opencv
-from . import camera_picamera2
-from . import camera_arducamir
+
+# Backends are imported on first use so unused native libraries are never loaded
+if TYPE_CHECKING:
+    from . import camera_opencv
+    from . import camera_picamera2
 
 
 class CameraOption(enum.Enum):
@@ -28,11 +32,41 @@ class CameraOption(enum.Enum):
     ARDUCAMIR = 2
 
 
+# Module and class implementing each camera option
+CAMERA_BACKENDS: Dict[CameraOption, Tuple[str, str]] = {
+    CameraOption.OPENCV: ("camera_opencv", "CameraOpenCV"),
+    CameraOption.PICAM2: ("camera_picamera2", "CameraPiCamera2"),
+    CameraOption.ARDUCAMIR: ("camera_arducamir", "CameraArducamIR"),
+}
+
+
+@functools.cache
+def __get_camera_factory(camera_option: CameraOption) -> Callable:
+    """
+    Get the create method for a camera option, importing its backend on first use.
+
+    The result is memoized, so later calls skip the import machinery entirely.
+
+    Parameters
+    ----------
+    camera_option : CameraOption
+        Type of camera to create.
+
+    Returns
+    -------
+    Callable
+        The create classmethod of the camera implementation.
+    """
+    module_name, class_name = CAMERA_BACKENDS[camera_option]
+    module = importlib.import_module(f".{module_name}", __package__)
+    return getattr(module, class_name).create
+
+
 def create_camera(
     camera_option: CameraOption,
     width: int,
     height: int,
-    config: Union[camera_opencv.ConfigOpenCV, camera_picamera2.ConfigPiCamera2, None],
+    config: Union["camera_opencv.ConfigOpenCV", "camera_picamera2.ConfigPiCamera2", None],
 ) -> Tuple[Literal[True], base_camera.BaseCameraDevice] | Tuple[Literal[False], None]:
     """
     Create a camera object based on given parameters.
@@ -56,12 +90,7 @@ def create_camera(
     tuple[Literal[True], BaseCameraDevice] | tuple[Literal[False], None]
         Success status and camera device object if successful, (False, None) otherwise.
     """
-    match camera_option:
-        case CameraOption.OPENCV:
-            return camera_opencv.CameraOpenCV.create(width, height, config)
-        case CameraOption.PICAM2:
-            return camera_picamera2.CameraPiCamera2.create(width, height, config)
-        case CameraOption.ARDUCAMIR:
-            return camera_arducamir.CameraArducamIR.create(width, height, config)
-
-    return False, None
+    if camera_option not in CAMERA_BACKENDS:
+        return False, None
+
+    return __get_camera_factory(camera_option)(width, height, config)
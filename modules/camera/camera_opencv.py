@@ -1,6 +1,8 @@
 """OpenCV implementation of the camera wrapper."""
 
-from typing import Tuple, Literal
+import threading
+import weakref
+from typing import Optional, Tuple, Literal
 
 import cv2
 import numpy as np
@@ -9,6 +11,14 @@ from numpy.typing import NDArray
 from . import base_camera
 
 
+# Maximum time in seconds run() waits for the capture thread to produce a frame
+FRAME_TIMEOUT = 1.0
+# One buffer being written, one holding the latest frame, one held by the consumer
+FRAME_BUFFER_COUNT = 3
+# Seconds the capture thread waits after a failed read (unplugged device, end of stream)
+READ_FAILURE_BACKOFF = 0.1
+
+
 class ConfigOpenCV:
     """
     Configuration for the OpenCV camera.
@@ -31,13 +41,101 @@ class ConfigOpenCV:
         self.device_index = device_index
 
 
+class LatestFrameBuffers:
+    """
+    Preallocated frame buffers shared between a capture thread and a consumer.
+
+    The capture thread always writes into a buffer that is neither the latest
+    frame nor the one last handed to the consumer, so no buffer is allocated
+    per frame and a returned frame stays intact until the consumer acquires
+    the next one.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        Allocate the frame buffers.
+
+        Parameters
+        ----------
+        width : int
+            Width of the frames in pixels.
+        height : int
+            Height of the frames in pixels.
+        """
+        self.__buffers = [
+            np.empty((height, width, 3), dtype=np.uint8) for _ in range(FRAME_BUFFER_COUNT)
+        ]
+        self.__condition = threading.Condition()
+        self.__latest_index: Optional[int] = None
+        self.__reading_index: Optional[int] = None
+        self.__writing_index = 0
+
+    def write_buffer(self) -> NDArray[np.uint8]:
+        """
+        Get a free buffer for the capture thread to write the next frame into.
+
+        Returns
+        -------
+        NDArray[np.uint8]
+            Buffer that is not in use by the consumer.
+        """
+        with self.__condition:
+            busy = (self.__latest_index, self.__reading_index)
+            self.__writing_index = next(i for i in range(FRAME_BUFFER_COUNT) if i not in busy)
+            return self.__buffers[self.__writing_index]
+
+    def publish(self, image: Optional[NDArray[np.uint8]]) -> None:
+        """
+        Make the frame just written the latest frame.
+
+        Parameters
+        ----------
+        image : Optional[NDArray[np.uint8]]
+            The captured frame, or None if the capture failed.
+        """
+        with self.__condition:
+            if image is None:
+                self.__latest_index = None
+                return
+
+            # OpenCV allocates a new array if the frame does not fit the buffer
+            self.__buffers[self.__writing_index] = image
+            self.__latest_index = self.__writing_index
+            self.__condition.notify_all()
+
+    def acquire(self, timeout: float) -> Optional[NDArray[np.uint8]]:
+        """
+        Get the latest frame, waiting if none is available yet.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum time in seconds to wait for a frame.
+
+        Returns
+        -------
+        Optional[NDArray[np.uint8]]
+            The latest frame, valid until the next call, or None on timeout.
+        """
+        with self.__condition:
+            if not self.__condition.wait_for(lambda: self.__latest_index is not None, timeout):
+                return None
+
+            self.__reading_index = self.__latest_index
+            return self.__buffers[self.__reading_index]
+
+
 class CameraOpenCV(base_camera.BaseCameraDevice):
     """
     OpenCV implementation of the camera device.
 
     This class provides camera functionality using OpenCV's VideoCapture API.
+    Frames are read continuously on a background thread into preallocated
+    buffers, so run() returns the most recent frame without waiting on the camera.
     """
 
+    __slots__ = ("__frames", "__stop_event", "__thread", "__finalizer")
+
     __create_key = object()
 
     @classmethod
@@ -73,15 +171,21 @@ class CameraOpenCV(base_camera.BaseCameraDevice):
 
         camera.set(cv2.CAP_PROP_FRAME_WIDTH, width)
         camera.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        # Keep only the newest frame in the driver so run() does not return stale images
+        # Not all backends support this, so the result is ignored
+        camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
-        set_width = camera.get(cv2.CAP_PROP_FRAME_WIDTH)
-        set_height = camera.get(cv2.CAP_PROP_FRAME_HEIGHT)
-        if set_width != width or set_height != height:
+        # Some drivers report slightly different sizes from get(), so check a real frame
+        result, image = camera.read()
+        if not result or image.shape[:2] != (height, width):
+            camera.release()
             return False, None
 
-        return True, CameraOpenCV(cls.__create_key, camera)
+        return True, CameraOpenCV(cls.__create_key, camera, width, height)
 
-    def __init__(self, class_private_create_key: object, camera: cv2.VideoCapture) -> None:
+    def __init__(
+        self, class_private_create_key: object, camera: cv2.VideoCapture, width: int, height: int
+    ) -> None:
         """
         Private constructor, use create() method.
 
@@ -91,29 +195,114 @@ class CameraOpenCV(base_camera.BaseCameraDevice):
             Private key to prevent direct instantiation.
         camera : cv2.VideoCapture
             OpenCV VideoCapture object.
+        width : int
+            Width of the camera in pixels.
+        height : int
+            Height of the camera in pixels.
         """
         assert class_private_create_key is CameraOpenCV.__create_key, "Use create() method."
 
-        self.__camera = camera
+        self.__frames = LatestFrameBuffers(width, height)
+        self.__stop_event = threading.Event()
+
+        # The thread does not reference self, so the destructor can still run
+        self.__thread = threading.Thread(
+            target=CameraOpenCV.__capture_loop,
+            args=(camera, self.__frames, self.__stop_event),
+            daemon=True,
+        )
+        self.__thread.start()
+
+        # Releases the camera if close() is never called
+        self.__finalizer = weakref.finalize(
+            self, CameraOpenCV.__release, camera, self.__stop_event, self.__thread
+        )
+
+    def close(self) -> None:
+        """
+        Stop the capture thread and release hardware resources.
+        """
+        self.__finalizer()
 
-    def __del__(self) -> None:
+    @staticmethod
+    def __release(
+        camera: cv2.VideoCapture, stop_event: threading.Event, thread: threading.Thread
+    ) -> None:
         """
-        Destructor. Release hardware resources.
+        Stop the capture thread and release the camera.
+
+        Parameters
+        ----------
+        camera : cv2.VideoCapture
+            OpenCV VideoCapture object.
+        stop_event : threading.Event
+            Stops the capture thread.
+        thread : threading.Thread
+            The capture thread.
+        """
+        stop_event.set()
+        thread.join()
+        camera.release()
+
+    @staticmethod
+    def __capture_loop(
+        camera: cv2.VideoCapture, frames: LatestFrameBuffers, stop_event: threading.Event
+    ) -> None:
+        """
+        Read frames into the shared buffers until stopped.
+
+        Parameters
+        ----------
+        camera : cv2.VideoCapture
+            OpenCV VideoCapture object.
+        frames : LatestFrameBuffers
+            Buffers to read frames into.
+        stop_event : threading.Event
+            Set to stop the loop.
         """
-        self.__camera.release()
+        while not stop_event.is_set():
+            result, image_data = camera.read(frames.write_buffer())
+            if not result:
+                frames.publish(None)
+                # Retrying immediately would spin and keep taking the lock run() needs
+                stop_event.wait(READ_FAILURE_BACKOFF)
+                continue
+
+            frames.publish(image_data)
 
     def run(self) -> Tuple[Literal[True], NDArray[np.uint8]] | Tuple[Literal[False], None]:
         """
         Take a picture with OpenCV camera.
 
+        Returns the most recent frame from the capture thread, waiting up to
+        FRAME_TIMEOUT seconds if no frame is available yet. The image is a
+        reused buffer that stays valid until the next call, use run_copy() to
+        keep it longer.
+
         Returns
         -------
         tuple[Literal[True], NDArray[np.uint8]] | tuple[Literal[False], None]
             Success status and image array with shape (height, width, channels in BGR)
             if successful, (False, None) otherwise.
         """
-        result, image_data = self.__camera.read()
-        if not result:
+        image_data = self.__frames.acquire(FRAME_TIMEOUT)
+        if image_data is None:
             return False, None
 
         return True, image_data
+
+    def run_copy(self) -> Tuple[Literal[True], NDArray[np.uint8]] | Tuple[Literal[False], None]:
+        """
+        Take a picture with OpenCV camera, returning an image owned by the caller.
+
+        Returns
+        -------
+        tuple[Literal[True], NDArray[np.uint8]] | tuple[Literal[False], None]
+            Success status and image array with shape (height, width, channels in BGR)
+            if successful, (False, None) otherwise.
+        """
+        result, image_data = self.run()
+        if not result:
+            return False, None
+
+        return True, image_data.copy()
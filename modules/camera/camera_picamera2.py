@@ -1,5 +1,6 @@
 """Picamera2 implementation of the camera wrapper."""
 
+import weakref
 from typing import Optional, Tuple, Literal, Dict, Union
 
 import numpy as np
@@ -99,6 +100,8 @@ if picamera2 is None:
         typically on non-Raspberry Pi systems.
         """
 
+        __slots__ = ()
+
         @classmethod
         def create(
             cls, width: int, height: int, config: ConfigPiCamera2
@@ -138,6 +141,8 @@ else:
         for Raspberry Pi camera modules.
         """
 
+        __slots__ = ("__camera", "__config", "__buffer", "__stride", "__finalizer")
+
         __create_key = object()
 
         @classmethod
@@ -177,8 +182,11 @@ else:
                 camera.start()
                 controls = config.to_dict()
                 camera.set_controls(controls)
+                stride = camera.camera_configuration()["main"]["stride"]
 
-                return True, CameraPiCamera2(cls.__create_key, camera, config)
+                return True, CameraPiCamera2(
+                    cls.__create_key, camera, config, width, height, stride
+                )
             except RuntimeError:
                 return False, None
 
@@ -187,6 +195,9 @@ else:
             class_private_create_key: object,
             camera: picamera2.Picamera2,  # type: ignore
             config: ConfigPiCamera2,
+            width: int,
+            height: int,
+            stride: int,
         ) -> None:
             """
             Private constructor, use create() method.
@@ -199,22 +210,37 @@ else:
                 Picamera2 camera object.
             config : ConfigPiCamera2
                 Configuration for PiCamera2 camera.
+            width : int
+                Width of the camera in pixels.
+            height : int
+                Height of the camera in pixels.
+            stride : int
+                Length of a row of the main stream in bytes, including padding.
             """
             assert class_private_create_key is CameraPiCamera2.__create_key, "Use create() method."
 
             self.__camera = camera
             self.__config = config
+            # Reused by run() instead of allocating a new array per frame
+            self.__buffer = np.empty((height, width, 3), dtype=np.uint8)
+            self.__stride = stride
+
+            # Releases the camera if close() is never called
+            self.__finalizer = weakref.finalize(self, camera.close)
 
-        def __del__(self) -> None:
+        def close(self) -> None:
             """
-            Destructor. Release hardware resources.
+            Release hardware resources.
             """
-            self.__camera.close()
+            self.__finalizer()
 
         def run(self) -> Tuple[Literal[True], NDArray[np.uint8]] | Tuple[Literal[False], None]:
             """
             Take a picture with Picamera2 camera.
 
+            The frame is copied out of the capture request into a buffer that is
+            reused between calls, so the image is only valid until the next call.
+
             Returns
             -------
             tuple[Literal[True], NDArray[np.uint8]] | tuple[Literal[False], None]
@@ -222,8 +248,20 @@ else:
                 if successful, (False, None) otherwise.
             """
             try:
-                image_data = self.__camera.capture_array(wait=self.__config.timeout)
+                request = self.__camera.capture_request(wait=self.__config.timeout)
             except TimeoutError:
                 return False, None
 
-            return True, image_data
+            try:
+                # Strided view skips the row padding without an intermediate copy
+                image = np.ndarray(
+                    shape=self.__buffer.shape,
+                    dtype=np.uint8,
+                    buffer=request.make_buffer("main"),
+                    strides=(self.__stride, 3, 1),
+                )
+                self.__buffer[:] = image
+            finally:
+                request.release()
+
+            return True, self.__buffer
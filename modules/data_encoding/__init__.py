@@ -2,14 +2,24 @@
 Data encoding module exports.
 """
 
-from .message_encoding_decoding import encode_position_global, decode_position_global
-from .metadata_encoding_decoding import encode_metadata, decode_metadata
+from .message_encoding_decoding import (
+    encode_position_global,
+    encode_position_global_bytes,
+    encode_positions_bulk,
+    decode_bytes_to_position_global as decode_position_global,
+    decode_positions_bulk,
+)
+from .metadata_encoding_decoding import encode_metadata, encode_metadata_bytes, decode_metadata
 from .worker_enum import WorkerEnum
 
 __all__ = [
     "encode_position_global",
+    "encode_position_global_bytes",
+    "encode_positions_bulk",
     "decode_position_global",
+    "decode_positions_bulk",
     "encode_metadata",
+    "encode_metadata_bytes",
     "decode_metadata",
     "WorkerEnum",
 ]
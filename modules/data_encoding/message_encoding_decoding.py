@@ -3,22 +3,28 @@ Encoding and Decoding Global Positions
 Save first byte as char to represent which worker sent the message
 """
 
-import base64
+import binascii
 import struct
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from .. import position_global
 from . import worker_enum
 
 
 DATA_FORMAT = "=Bddd"  # 1 unsigned char + 3 doubles = 25 bytes
+# Precompiled so the format string is only parsed once
+DATA_STRUCT = struct.Struct(DATA_FORMAT)
+# Worker ID value to WorkerEnum member, a plain dict lookup instead of the Enum constructor
+# pylint: disable-next=protected-access
+WORKER_IDS = worker_enum.WorkerEnum._value2member_map_
 
 
-def encode_position_global(
+def encode_position_global_bytes(
     worker_id: worker_enum.WorkerEnum, global_position: position_global.PositionGlobal
 ) -> Tuple[bool, Optional[bytes]]:
     """
-    Encode PositionGlobal object into Bytes. Worker_ID to be encoded as the first byte of the message.
+    Encode PositionGlobal object into raw bytes, for binary-safe transports.
+    Worker_ID to be encoded as the first byte of the message.
 
     Parameters
     ----------
@@ -35,30 +41,95 @@ def encode_position_global(
         Returns (False, None) on encoding failure.
     """
     try:
-        if not isinstance(
-            worker_id, worker_enum.WorkerEnum
-        ):  # If worker ID is not in the Enum Class
-            return False, None
+        # A worker ID that is not in the Enum Class raises AttributeError on .value, handled below
 
         # Encode message using PositionGlobal's latitude, longitude, altitude, with the worker ID in the front
-        packed_coordinates = struct.pack(
-            DATA_FORMAT,
+        packed_coordinates = DATA_STRUCT.pack(
             worker_id.value,
             global_position.latitude,
             global_position.longitude,
             global_position.altitude,
         )
+    except (struct.error, AttributeError, ValueError):
+        return False, None
+
+    return True, packed_coordinates
+
+
+def encode_position_global(
+    worker_id: worker_enum.WorkerEnum, global_position: position_global.PositionGlobal
+) -> Tuple[bool, Optional[bytes]]:
+    """
+    Encode PositionGlobal object into base64 Bytes. Worker_ID to be encoded as the first byte of the message.
+
+    Parameters
+    ----------
+    worker_id : worker_enum.WorkerEnum
+        ID of the worker defined by its constant in WorkerEnum.
+    global_position : position_global.PositionGlobal
+        PositionGlobal object to encode.
+
+    Returns
+    -------
+    Tuple[bool, Optional[bytes]]
+        Success status and base64 encoded bytes containing latitude, longitude, altitude.
+        First byte depends on which worker is calling the function (its enum value).
+        Returns (False, None) on encoding failure.
+    """
+    result, packed_coordinates = encode_position_global_bytes(worker_id, global_position)
+    if not result:
+        return False, None
+
+    # Encode in base64 so it can be put into a string
+    return True, binascii.b2a_base64(packed_coordinates, newline=False)
+
+
+def encode_positions_bulk(
+    worker_id: worker_enum.WorkerEnum, global_positions: List[position_global.PositionGlobal]
+) -> Tuple[bool, Optional[bytes]]:
+    """
+    Encode multiple PositionGlobal objects into a single base64 Bytes.
+    Each position is packed the same way as encode_position_global, back to back.
+
+    Parameters
+    ----------
+    worker_id : worker_enum.WorkerEnum
+        ID of the worker defined by its constant in WorkerEnum.
+    global_positions : List[position_global.PositionGlobal]
+        PositionGlobal objects to encode.
 
-        # Encode in base64 so it can be put into a string
-        encoded_str = base64.b64encode(packed_coordinates)
+    Returns
+    -------
+    Tuple[bool, Optional[bytes]]
+        Success status and base64 encoded bytes containing every packed position.
+        Returns (False, None) on encoding failure or if there are no positions.
+    """
+    # The worker ID is stored per position, so an empty message would have none
+    if len(global_positions) == 0:
+        return False, None
+
+    # Pack everything into one buffer so base64 encoding is only done once
+    packed_positions = bytearray(len(global_positions) * DATA_STRUCT.size)
+    try:
+        worker_value = worker_id.value
+        for index, global_position in enumerate(global_positions):
+            DATA_STRUCT.pack_into(
+                packed_positions,
+                index * DATA_STRUCT.size,
+                worker_value,
+                global_position.latitude,
+                global_position.longitude,
+                global_position.altitude,
+            )
     except (struct.error, AttributeError, ValueError):
         return False, None
 
-    return True, encoded_str
+    return True, binascii.b2a_base64(packed_positions, newline=False)
 
 
 def decode_bytes_to_position_global(
     encoded_str: bytes,
+    encoded_is_base64: bool = True,
 ) -> Tuple[bool, Optional[worker_enum.WorkerEnum], Optional[position_global.PositionGlobal]]:
     """
     Decode bytes into a PositionGlobal object.
@@ -67,6 +138,9 @@ def decode_bytes_to_position_global(
     ----------
     encoded_str : bytes
         Encoded bytearray containing worker ID, latitude, longitude, altitude.
+    encoded_is_base64 : bool, optional
+        Whether encoded_str is base64 encoded, False for raw bytes from
+        encode_position_global_bytes. Default is True.
 
     Returns
     -------
@@ -77,19 +151,73 @@ def decode_bytes_to_position_global(
     # Unpack the byte sequence
     try:
         # Decode base64
-        encoded_global_position = base64.b64decode(encoded_str)
+        if encoded_is_base64:
+            encoded_global_position = binascii.a2b_base64(encoded_str)
+        else:
+            encoded_global_position = encoded_str
 
         # Ensure corect length
-        if len(encoded_global_position) != struct.calcsize(DATA_FORMAT):
+        if len(encoded_global_position) != DATA_STRUCT.size:
             return False, None, None
 
         # Decode position global
-        unpacked_data = struct.unpack(DATA_FORMAT, encoded_global_position)
-        worker_id = worker_enum.WorkerEnum(unpacked_data[0])
-        latitude, longitude, altitude = unpacked_data[1], unpacked_data[2], unpacked_data[3]
-    except struct.error:
+        worker_value, latitude, longitude, altitude = DATA_STRUCT.unpack(encoded_global_position)
+        worker_id = WORKER_IDS.get(worker_value)
+    except (struct.error, binascii.Error):
+        return False, None, None
+
+    # Unknown worker ID
+    if worker_id is None:
         return False, None, None
 
     # Create and return a PositionGlobal object
-    success, position = position_global.PositionGlobal.create(latitude, longitude, altitude)
-    return success, worker_id, position
+    # The sender already created a valid PositionGlobal, so skip create()
+    position = position_global.PositionGlobal.from_decoded(latitude, longitude, altitude)
+    return True, worker_id, position
+
+
+def decode_positions_bulk(
+    encoded_str: bytes,
+) -> Tuple[bool, Optional[worker_enum.WorkerEnum], Optional[List[position_global.PositionGlobal]]]:
+    """
+    Decode bytes from encode_positions_bulk into PositionGlobal objects.
+
+    Parameters
+    ----------
+    encoded_str : bytes
+        Base64 encoded bytes containing the packed positions.
+
+    Returns
+    -------
+    Tuple[bool, Optional[worker_enum.WorkerEnum], Optional[List[position_global.PositionGlobal]]]
+        Success status, WorkerEnum member corresponding to ID, and decoded PositionGlobal objects.
+        Returns (False, None, None) on decoding failure.
+    """
+    try:
+        encoded_global_positions = binascii.a2b_base64(encoded_str)
+    except binascii.Error:
+        return False, None, None
+
+    # Ensure a whole number of positions
+    if len(encoded_global_positions) % DATA_STRUCT.size != 0:
+        return False, None, None
+
+    worker_values = set()
+    global_positions = []
+    for worker_value, latitude, longitude, altitude in DATA_STRUCT.iter_unpack(
+        encoded_global_positions
+    ):
+        worker_values.add(worker_value)
+        global_positions.append(
+            position_global.PositionGlobal.from_decoded(latitude, longitude, altitude)
+        )
+
+    # Every position must come from the same known worker
+    if len(worker_values) != 1:
+        return False, None, None
+
+    worker_id = WORKER_IDS.get(worker_values.pop())
+    if worker_id is None:
+        return False, None, None
+
+    return True, worker_id, global_positions
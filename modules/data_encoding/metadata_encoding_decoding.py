@@ -3,7 +3,7 @@ Encoding and Decoding Metadata
 Save first byte as char to represent which worker sent the message
 """
 
-import base64
+import binascii
 import struct
 from typing import Optional, Tuple
 
@@ -11,13 +11,18 @@ from . import worker_enum
 
 
 DATA_FORMAT = "=Bi"  # 1 unsigned char + 1 int = 5 bytes
+# Precompiled so the format string is only parsed once
+DATA_STRUCT = struct.Struct(DATA_FORMAT)
+# Worker ID value to WorkerEnum member, a plain dict lookup instead of the Enum constructor
+# pylint: disable-next=protected-access
+WORKER_IDS = worker_enum.WorkerEnum._value2member_map_
 
 
-def encode_metadata(
+def encode_metadata_bytes(
     worker_id: worker_enum.WorkerEnum, number_of_messages: int
 ) -> Tuple[bool, Optional[bytes]]:
     """
-    Encode metadata into a C-style string for STATUSTEXT message.
+    Encode metadata into raw bytes, for binary-safe transports.
     Worker_ID to be encoded as the first byte of the message.
 
     Parameters
@@ -35,27 +40,51 @@ def encode_metadata(
         Returns (False, None) on encoding failure.
     """
     try:
-        # Ensure worker ID is in the WorkerEnum class
-        if not isinstance(worker_id, worker_enum.WorkerEnum):
-            return False, None
+        # A worker ID that is not in the Enum Class raises AttributeError on .value, handled below
 
         # Encode message using PositionGlobal's latitude, longitude, altitude, with the worker ID in the front
-        packed_metadata = struct.pack(
-            DATA_FORMAT,
+        packed_metadata = DATA_STRUCT.pack(
             worker_id.value,
             number_of_messages,
         )
-
-        # Encode in base64 so it can be put into a string
-        encoded_str = base64.b64encode(packed_metadata)
     except (struct.error, AttributeError, ValueError):
         return False, None
 
-    return True, encoded_str
+    return True, packed_metadata
+
+
+def encode_metadata(
+    worker_id: worker_enum.WorkerEnum, number_of_messages: int
+) -> Tuple[bool, Optional[bytes]]:
+    """
+    Encode metadata into a C-style string for STATUSTEXT message.
+    Worker_ID to be encoded as the first byte of the message.
+
+    Parameters
+    ----------
+    worker_id : worker_enum.WorkerEnum
+        ID of the worker defined by its constant in WorkerEnum.
+    number_of_messages : int
+        Number of messages intended to be sent.
+
+    Returns
+    -------
+    Tuple[bool, Optional[bytes]]
+        Success status and base64 encoded bytes containing number of messages.
+        First byte depends on which worker is calling the function (its enum value).
+        Returns (False, None) on encoding failure.
+    """
+    result, packed_metadata = encode_metadata_bytes(worker_id, number_of_messages)
+    if not result:
+        return False, None
+
+    # Encode in base64 so it can be put into a string
+    return True, binascii.b2a_base64(packed_metadata, newline=False)
 
 
 def decode_metadata(
     encoded_str: bytes,
+    encoded_is_base64: bool = True,
 ) -> Tuple[bool, Optional[worker_enum.WorkerEnum], Optional[int]]:
     """
     Decode bytes into metadata.
@@ -64,6 +93,9 @@ def decode_metadata(
     ----------
     encoded_str : bytes
         Encoded bytearray containing Worker message ID and number of messages sent.
+    encoded_is_base64 : bool, optional
+        Whether encoded_str is base64 encoded, False for raw bytes from
+        encode_metadata_bytes. Default is True.
 
     Returns
     -------
@@ -74,17 +106,23 @@ def decode_metadata(
     # Unpack the byte sequence
     try:
         # Decode base64
-        encoded_metadata = base64.b64decode(encoded_str)
+        if encoded_is_base64:
+            encoded_metadata = binascii.a2b_base64(encoded_str)
+        else:
+            encoded_metadata = encoded_str
 
         # Ensure correct length (note the null terminator gets automatically dropped by STATUSTEXT)
-        if len(encoded_metadata) != struct.calcsize(DATA_FORMAT):
+        if len(encoded_metadata) != DATA_STRUCT.size:
             return False, None, None
 
-        # unpack returns tuple (unsigned char,) so [0] is needed
-        unpacked_data = struct.unpack(DATA_FORMAT, encoded_metadata)
-        worker_id = worker_enum.WorkerEnum(unpacked_data[0])
-        number_of_messages = unpacked_data[1]
-    except struct.error:
+        # unpack returns tuple (unsigned char, int)
+        worker_value, number_of_messages = DATA_STRUCT.unpack(encoded_metadata)
+        worker_id = WORKER_IDS.get(worker_value)
+    except (struct.error, binascii.Error):
+        return False, None, None
+
+    # Unknown worker ID
+    if worker_id is None:
         return False, None, None
 
     # Create and return a PositionGlobal object
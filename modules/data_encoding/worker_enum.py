@@ -11,13 +11,15 @@ Usage:
     For example, `Worker_Enum.COMMUNICATIONS_WORKER.value` will return the integer ID `3`.
 """
 
-from enum import Enum
+from enum import IntEnum
 
 
-class WorkerEnum(Enum):
+class WorkerEnum(IntEnum):
     """
     Enum class for worker classes. Acts as message ID.
 
+    Members are ints, so they can be used directly wherever an integer ID is expected.
+
     Attributes
     ----------
     CLUSTER_ESTIMATION_WORKER : int
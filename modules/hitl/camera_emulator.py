@@ -5,16 +5,25 @@ Requires OBS Virtual Camera on Windows or
 v4l2loopback for Linux to be installed to work
 """
 
+import multiprocessing.synchronize
 import os
+import queue
+import threading
 import time
+import weakref
 from typing import Optional, Tuple
 import pyvirtualcam
 import cv2
+import numpy as np
 from numpy.typing import NDArray
 
 IMAGE_SIZE = (720, 480)
-IMAGE_FORMATS = (".png", ".jpeg", "jpg")
+IMAGE_FORMATS = (".png", ".jpeg", ".jpg")
 CAMERA_FPS = 30
+# Frames that can be queued for the sender thread, absorbs jitter in periodic() calls
+SEND_QUEUE_SIZE = 3
+# Maximum time in seconds the sender thread waits for a queued frame
+SEND_TIMEOUT = 1.0
 
 
 class CameraEmulator:
@@ -42,7 +51,8 @@ class CameraEmulator:
         Returns
         -------
         Tuple[bool, Optional[CameraEmulator]]
-            A tuple containing success status and CameraEmulator instance (or None if failed).
+            A tuple containing success status and CameraEmulator instance (or None if failed,
+            including when no image in the directory could be loaded).
         """
 
         if not isinstance(images_path, str):
@@ -61,6 +71,11 @@ class CameraEmulator:
             print("Time between images must be positive")
             return False, None
 
+        frames = CameraEmulator.__load_frames(images_path)
+        if len(frames) == 0:
+            print("No images could be loaded from images path")
+            return False, None
+
         try:
             virtual_camera_instance = pyvirtualcam.Camera(IMAGE_SIZE[0], IMAGE_SIZE[1], CAMERA_FPS)
 
@@ -77,13 +92,13 @@ class CameraEmulator:
             return False, None
 
         return True, CameraEmulator(
-            cls.__create_key, images_path, time_between_images, virtual_camera_instance
+            cls.__create_key, frames, time_between_images, virtual_camera_instance
         )
 
     def __init__(
         self,
         class_private_create_key: object,
-        images_path: str,
+        frames: NDArray[np.uint8],
         time_between_images: float,
         virtual_camera: pyvirtualcam.Camera,
     ) -> None:
@@ -94,8 +109,8 @@ class CameraEmulator:
         ----------
         class_private_create_key : object
             Private key to ensure constructor is only called via create().
-        images_path : str
-            Path to the directory containing images.
+        frames : NDArray[np.uint8]
+            Decoded RGB images of IMAGE_SIZE, shape (N, height, width, 3) with N > 0.
         time_between_images : float
             Time in seconds between image changes.
         virtual_camera : pyvirtualcam.Camera
@@ -103,38 +118,137 @@ class CameraEmulator:
         """
         assert class_private_create_key is CameraEmulator.__create_key, "Use create() method"
 
-        self.__image_folder_path = images_path
         self.__virtual_camera = virtual_camera
-        self.__image_paths: list[str] = []
+        # All images decoded once, resized and converted to RGB, shape (N, height, width, 3)
+        self.__frames = frames
         self.__current_frame: Optional[NDArray] = None
         self.__image_index = 0
-        self.__next_image_time = time.time() + time_between_images
-        self.__time_between_images = time_between_images
+        # pyvirtualcam paces frames at CAMERA_FPS, so count frames instead of reading the clock
+        self.__frames_per_image = max(1, int(round(time_between_images * CAMERA_FPS)))
+        self.__frame_count = 0
 
-        self.__get_images()
         self.update_current_image()
 
+        # Frames are never modified after loading, so the queue holds references, not copies
+        self.__send_queue: queue.Queue[NDArray[np.uint8]] = queue.Queue(SEND_QUEUE_SIZE)
+        self.__stop_event = threading.Event()
+
+        # The thread does not reference self, so the destructor can still run
+        self.__sender_thread = threading.Thread(
+            target=CameraEmulator.__send_loop,
+            args=(virtual_camera, self.__send_queue, self.__stop_event),
+            name="HITL-Camera-Sender",
+            daemon=True,
+        )
+        self.__sender_thread.start()
+
+        # Stops the sender thread if close() is never called
+        self.__finalizer = weakref.finalize(
+            self,
+            CameraEmulator.__stop_sender,
+            virtual_camera,
+            self.__stop_event,
+            self.__sender_thread,
+        )
+
+    def close(self) -> None:
+        """
+        Stop the sender thread and close the virtual camera.
+        """
+        self.__finalizer()
+
+    @staticmethod
+    def __send_loop(
+        virtual_camera: pyvirtualcam.Camera,
+        send_queue: "queue.Queue[NDArray[np.uint8]]",
+        stop_event: threading.Event,
+    ) -> None:
+        """
+        Send queued frames to the virtual camera at the target FPS until stopped.
+
+        Parameters
+        ----------
+        virtual_camera : pyvirtualcam.Camera
+            The virtual camera instance.
+        send_queue : queue.Queue[NDArray[np.uint8]]
+            Frames queued by periodic().
+        stop_event : threading.Event
+            Set to stop the loop.
+        """
+        while not stop_event.is_set():
+            try:
+                frame = send_queue.get(timeout=SEND_TIMEOUT)
+            except queue.Empty:
+                continue
+
+            try:
+                virtual_camera.send(frame)
+                virtual_camera.sleep_until_next_frame()
+
+            # Required for catching library exceptions
+            # pylint: disable-next=broad-exception-caught
+            except Exception as e:
+                print("Cannot send frame" + str(e))
+
+    @staticmethod
+    def __stop_sender(
+        virtual_camera: pyvirtualcam.Camera,
+        stop_event: threading.Event,
+        sender_thread: threading.Thread,
+    ) -> None:
+        """
+        Stop the sender thread, wait for it to finish and close the virtual camera.
+
+        Parameters
+        ----------
+        virtual_camera : pyvirtualcam.Camera
+            The virtual camera instance.
+        stop_event : threading.Event
+            Stop event of the sender thread.
+        sender_thread : threading.Thread
+            The sender thread.
+        """
+        stop_event.set()
+        if sender_thread is not threading.current_thread():
+            sender_thread.join()
+
+        try:
+            virtual_camera.close()
+
+        # Required for catching library exceptions
+        # pylint: disable-next=broad-exception-caught
+        except Exception as e:
+            print("Cannot close virtual camera: " + str(e))
+
     def periodic(self) -> None:
         """
         Execute periodic camera emulation tasks.
 
-        Sends frames to the virtual camera and cycles through images
-        at the specified interval.
+        Queues frames for the sender thread and cycles through images
+        at the specified interval. Never blocks, so it can share a scheduler
+        thread with other emulators: if the sender thread has fallen behind,
+        the oldest queued frame is dropped to make room.
         """
         try:
-            # Send frame and pace to target FPS
-            self.send_frame()
-            self.sleep_until_next_frame()
+            try:
+                self.__send_queue.put_nowait(self.__current_frame)
+            except queue.Full:
+                try:
+                    self.__send_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+                # This is the only producer, so there is room after removing a frame
+                self.__send_queue.put_nowait(self.__current_frame)
 
-            now = time.time()
-            if now >= self.__next_image_time:
-                # Cycle image once per second
+            self.__frame_count += 1
+            if self.__frame_count % self.__frames_per_image == 0:
+                # Cycle image once every time_between_images
                 try:
                     self.next_image()
                     self.update_current_image()
                 except Exception as exc:  # pylint: disable=broad-except
                     print(f"HITL camera image update error: {exc}")
-                self.__next_image_time = now + self.__time_between_images
         except Exception as exc:  # pylint: disable=broad-except
             print(f"HITL camera periodic error: {exc}")
 
@@ -164,27 +278,10 @@ class CameraEmulator:
         """
         Set current image to the image specified by the current image index.
 
-        Reads the image from disk, converts it to RGB format, and updates
-        the current frame. Skips images that fail to load.
+        Images are decoded when the emulator is created, so this only selects
+        the already converted RGB frame.
         """
-
-        has_image = False
-        loop_count = 0
-
-        # loop to skip image if read fails
-        while not has_image and loop_count < len(self.__image_paths):
-            try:
-                image_path = self.__image_paths[self.__image_index]
-                image = cv2.imread(image_path)
-                self.__current_frame = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                has_image = True
-
-            # Required for catching library exceptions
-            # pylint: disable-next=broad-exception-caught
-            except Exception as e:
-                print("Could not read image: " + image_path + " Error: " + str(e))
-                self.next_image()
-                loop_count += 1
+        self.__current_frame = self.__frames[self.__image_index]
 
     def next_image(self) -> None:
         """
@@ -193,22 +290,99 @@ class CameraEmulator:
         Wraps around to the beginning when reaching the end of the image list.
         """
 
-        self.__image_index = (self.__image_index + 1) % len(self.__image_paths)
+        self.__image_index = (self.__image_index + 1) % len(self.__frames)
 
-    def __get_images(self) -> None:
+    @staticmethod
+    def __load_frames(images_path: str) -> NDArray[np.uint8]:
         """
-        Populate the images array with paths of all images in the folder.
+        Load all images in the folder into one frames array.
+
+        Scans the image folder for files with valid image formats in name order, then decodes
+        each one, resizes it to IMAGE_SIZE and converts it to RGB format into a
+        single preallocated array. Skips images that fail to load.
+
+        Parameters
+        ----------
+        images_path : str
+            Path to the directory containing images.
 
-        Scans the image folder for files with valid image formats and stores
-        their paths in the internal image paths list.
+        Returns
+        -------
+        NDArray[np.uint8]
+            The loaded frames, shape (N, height, width, 3), N is 0 if none could be loaded.
         """
+        image_paths = []
         try:
-            for image in os.listdir(self.__image_folder_path):
-                if image.endswith(IMAGE_FORMATS):
-                    path = os.path.join(self.__image_folder_path, image)
-                    self.__image_paths.append(path)
+            # Sorted so images are always shown in the same order
+            with os.scandir(images_path) as entries:
+                image_paths = sorted(
+                    entry.path
+                    for entry in entries
+                    if entry.is_file() and entry.name.lower().endswith(IMAGE_FORMATS)
+                )
 
         # Required for catching library exceptions
         # pylint: disable-next=broad-exception-caught
         except Exception as e:
             print("Error reading images: " + str(e))
+
+        frames = np.empty((len(image_paths), IMAGE_SIZE[1], IMAGE_SIZE[0], 3), np.uint8)
+        frame_count = 0
+        for image_path in image_paths:
+            try:
+                image = cv2.imread(image_path)
+                # Resize straight into the frame slot and swap channels in place,
+                # so no intermediate full-frame buffer is allocated
+                frame = frames[frame_count]
+                cv2.resize(image, IMAGE_SIZE, dst=frame)
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+                frame_count += 1
+
+            # Required for catching library exceptions
+            # pylint: disable-next=broad-exception-caught
+            except Exception as e:
+                print("Could not read image: " + image_path + " Error: " + str(e))
+
+        return frames[:frame_count]
+
+
+def run_camera_process(
+    images_path: str, period: float, stop_event: multiprocessing.synchronize.Event
+) -> None:
+    """
+    Create a camera emulator and run it until stopped.
+
+    Intended as the target of a separate process, so the camera emulator
+    does not share the GIL with the rest of HITL.
+
+    Parameters
+    ----------
+    images_path : str
+        Path to the directory containing images for the camera emulator.
+    period : float
+        Time in seconds between camera emulator updates.
+    stop_event : multiprocessing.synchronize.Event
+        Set to stop the camera emulator.
+    """
+    result, camera_emulator = CameraEmulator.create(images_path)
+    if not result:
+        print("HITL camera process could not create camera emulator")
+        return
+
+    # Get Pylance to stop complaining
+    assert camera_emulator is not None
+
+    # Scheduled against deadlines like HITL.run(), so time spent in periodic() does not
+    # lower the frame rate
+    deadline = time.monotonic()
+    while not stop_event.is_set():
+        now = time.monotonic()
+        if now < deadline:
+            stop_event.wait(deadline - now)
+            continue
+
+        camera_emulator.periodic()
+        # Keep a fixed rate, but do not try to catch up on missed periods
+        deadline = max(deadline + period, now)
+
+    camera_emulator.close()
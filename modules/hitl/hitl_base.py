@@ -2,13 +2,26 @@
 Setup for HITL modules.
 """
 
+import heapq
+import multiprocessing
+import multiprocessing.context
+import multiprocessing.synchronize
+import os
 import time
 from threading import Event, Thread
-from typing import Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 from modules.hitl.position_emulator import PositionEmulator
-from modules.hitl.camera_emulator import CameraEmulator
+from modules.hitl.camera_emulator import CAMERA_FPS, CameraEmulator, run_camera_process
 from ..mavlink import dronekit
 
+# Seconds between position emulator updates (50 Hz)
+POSITION_PERIOD = 0.02
+# Seconds between camera emulator updates, matches the rate its sender thread drains frames
+CAMERA_PERIOD = 1 / CAMERA_FPS
+# Seconds to back off after an emulator error
+ERROR_BACKOFF = 0.1
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
 
 class HITL:
     """
@@ -27,6 +40,9 @@ class HITL:
         position_module: bool,
         camera_module: bool,
         images_path: Optional[str] = None,
+        position_period: float = POSITION_PERIOD,
+        camera_period: float = CAMERA_PERIOD,
+        use_process_camera: bool = False,
     ) -> Tuple[bool, Optional["HITL"]]:
         """
         Factory method to create a HITL instance.
@@ -43,6 +59,13 @@ class HITL:
             Boolean indicating if the camera module is enabled.
         images_path : Optional[str], optional
             Path to the images directory for the camera emulator, by default None.
+        position_period : float, optional
+            Time in seconds between position emulator updates, by default POSITION_PERIOD.
+        camera_period : float, optional
+            Time in seconds between camera emulator updates, by default CAMERA_PERIOD.
+        use_process_camera : bool, optional
+            Run the camera emulator in its own process so it does not compete with
+            the position emulator for the GIL, by default False.
 
         Returns
         -------
@@ -53,14 +76,19 @@ class HITL:
             return False, None
 
         if not hitl_enabled:
-            return True, HITL(cls.__create_key, drone, None, None)
+            return True, HITL(cls.__create_key, drone, None, None, position_period, camera_period)
 
         if position_module:
             result, position_emulator = PositionEmulator.create(drone)
             if not result:
                 return False, None
 
-        if camera_module:
+        # The camera emulator is created in its own process when it is started
+        if camera_module and use_process_camera:
+            if not isinstance(images_path, str) or not os.path.isdir(images_path):
+                print("Images path is not a valid directory")
+                return False, None
+        elif camera_module:
             result, camera_emulator = CameraEmulator.create(images_path)
             if not result:
                 return False, None
@@ -69,7 +97,10 @@ class HITL:
             cls.__create_key,
             drone,
             position_emulator if position_module else None,
-            camera_emulator if camera_module else None,
+            camera_emulator if camera_module and not use_process_camera else None,
+            position_period,
+            camera_period,
+            images_path if camera_module and use_process_camera else None,
         )
 
         return True, hitl
@@ -80,6 +111,9 @@ class HITL:
         drone: dronekit.Vehicle,
         position_emulator: Optional[PositionEmulator] = None,
         camera_emulator: Optional[CameraEmulator] = None,
+        position_period: float = POSITION_PERIOD,
+        camera_period: float = CAMERA_PERIOD,
+        camera_process_images_path: Optional[str] = None,
     ) -> None:
         """
         Private constructor, use create() method.
@@ -94,59 +128,127 @@ class HITL:
             Position emulator instance, by default None.
         camera_emulator : Optional[CameraEmulator], optional
             Camera emulator instance, by default None.
+        position_period : float, optional
+            Time in seconds between position emulator updates, by default POSITION_PERIOD.
+        camera_period : float, optional
+            Time in seconds between camera emulator updates, by default CAMERA_PERIOD.
+        camera_process_images_path : Optional[str], optional
+            Path to the images directory for a camera emulator run in its own process,
+            by default None for no camera emulator process.
         """
         assert class_private_create_key is HITL.__create_key, "Use create() method"
 
         self.drone = drone
         self.position_emulator = position_emulator
         self.camera_emulator = camera_emulator
+        self._position_period = position_period
+        self._camera_period = camera_period
+
+        self._camera_process_images_path = camera_process_images_path
 
         self._stop_event: Optional[Event] = None
-        self._threads: list[Thread] = []
+        self._thread: Optional[Thread] = None
+        self._camera_process_stop_event: Optional[multiprocessing.synchronize.Event] = None
+        self._camera_process: Optional[multiprocessing.context.SpawnProcess] = None
 
     def start(self) -> None:
         """
-        Start HITL module threads.
+        Start HITL module thread and process.
 
-        Creates and starts daemon threads for position and camera emulation
-        if their respective emulators are enabled.
+        Creates and starts a single daemon thread that runs position and camera
+        emulation if their respective emulators are enabled, and a process for
+        camera emulation if it runs in its own process.
         """
         if self._stop_event is not None:
             return
 
-        self._stop_event = Event()
-        self._threads = []
+        # Entries are (next deadline, tie breaker, period, name, periodic function)
+        # Deadlines and periods are integer monotonic nanoseconds, so clock adjustments
+        # and float rounding do not shift the schedule
+        tasks: List[Tuple[int, int, int, str, Callable[[], None]]] = []
+        now = time.monotonic_ns()
 
         if self.position_emulator is not None:
-            t = Thread(target=self.run_position, name="HITL-Position", daemon=True)
-            self._threads.append(t)
-            t.start()
+            tasks.append(
+                (
+                    now,
+                    len(tasks),
+                    round(self._position_period * NANOSECONDS_PER_SECOND),
+                    "position",
+                    self.position_emulator.periodic,
+                )
+            )
 
         if self.camera_emulator is not None:
-            t = Thread(target=self.run_camera, name="HITL-Camera", daemon=True)
-            self._threads.append(t)
-            t.start()
+            tasks.append(
+                (
+                    now,
+                    len(tasks),
+                    round(self._camera_period * NANOSECONDS_PER_SECOND),
+                    "camera",
+                    self.camera_emulator.periodic,
+                )
+            )
+
+        if len(tasks) == 0 and self._camera_process_images_path is None:
+            return
+
+        self._stop_event = Event()
+
+        if len(tasks) > 0:
+            self._thread = Thread(target=self.run, args=(tasks,), name="HITL", daemon=True)
+            self._thread.start()
+
+        if self._camera_process_images_path is not None:
+            # Spawn instead of fork, forking copies the DroneKit threads' locks in whatever state
+            context = multiprocessing.get_context("spawn")
+            self._camera_process_stop_event = context.Event()
+            self._camera_process = context.Process(
+                target=run_camera_process,
+                args=(
+                    self._camera_process_images_path,
+                    self._camera_period,
+                    self._camera_process_stop_event,
+                ),
+                name="HITL-Camera",
+                daemon=True,
+            )
+            self._camera_process.start()
 
     def shutdown(self, join_timeout: Optional[float] = 5.0) -> None:
         """
-        Signal threads to stop and join them.
+        Signal threads and processes to stop and join them.
 
         Parameters
         ----------
         join_timeout : Optional[float], optional
-            Timeout in seconds for joining threads, by default 5.0.
+            Timeout in seconds for joining threads and processes, by default 5.0.
         """
         if self._stop_event is None:
             return
 
         self._stop_event.set()
+        if self._camera_process_stop_event is not None:
+            self._camera_process_stop_event.set()
+
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=join_timeout)
 
-        for t in self._threads:
-            if t.is_alive():
-                t.join(timeout=join_timeout)
+        # Stops the sender thread and frees the virtual camera once periodic() is no longer called
+        if self.camera_emulator is not None and (
+            self._thread is None or not self._thread.is_alive()
+        ):
+            self.camera_emulator.close()
 
-        self._threads.clear()
+        if self._camera_process is not None:
+            self._camera_process.join(timeout=join_timeout)
+            if self._camera_process.is_alive():
+                self._camera_process.terminate()
+
+        self._thread = None
         self._stop_event = None
+        self._camera_process = None
+        self._camera_process_stop_event = None
 
     def __del__(self) -> None:
         """
@@ -160,34 +262,39 @@ class HITL:
         except Exception:  # pylint: disable=broad-except
             pass
 
-    def run_position(self) -> None:
+    def run(self, tasks: List[Tuple[int, int, int, str, Callable[[], None]]]) -> None:
         """
-        Run the position emulator periodic function in a loop.
+        Run the emulator periodic functions, each once every period.
 
         This method is intended to be executed in a separate thread.
-        It continuously calls the position emulator's periodic() method
+        Runs whichever task is due next, waiting on the stop event in between,
         until the stop event is set.
-        """
-        assert self._stop_event is not None
-        while not self._stop_event.is_set():
-            try:
-                self.position_emulator.periodic()
-            except Exception as exc:  # pylint: disable=broad-except
-                print(f"HITL position thread error: {exc}")
-                time.sleep(0.1)
 
-    def run_camera(self) -> None:
+        Parameters
+        ----------
+        tasks : List[Tuple[int, int, int, str, Callable[[], None]]]
+            Tasks as (first deadline, tie breaker, period, name, periodic function),
+            with the deadline and period in monotonic nanoseconds.
         """
-        Run the camera emulator periodic function in a loop.
+        # Local reference, shutdown() clears the attribute
+        stop_event = self._stop_event
+        heapq.heapify(tasks)
+
+        while not stop_event.is_set():
+            deadline, tie_breaker, period, name, periodic = tasks[0]
+
+            now = time.monotonic_ns()
+            if now < deadline:
+                # Waiting on the event lets shutdown() wake the thread immediately
+                stop_event.wait((deadline - now) / NANOSECONDS_PER_SECOND)
+                continue
 
-        This method is intended to be executed in a separate thread.
-        It continuously calls the camera emulator's periodic() method
-        until the stop event is set.
-        """
-        assert self._stop_event is not None
-        while not self._stop_event.is_set():
             try:
-                self.camera_emulator.periodic()
+                periodic()
+                # Keep a fixed rate, but do not try to catch up on missed periods
+                next_deadline = max(deadline + period, now)
             except Exception as exc:  # pylint: disable=broad-except
-                print(f"HITL camera thread error: {exc}")
-                time.sleep(0.1)
+                print(f"HITL {name} error: {exc}")
+                next_deadline = now + round(ERROR_BACKOFF * NANOSECONDS_PER_SECOND)
+
+            heapq.heapreplace(tasks, (next_deadline, tie_breaker, period, name, periodic))
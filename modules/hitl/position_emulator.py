@@ -2,10 +2,27 @@
 Emulates position and attitude to Pixhawk.
 """
 
+import struct
+import threading
 import time
-from typing import Tuple
+from typing import Optional, Tuple
+
+from pymavlink import mavutil
+
 from ..mavlink import dronekit
 
+# Attribute of the MAVLink object holding the lock shared with its send()
+SEND_LOCK_ATTRIBUTE = "hitl_send_lock"
+
+# Byte layout of a packed MAVLink2 GPS_INPUT message, for updating a packed message in place
+MAVLINK2_SEQ_OFFSET = 4
+MAVLINK2_HEADER_SIZE = 10
+MAVLINK2_CRC_STRUCT = struct.Struct("<H")
+GPS_INPUT_TIME_OFFSET = MAVLINK2_HEADER_SIZE
+GPS_INPUT_TIME_STRUCT = struct.Struct("<Q")  # time_usec
+GPS_INPUT_POSITION_OFFSET = MAVLINK2_HEADER_SIZE + 12
+GPS_INPUT_POSITION_STRUCT = struct.Struct("<iif")  # lat, lon, alt
+
 
 class PositionEmulator:
     """
@@ -15,9 +32,7 @@ class PositionEmulator:
     __create_key = object()
 
     @classmethod
-    def create(
-        cls, drone: dronekit.Vehicle
-    ) -> Tuple[bool, "PositionEmulator"]:
+    def create(cls, drone: dronekit.Vehicle) -> Tuple[bool, "PositionEmulator"]:
         """
         Set up position emulator.
 
@@ -51,6 +66,88 @@ class PositionEmulator:
 
         self.drone = drone
 
+        # Bound once, DroneKit attribute lookups are not free on every tick
+        # pylint: disable-next=protected-access
+        self.__mav = drone._master.mav
+        self.__send_lock = PositionEmulator.__shared_send_lock(self.__mav)
+        self.__encode_gps_input = drone.message_factory.gps_input_encode
+
+        # Position in degrees and meters, and the same position scaled to GPS_INPUT units,
+        # so the scaling is only redone when the position changes
+        self.__scaled_position_source = (0.0, 0.0, 0.0)
+        self.__scaled_position = (0, 0, 0)  # lat (1e7 deg), lon (1e7 deg), alt (mm)
+
+        # First packed GPS_INPUT message, later messages only rewrite the fields that change
+        self.__gps_input_packet: Optional[bytearray] = None
+        self.__gps_input_crc_extra = 0
+
+        # Boot time of the last target message, repeated targets are not unpacked again
+        self.__target_time_boot_ms: Optional[int] = None
+
+        # DroneKit calls this from its receive thread for every target, instead of polling for it
+        drone.add_message_listener("POSITION_TARGET_GLOBAL_INT", self.__on_position_target)
+
+    @staticmethod
+    def __shared_send_lock(mav: mavutil.mavlink.MAVLink) -> threading.Lock:
+        """
+        Get the lock held while a message is stamped with the sequence number and written.
+
+        The MAVLink object's send() is wrapped to take the same lock, so messages sent by
+        DroneKit's heartbeat and other send_mavlink() callers do not race with injected
+        positions on the sequence number.
+
+        Parameters
+        ----------
+        mav : mavutil.mavlink.MAVLink
+            The MAVLink object of the DroneKit connection.
+
+        Returns
+        -------
+        threading.Lock
+            The lock, created and installed on first use.
+        """
+        lock = getattr(mav, SEND_LOCK_ATTRIBUTE, None)
+        if lock is not None:
+            return lock
+
+        lock = threading.Lock()
+        send = mav.send
+
+        def locked_send(
+            message: mavutil.mavlink.MAVLink_message, force_mavlink1: bool = False
+        ) -> None:
+            with lock:
+                send(message, force_mavlink1)
+
+        mav.send = locked_send
+        setattr(mav, SEND_LOCK_ATTRIBUTE, lock)
+        return lock
+
+    def __on_position_target(
+        self,
+        _vehicle: dronekit.Vehicle,
+        _name: str,
+        message: mavutil.mavlink.MAVLink_position_target_global_int_message,
+    ) -> None:
+        """
+        Store the target position from an Ardupilot POSITION_TARGET_GLOBAL_INT message.
+
+        Parameters
+        ----------
+        _vehicle : dronekit.Vehicle
+            The vehicle that received the message.
+        _name : str
+            Name of the message type.
+        message : mavutil.mavlink.MAVLink_position_target_global_int_message
+            The POSITION_TARGET_GLOBAL_INT message.
+        """
+        if message.time_boot_ms == self.__target_time_boot_ms:
+            return
+
+        self.__target_time_boot_ms = message.time_boot_ms
+        # Assigning a whole tuple is atomic, so periodic() never sees a partial update
+        self.target_position = (message.lat_int / 1e7, message.lon_int / 1e7, message.alt)
+
     def set_target_position(self, latitude: float, longitude: float, altitude: float) -> None:
         """
         Set the target position manually.
@@ -72,43 +169,23 @@ class PositionEmulator:
         """
         Get the target position from the Ardupilot target.
 
+        The target is updated as messages arrive, falling back to the
+        manually set target if none has been received.
+
         Returns
         -------
         Tuple[float, float, float]
             Target position as (latitude, longitude, altitude) in degrees and meters.
         """
-        # pylint: disable=protected-access
-        position_target = None
-        try:
-            position_target = self.drone._master.recv_match(
-                type="POSITION_TARGET_GLOBAL_INT", blocking=False
-            )
-        except Exception as exc:  # pylint: disable=broad-except
-            print(f"HITL get_target_position recv_match error: {exc}")
-            position_target = None
-        # pylint: enable=protected-access
-
-        if position_target:
-            latitude = position_target.lat_int / 1e7
-            longitude = position_target.lon_int / 1e7
-            altitude = position_target.alt
-            return (latitude, longitude, altitude)
-
-        # Optionally log if no message received
-        # print("No POSITION_TARGET_GLOBAL_INT message received.")
-
         return self.target_position
 
     def periodic(self) -> None:
         """
         Execute periodic position emulation tasks.
 
-        Updates the target position from Ardupilot and injects the current
-        position into the flight controller.
+        Injects the target position into the flight controller. The target is kept
+        up to date by the POSITION_TARGET_GLOBAL_INT listener.
         """
-
-        self.target_position = self.get_target_position()
-
         self.inject_position(
             self.target_position[0], self.target_position[1], self.target_position[2]
         )
@@ -122,6 +199,10 @@ class PositionEmulator:
         """
         Simulate GPS coordinates by injecting the desired position of the drone.
 
+        After the first message, the packed message is reused and only the time, position,
+        sequence number and checksum are rewritten. It is written through the same writer as
+        the MAVLink object's send(), which DroneKit routes to its output thread.
+
         Parameters
         ----------
         latitude : float, optional
@@ -131,16 +212,53 @@ class PositionEmulator:
         altitude : float, optional
             Altitude in meters, by default 373.0.
         """
-        values = [
-            int(time.time() * 1e6),  # time_usec
+        position = (latitude, longitude, altitude)
+        if position != self.__scaled_position_source:
+            self.__scaled_position_source = position
+            self.__scaled_position = (
+                int(latitude * 1e7),
+                int(longitude * 1e7),
+                int(altitude * 1000),
+            )
+        latitude_e7, longitude_e7, altitude_mm = self.__scaled_position
+        time_usec = time.time_ns() // 1000
+
+        mav = self.__mav
+        packet = self.__gps_input_packet
+        if packet is not None:
+            GPS_INPUT_TIME_STRUCT.pack_into(packet, GPS_INPUT_TIME_OFFSET, time_usec)
+            GPS_INPUT_POSITION_STRUCT.pack_into(
+                packet, GPS_INPUT_POSITION_OFFSET, latitude_e7, longitude_e7, altitude_mm
+            )
+            crc_offset = len(packet) - MAVLINK2_CRC_STRUCT.size
+
+            with self.__send_lock:
+                packet[MAVLINK2_SEQ_OFFSET] = mav.seq
+
+                # Checksum covers everything after the start marker, then the CRC extra byte
+                crc = mavutil.mavlink.x25crc(packet[1:crc_offset])
+                crc.accumulate(bytes((self.__gps_input_crc_extra,)))
+                MAVLINK2_CRC_STRUCT.pack_into(packet, crc_offset, crc.crc)
+
+                # Copied, DroneKit queues the message and the packet is rewritten next tick
+                mav.file.write(bytes(packet))
+                # Same bookkeeping as send()
+                mav.seq = (mav.seq + 1) % 256
+                mav.total_packets_sent += 1
+                mav.total_bytes_sent += len(packet)
+
+            return
+
+        values = (
+            time_usec,  # time_usec
             0,  # gps_id
             0b111111,  # ignore_flags (all fields valid)
             0,  # time_week_ms
             0,  # time_week
             3,  # fix_type (3D fix)
-            int(latitude * 1e7),  # lat
-            int(longitude * 1e7),  # lon
-            int(altitude * 1000),  # alt (mm)
+            latitude_e7,  # lat
+            longitude_e7,  # lon
+            altitude_mm,  # alt (mm)
             100,  # hdop (x100)
             100,  # vdop (x100)
             0,  # vn (cm/s)
@@ -151,7 +269,15 @@ class PositionEmulator:
             100,  # vert_accuracy (cm)
             10,  # satellites_visible
             0,  # yaw (deg*100)
-        ]
-        gps_input_msg = self.drone.message_factory.gps_input_encode(*values)
-        self.drone.send_mavlink(gps_input_msg)
-        self.drone.flush()
+        )
+        gps_input_msg = self.__encode_gps_input(*values)
+
+        mav.send(gps_input_msg)
+        packed = gps_input_msg.get_msgbuf()
+        # Only the unsigned MAVLink2 layout is known, otherwise keep packing every message
+        if (
+            packed[0] == mavutil.mavlink.PROTOCOL_MARKER_V2
+            and not packed[2] & mavutil.mavlink.MAVLINK_IFLAG_SIGNED
+        ):
+            self.__gps_input_packet = bytearray(packed)
+            self.__gps_input_crc_extra = gps_input_msg.crc_extra
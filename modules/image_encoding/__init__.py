@@ -2,7 +2,7 @@
 Image encoding module exports.
 """
 
-from .encoder import encode
+from .encoder import encode, encode_batch
 from .decoder import decode
 
-__all__ = ["encode", "decode"]
+__all__ = ["encode", "encode_batch", "decode"]
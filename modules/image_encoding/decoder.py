@@ -8,6 +8,15 @@ import numpy as np
 from numpy.typing import NDArray
 from PIL import Image
 
+# libjpeg-turbo is optional, Pillow is used if it or its Python wrapper is not installed
+try:
+    import turbojpeg
+
+    TURBO_JPEG = turbojpeg.TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    turbojpeg = None
+    TURBO_JPEG = None
+
 
 def decode(data: bytes) -> NDArray[np.uint8]:
     """
@@ -23,6 +32,13 @@ def decode(data: bytes) -> NDArray[np.uint8]:
     NDArray[np.uint8]
         NDArray in RGB format. Shape is (Height, Width, 3).
     """
+    if TURBO_JPEG is not None:
+        return TURBO_JPEG.decode(data, pixel_format=turbojpeg.TJPF_RGB)
+
     image = Image.open(io.BytesIO(data), formats=["JPEG"])
+    # Grayscale and CMYK JPEGs are converted so the output always matches the libjpeg-turbo path
+    if image.mode != "RGB":
+        image = image.convert("RGB")
 
-    return np.asarray(image)
+    width, height = image.size
+    return np.frombuffer(image.tobytes(), dtype=np.uint8).reshape(height, width, 3)
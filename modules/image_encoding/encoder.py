@@ -2,15 +2,37 @@
 Decodes a numpy array and returns a JPEG encoded image
 """
 
+import concurrent.futures
 import io
+import os
+import threading
+from typing import List
 
 import numpy as np
 from numpy.typing import NDArray
 from PIL import Image
 
+# libjpeg-turbo is optional, Pillow is used if it or its Python wrapper is not installed
+try:
+    import turbojpeg
+
+    TURBO_JPEG = turbojpeg.TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    turbojpeg = None
+    TURBO_JPEG = None
+
 
 QUALITY = 80  # Quality of JPEG encoding to use (0-100)
 
+# Output buffer for Pillow, kept per thread and reused between calls
+thread_local = threading.local()
+
+# Both libjpeg-turbo and Pillow release the GIL while compressing, so images encode in parallel
+# Threads are only started once encode_batch() is first used
+ENCODE_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 2), thread_name_prefix="jpeg-encode"
+)
+
 
 def encode(image_array: NDArray[np.uint8]) -> bytes:
     """
@@ -26,9 +48,45 @@ def encode(image_array: NDArray[np.uint8]) -> bytes:
     bytes
         Bytes which form the JPEG encoded image.
     """
+    if TURBO_JPEG is not None:
+        # A single ctypes call into libjpeg-turbo, which releases the GIL while compressing
+        # 4:2:0 chroma subsampling matches Pillow's default at this quality
+        # The integer fast DCT is noticeably faster with negligible loss at this quality
+        return TURBO_JPEG.encode(
+            np.ascontiguousarray(image_array),
+            quality=QUALITY,
+            pixel_format=turbojpeg.TJPF_RGB,
+            jpeg_subsample=turbojpeg.TJSAMP_420,
+            flags=turbojpeg.TJFLAG_FASTDCT,
+        )
+
     img = Image.fromarray(image_array, mode="RGB")
 
-    buffer = io.BytesIO()
-    img.save(buffer, format="JPEG", quality=QUALITY)
+    buffer = getattr(thread_local, "buffer", None)
+    if buffer is None:
+        buffer = io.BytesIO()
+        thread_local.buffer = buffer
+
+    buffer.seek(0)
+    buffer.truncate(0)
+    # Single pass, optimized Huffman tables need a second pass over the image
+    img.save(buffer, format="JPEG", quality=QUALITY, optimize=False)
 
     return buffer.getvalue()
+
+
+def encode_batch(image_arrays: List[NDArray[np.uint8]]) -> List[bytes]:
+    """
+    Encodes multiple images in numpy array form into bytes of JPEGs, in parallel.
+
+    Parameters
+    ----------
+    image_arrays : List[NDArray[np.uint8]]
+        Numpy arrays of RGB images, each with shape (Height, Width, 3).
+
+    Returns
+    -------
+    List[bytes]
+        Bytes which form each JPEG encoded image, in the same order as the input.
+    """
+    return list(ENCODE_POOL.map(encode, image_arrays))
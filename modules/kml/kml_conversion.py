@@ -4,25 +4,97 @@ Module to convert ground locations list to kml document.
 
 import pathlib
 import time
-from typing import List, Optional, Tuple, Union
-
-import simplekml
-import simplekml.base
+from typing import Iterator, List, Tuple, Union
 
 from .. import location_global
 from .. import position_global_relative_altitude
 
 
+# Documents with at least this many positions are written as they are formatted
+# instead of being assembled in memory first
+STREAM_MIN_POSITIONS = 100
+# Write buffer size in bytes for streamed documents
+STREAM_BUFFER_SIZE = 1 << 20
+
+# Same layout and IDs as the documents previously generated with simplekml
+KML_PROLOG = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:gx="http://www.google.com/kml/ext/2.2">\n'
+    '    <Document id="1">\n'
+)
+KML_PLACEMARK = (
+    '        <Placemark id="{placemark_id}">\n'
+    "            <name>{name}</name>\n"
+    '            <Point id="{point_id}">\n'
+    "                <coordinates>{longitude},{latitude},{altitude}</coordinates>\n"
+    "            </Point>\n"
+    "        </Placemark>\n"
+)
+KML_EPILOG = "    </Document>\n</kml>\n"
+# Escapes names in a single pass, apostrophes are left as is like simplekml did
+KML_NAME_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+def __kml_file_path(document_name_prefix: str, save_directory: pathlib.Path) -> pathlib.Path:
+    """
+    Path of a new KML file in the directory.
+
+    Parameters
+    ----------
+    document_name_prefix : str
+        Name prefix for the KML file (without timestamp or .kml extension).
+    save_directory : pathlib.Path
+        Parent directory to save the KML file to.
+
+    Returns
+    -------
+    pathlib.Path
+        Path to the KML file, named with the prefix and the current time.
+    """
+    current_time = time.time_ns() // 1_000_000_000
+    return pathlib.Path(save_directory, f"{document_name_prefix}_{current_time}.kml")
+
+
+def __kml_placemarks(
+    named_positions: List[position_global_relative_altitude.NamedPositionGlobalRelativeAltitude],
+) -> Iterator[str]:
+    """
+    Format each position as a KML placemark.
+
+    Parameters
+    ----------
+    named_positions : List[position_global_relative_altitude.NamedPositionGlobalRelativeAltitude]
+        Positions with names.
+
+    Returns
+    -------
+    Iterator[str]
+        Placemark elements in the same order as the positions.
+    """
+    for i, named_position in enumerate(named_positions):
+        # Coordinates are in the order: longitude, latitude, optional height
+        yield KML_PLACEMARK.format(
+            placemark_id=2 * i + 3,
+            point_id=2 * i + 2,
+            name=str(named_position.name).translate(KML_NAME_ESCAPES),
+            longitude=named_position.longitude,
+            latitude=named_position.latitude,
+            altitude=named_position.relative_altitude,
+        )
+
+
 def __save_kml_file(
-    kml: simplekml.Kml, document_name_prefix: str, save_directory: pathlib.Path
+    named_positions: List[position_global_relative_altitude.NamedPositionGlobalRelativeAltitude],
+    document_name_prefix: str,
+    save_directory: pathlib.Path,
 ) -> Union[Tuple[bool, pathlib.Path], Tuple[bool, None]]:
     """
-    Save KML to the directory.
+    Save positions as a KML file in the directory, written in a single call.
 
     Parameters
     ----------
-    kml : simplekml.Kml
-        KML document to save.
+    named_positions : List[position_global_relative_altitude.NamedPositionGlobalRelativeAltitude]
+        Positions with names.
     document_name_prefix : str
         Name prefix for the KML file (without timestamp or .kml extension).
     save_directory : pathlib.Path
@@ -33,14 +105,55 @@ def __save_kml_file(
     Tuple[bool, pathlib.Path] or Tuple[bool, None]
         Success status and path to the KML file if successful, None otherwise.
     """
-    current_time = time.time()
-    kml_file_path = pathlib.Path(save_directory, f"{document_name_prefix}_{int(current_time)}.kml")
+    kml_file_path = __kml_file_path(document_name_prefix, save_directory)
+
+    fragments = [KML_PROLOG]
+    fragments.extend(__kml_placemarks(named_positions))
+    fragments.append(KML_EPILOG)
 
     try:
-        kml.save(str(kml_file_path))
-    # Required for catching library exceptions
-    # pylint: disable-next=broad-exception-caught
-    except Exception as exception:
+        kml_file_path.write_bytes("".join(fragments).encode("utf-8"))
+    except OSError as exception:
+        print(f"Error while saving KML file: {exception}")
+        return False, None
+
+    return True, kml_file_path
+
+
+def __stream_kml_file(
+    named_positions: List[position_global_relative_altitude.NamedPositionGlobalRelativeAltitude],
+    document_name_prefix: str,
+    save_directory: pathlib.Path,
+) -> Union[Tuple[bool, pathlib.Path], Tuple[bool, None]]:
+    """
+    Write positions to a KML file in the directory one placemark at a time.
+
+    Produces the same document as __save_kml_file without building it in memory first.
+
+    Parameters
+    ----------
+    named_positions : List[position_global_relative_altitude.NamedPositionGlobalRelativeAltitude]
+        Positions with names.
+    document_name_prefix : str
+        Name prefix for the KML file (without timestamp or .kml extension).
+    save_directory : pathlib.Path
+        Parent directory to save the KML file to.
+
+    Returns
+    -------
+    Tuple[bool, pathlib.Path] or Tuple[bool, None]
+        Success status and path to the KML file if successful, None otherwise.
+    """
+    kml_file_path = __kml_file_path(document_name_prefix, save_directory)
+
+    try:
+        with open(
+            kml_file_path, "w", encoding="utf-8", newline="\n", buffering=STREAM_BUFFER_SIZE
+        ) as file:
+            file.write(KML_PROLOG)
+            file.writelines(__kml_placemarks(named_positions))
+            file.write(KML_EPILOG)
+    except OSError as exception:
         print(f"Error while saving KML file: {exception}")
         return False, None
 
@@ -72,22 +185,11 @@ def named_positions_to_kml(
     if len(named_positions) == 0:
         return False, None
 
-    # Force KML ID reset for determinism
-    # pylint: disable-next=protected-access
-    simplekml.base.Kmlable._globalid = 0
-
-    kml = simplekml.Kml()
+    # Large documents are not assembled in memory
+    if len(named_positions) >= STREAM_MIN_POSITIONS:
+        return __stream_kml_file(named_positions, document_name_prefix, save_directory)
 
-    for named_position in named_positions:
-        name = named_position.name
-        latitude = named_position.latitude
-        longitude = named_position.longitude
-        relative_altitude = named_position.relative_altitude
-
-        # Coordinates are in the order: longitude, latitude, optional height
-        kml.newpoint(name=name, coords=[(longitude, latitude, relative_altitude)])
-
-    return __save_kml_file(kml, document_name_prefix, save_directory)
+    return __save_kml_file(named_positions, document_name_prefix, save_directory)
 
 
 def positions_to_kml(
@@ -112,20 +214,12 @@ def positions_to_kml(
     Tuple[bool, pathlib.Path] or Tuple[bool, None]
         Success status and path to the KML file if successful, None otherwise.
     """
-    named_positions = []
-    for i, position in enumerate(positions):
-        result, named_position = (
-            position_global_relative_altitude.NamedPositionGlobalRelativeAltitude.create(
-                str(i), position.latitude, position.longitude, position.relative_altitude
-            )
+    named_positions = [
+        position_global_relative_altitude.NamedPositionGlobalRelativeAltitude.from_values(
+            str(i), position.latitude, position.longitude, position.relative_altitude
         )
-        if not result:
-            return False, None
-
-        # Get Pylance to stop complaining
-        assert named_position is not None
-
-        named_positions.append(named_position)
+        for i, position in enumerate(positions)
+    ]
 
     return named_positions_to_kml(named_positions, document_name_prefix, save_directory)
 
@@ -152,20 +246,12 @@ def named_locations_to_kml(
     Tuple[bool, pathlib.Path] or Tuple[bool, None]
         Success status and path to the KML file if successful, None otherwise.
     """
-    named_positions = []
-    for named_location in named_locations:
-        result, named_position = (
-            position_global_relative_altitude.NamedPositionGlobalRelativeAltitude.create(
-                named_location.name, named_location.latitude, named_location.longitude, 0.0
-            )
+    named_positions = [
+        position_global_relative_altitude.NamedPositionGlobalRelativeAltitude.from_values(
+            named_location.name, named_location.latitude, named_location.longitude, 0.0
         )
-        if not result:
-            return False, None
-
-        # Get Pylance to stop complaining
-        assert named_position is not None
-
-        named_positions.append(named_position)
+        for named_location in named_locations
+    ]
 
     return named_positions_to_kml(named_positions, document_name_prefix, save_directory)
 
@@ -192,19 +278,11 @@ def locations_to_kml(
     Tuple[bool, pathlib.Path] or Tuple[bool, None]
         Success status and path to the KML file if successful, None otherwise.
     """
-    named_positions = []
-    for i, location in enumerate(locations):
-        result, named_position = (
-            position_global_relative_altitude.NamedPositionGlobalRelativeAltitude.create(
-                str(i), location.latitude, location.longitude, 0.0
-            )
+    named_positions = [
+        position_global_relative_altitude.NamedPositionGlobalRelativeAltitude.from_values(
+            str(i), location.latitude, location.longitude, 0.0
         )
-        if not result:
-            return False, None
-
-        # Get Pylance to stop complaining
-        assert named_position is not None
-
-        named_positions.append(named_position)
+        for i, location in enumerate(locations)
+    ]
 
     return named_positions_to_kml(named_positions, document_name_prefix, save_directory)
@@ -12,6 +12,9 @@ class LocationGlobal:
     WGS 84 following ISO 6709 (latitude before longitude).
     """
 
+    # Many instances are created for missions and KML documents, so no per-instance __dict__
+    __slots__ = ("latitude", "longitude")
+
     __create_key = object()
 
     @classmethod
@@ -81,6 +84,8 @@ class NamedLocationGlobal(LocationGlobal):
     Named LocationGlobal.
     """
 
+    __slots__ = ("name",)
+
     __create_key = object()
 
     @classmethod
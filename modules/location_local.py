@@ -12,6 +12,9 @@ class LocationLocal:
     Location in NED system relative to home position, with down = 0.0 .
     """
 
+    # Many instances are created for missions and KML documents, so no per-instance __dict__
+    __slots__ = ("north", "east")
+
     __create_key = object()
 
     @classmethod
@@ -79,6 +82,8 @@ class NamedLocationLocal(LocationLocal):
     Named LocationLocal.
     """
 
+    __slots__ = ("name",)
+
     __create_key = object()
 
     @classmethod
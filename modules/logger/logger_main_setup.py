@@ -47,21 +47,26 @@ def setup_main_logger(
         return False, None, None
 
     # Create logging directory
+    # Names must stay parseable with the datetime format (Logger finds the latest run by it),
+    # so collisions move forward a second rather than taking a suffix
     start_time = datetime.datetime.now()
-    success = False
+    logging_path = None
     for i in range(0, max_attempts):
-        offset = datetime.timedelta(seconds=i)
-        logging_path = pathlib.Path(
-            log_directory_path, (start_time + offset).strftime(log_path_format)
-        )
-        if not logging_path.exists():
-            success = True
-            break
+        # Collisions are rare, only they pay for the offset
+        attempt_time = start_time if i == 0 else start_time + datetime.timedelta(seconds=i)
+        candidate_path = pathlib.Path(log_directory_path, attempt_time.strftime(log_path_format))
+        # Check and create in one step
+        try:
+            candidate_path.mkdir(exist_ok=False, parents=True)
+        except FileExistsError:
+            continue
 
-    if not success:
-        print("ERROR: Could not create new log directory")
+        logging_path = candidate_path
+        break
 
-    logging_path.mkdir(exist_ok=False, parents=True)
+    if logging_path is None:
+        print("ERROR: Could not create new log directory")
+        return False, None, None
 
     # Setup logger
     result, main_logger = logger.Logger.create(main_logger_name, enable_log_to_file)
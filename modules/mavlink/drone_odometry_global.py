@@ -24,6 +24,9 @@ class DroneOdometryGlobal:
     Wrapper for position, orientation, and flight mode.
     """
 
+    # Created at telemetry rate, so no per-instance __dict__
+    __slots__ = ("position", "orientation", "flight_mode")
+
     __create_key = object()
 
     @classmethod
@@ -51,19 +54,41 @@ class DroneOdometryGlobal:
             A tuple containing success status and DroneOdometryGlobal instance.
             Returns (False, None) if any parameter is None.
         """
-        if drone_position is None:
-            return False, None
-
-        if drone_orientation is None:
-            return False, None
-
-        if flight_mode is None:
+        if drone_position is None or drone_orientation is None or flight_mode is None:
             return False, None
 
         return True, DroneOdometryGlobal(
             cls.__create_key, drone_position, drone_orientation, flight_mode
         )
 
+    @classmethod
+    def create_unchecked(
+        cls,
+        drone_position: position_global.PositionGlobal,
+        drone_orientation: orientation.Orientation,
+        flight_mode: FlightMode,
+    ) -> "DroneOdometryGlobal":
+        """
+        Create a DroneOdometryGlobal instance from values the caller already checked.
+
+        Skips create() and its success status.
+
+        Parameters
+        ----------
+        drone_position : position_global.PositionGlobal
+            The drone's global position.
+        drone_orientation : orientation.Orientation
+            The drone's orientation.
+        flight_mode : FlightMode
+            The drone's current flight mode.
+
+        Returns
+        -------
+        DroneOdometryGlobal
+            The created DroneOdometryGlobal object.
+        """
+        return DroneOdometryGlobal(cls.__create_key, drone_position, drone_orientation, flight_mode)
+
     def __init__(
         self,
         class_private_create_key: object,
@@ -84,10 +109,24 @@ class DroneOdometryGlobal:
         """
         To string.
         """
-        return f"{self.__class__}: Position: {self.position}, orientation: {self.orientation}, flight mode: {self.flight_mode.name}"
+        return "".join(
+            (
+                STR_PREFIX,
+                str(self.position),
+                ", orientation: ",
+                str(self.orientation),
+                ", flight mode: ",
+                FLIGHT_MODE_NAMES[self.flight_mode],
+            )
+        )
 
     def __repr__(self) -> str:
         """
         For collections (e.g. list).
         """
         return str(self)
+
+
+# Constant parts of DroneOdometryGlobal.__str__, odometry is logged at telemetry rate
+STR_PREFIX = f"{DroneOdometryGlobal}: Position: "
+FLIGHT_MODE_NAMES = {mode: mode.name for mode in FlightMode}
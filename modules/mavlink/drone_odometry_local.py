@@ -13,6 +13,9 @@ class DroneOdometryLocal:
     Wrapper for position and orientation.
     """
 
+    # Created at telemetry rate, so no per-instance __dict__
+    __slots__ = ("position", "orientation")
+
     __create_key = object()
 
     @classmethod
@@ -37,14 +40,36 @@ class DroneOdometryLocal:
             A tuple containing success status and DroneOdometryLocal instance.
             Returns (False, None) if any parameter is None.
         """
-        if drone_position is None:
-            return False, None
-
-        if drone_orientation is None:
+        if drone_position is None or drone_orientation is None:
             return False, None
 
         return True, DroneOdometryLocal(cls.__create_key, drone_position, drone_orientation)
 
+    @classmethod
+    def create_unchecked(
+        cls,
+        drone_position: position_local.PositionLocal,
+        drone_orientation: orientation.Orientation,
+    ) -> "DroneOdometryLocal":
+        """
+        Create a DroneOdometryLocal instance from values the caller already checked.
+
+        Skips create() and its success status.
+
+        Parameters
+        ----------
+        drone_position : position_local.PositionLocal
+            The drone's local position.
+        drone_orientation : orientation.Orientation
+            The drone's orientation.
+
+        Returns
+        -------
+        DroneOdometryLocal
+            The created DroneOdometryLocal object.
+        """
+        return DroneOdometryLocal(cls.__create_key, drone_position, drone_orientation)
+
     def __init__(
         self,
         class_private_create_key: object,
@@ -425,8 +425,8 @@ class FlightController:
             A tuple containing success status and home position.
             Returns (False, None) if home position cannot be retrieved within timeout.
         """
-        start_time = time.time()
-        while self.drone.home_location is None and time.time() - start_time < timeout:
+        start_time = time.monotonic()
+        while self.drone.home_location is None and time.monotonic() - start_time < timeout:
             commands = self.drone.commands
             commands.download()
             commands.wait_ready()
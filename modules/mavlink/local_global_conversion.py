@@ -2,8 +2,11 @@
 Conversion between local and global space.
 """
 
-from typing import Optional, Tuple
+import functools
+import math
+from typing import Literal, Optional, Tuple, Union
 
+import numpy as np
 import pymap3d as pm
 
 from . import drone_odometry_global
@@ -12,6 +15,396 @@ from .. import location_global
 from .. import location_local
 from .. import position_global
 from .. import position_local
+from .. import position_local_array
+
+
+# WGS 84 ellipsoid, same values as pymap3d
+WGS84_SEMIMAJOR_AXIS = 6378137.0
+WGS84_SEMIMINOR_AXIS = 6356752.31424518
+WGS84_ECCENTRICITY_SQUARED = 1.0 - (WGS84_SEMIMINOR_AXIS / WGS84_SEMIMAJOR_AXIS) ** 2
+WGS84_POLAR_SCALE = 1.0 - WGS84_ECCENTRICITY_SQUARED  # (b / a) ** 2
+
+# Number of distinct home positions to keep frames for
+HOME_FRAME_CACHE_SIZE = 8
+
+# Default type of local arrays returned by the batch conversions
+LOCAL_FLOAT_DTYPE = np.float64
+
+# LocalFrameTracker recomputes exactly after this many linearized updates
+TRACKER_RESYNC_INTERVAL = 50
+# Largest latitude/longitude step from the last exact point that is linearized (about 100 m)
+TRACKER_MAX_DELTA_DEGREES = 1e-3
+
+
+class HomeFrame:
+    """
+    North-East-Down frame at a home position, precomputed for repeated conversions.
+    """
+
+    __create_key = object()
+
+    @classmethod
+    def create(
+        cls, home_position: position_global.PositionGlobal
+    ) -> Tuple[Literal[True], "HomeFrame"]:
+        """
+        Create a HomeFrame instance.
+
+        Parameters
+        ----------
+        home_position : position_global.PositionGlobal
+            The home position in global coordinates.
+
+        Returns
+        -------
+        Tuple[Literal[True], HomeFrame]
+            Success status and the created HomeFrame object.
+        """
+        return True, HomeFrame(
+            cls.__create_key,
+            home_position.latitude,
+            home_position.longitude,
+            home_position.altitude,
+        )
+
+    def __init__(
+        self, class_private_create_key: object, latitude: float, longitude: float, altitude: float
+    ) -> None:
+        """
+        Private constructor, use create() method.
+
+        Parameters
+        ----------
+        class_private_create_key : object
+            Private key to prevent direct instantiation.
+        latitude : float
+            Home latitude in decimal degrees.
+        longitude : float
+            Home longitude in decimal degrees.
+        altitude : float
+            Home altitude in metres.
+        """
+        assert class_private_create_key is HomeFrame.__create_key, "Use create() method"
+
+        latitude_radians = math.radians(latitude)
+        longitude_radians = math.radians(longitude)
+        self.sin_latitude = math.sin(latitude_radians)
+        self.cos_latitude = math.cos(latitude_radians)
+        self.sin_longitude = math.sin(longitude_radians)
+        self.cos_longitude = math.cos(longitude_radians)
+
+        self.origin_x, self.origin_y, self.origin_z = self.__geodetic_to_ecef(
+            self.sin_latitude,
+            self.cos_latitude,
+            self.sin_longitude,
+            self.cos_longitude,
+            altitude,
+        )
+
+    @staticmethod
+    def __geodetic_to_ecef(
+        sin_latitude: Union[float, np.ndarray],
+        cos_latitude: Union[float, np.ndarray],
+        sin_longitude: Union[float, np.ndarray],
+        cos_longitude: Union[float, np.ndarray],
+        altitude: Union[float, np.ndarray],
+    ) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray], Union[float, np.ndarray]]:
+        """
+        Closed form WGS 84 geodetic to Earth-centred Earth-fixed coordinates.
+        """
+        # Radius of curvature in the prime vertical
+        # Operators rather than NumPy functions, so plain floats stay plain floats
+        prime_vertical_radius = (
+            WGS84_SEMIMAJOR_AXIS
+            * (1.0 - WGS84_ECCENTRICITY_SQUARED * sin_latitude * sin_latitude) ** -0.5
+        )
+        horizontal = (prime_vertical_radius + altitude) * cos_latitude
+
+        return (
+            horizontal * cos_longitude,
+            horizontal * sin_longitude,
+            (prime_vertical_radius * WGS84_POLAR_SCALE + altitude) * sin_latitude,
+        )
+
+    def geodetic_to_ned(
+        self,
+        latitude: Union[float, np.ndarray],
+        longitude: Union[float, np.ndarray],
+        altitude: Union[float, np.ndarray],
+    ) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray], Union[float, np.ndarray]]:
+        """
+        Global coordinates to North-East-Down relative to the home position.
+
+        Accepts scalars or arrays of the same shape.
+
+        Parameters
+        ----------
+        latitude : Union[float, np.ndarray]
+            Decimal degrees.
+        longitude : Union[float, np.ndarray]
+            Decimal degrees.
+        altitude : Union[float, np.ndarray]
+            Metres, same reference as the home altitude.
+
+        Returns
+        -------
+        Tuple[Union[float, np.ndarray], Union[float, np.ndarray], Union[float, np.ndarray]]
+            North, east, down in metres.
+        """
+        latitude_radians = np.radians(latitude)
+        longitude_radians = np.radians(longitude)
+        x, y, z = self.__geodetic_to_ecef(
+            np.sin(latitude_radians),
+            np.cos(latitude_radians),
+            np.sin(longitude_radians),
+            np.cos(longitude_radians),
+            altitude,
+        )
+
+        return self.ecef_offset_to_ned(x - self.origin_x, y - self.origin_y, z - self.origin_z)
+
+    def geodetic_to_ned_scalar(
+        self, latitude: float, longitude: float, altitude: float
+    ) -> Tuple[float, float, float]:
+        """
+        Global coordinates to North-East-Down relative to the home position, for a single point.
+
+        Same as geodetic_to_ned() but with the math module, which is much faster than NumPy
+        on Python floats.
+
+        Parameters
+        ----------
+        latitude : float
+            Decimal degrees.
+        longitude : float
+            Decimal degrees.
+        altitude : float
+            Metres, same reference as the home altitude.
+
+        Returns
+        -------
+        Tuple[float, float, float]
+            North, east, down in metres.
+        """
+        # Same math as __geodetic_to_ecef() and ecef_offset_to_ned(), inlined as this is the
+        # per-sample path and the two method calls cost about as much as the arithmetic
+        latitude_radians = math.radians(latitude)
+        longitude_radians = math.radians(longitude)
+        sin_latitude = math.sin(latitude_radians)
+        cos_latitude = math.cos(latitude_radians)
+
+        prime_vertical_radius = WGS84_SEMIMAJOR_AXIS / math.sqrt(
+            1.0 - WGS84_ECCENTRICITY_SQUARED * sin_latitude * sin_latitude
+        )
+        horizontal = (prime_vertical_radius + altitude) * cos_latitude
+        delta_x = horizontal * math.cos(longitude_radians) - self.origin_x
+        delta_y = horizontal * math.sin(longitude_radians) - self.origin_y
+        delta_z = (
+            prime_vertical_radius * WGS84_POLAR_SCALE + altitude
+        ) * sin_latitude - self.origin_z
+
+        horizontal = self.cos_longitude * delta_x + self.sin_longitude * delta_y
+        return (
+            -self.sin_latitude * horizontal + self.cos_latitude * delta_z,
+            -self.sin_longitude * delta_x + self.cos_longitude * delta_y,
+            -(self.cos_latitude * horizontal + self.sin_latitude * delta_z),
+        )
+
+    def ecef_offset_to_ned(
+        self,
+        delta_x: Union[float, np.ndarray],
+        delta_y: Union[float, np.ndarray],
+        delta_z: Union[float, np.ndarray],
+    ) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray], Union[float, np.ndarray]]:
+        """
+        Rotates an Earth-centred Earth-fixed vector into the North-East-Down frame.
+
+        Parameters
+        ----------
+        delta_x : Union[float, np.ndarray]
+            ECEF x component in metres.
+        delta_y : Union[float, np.ndarray]
+            ECEF y component in metres.
+        delta_z : Union[float, np.ndarray]
+            ECEF z component in metres.
+
+        Returns
+        -------
+        Tuple[Union[float, np.ndarray], Union[float, np.ndarray], Union[float, np.ndarray]]
+            North, east, down in metres.
+        """
+        horizontal = self.cos_longitude * delta_x + self.sin_longitude * delta_y
+        north = -self.sin_latitude * horizontal + self.cos_latitude * delta_z
+        east = -self.sin_longitude * delta_x + self.cos_longitude * delta_y
+        down = -(self.cos_latitude * horizontal + self.sin_latitude * delta_z)
+
+        return north, east, down
+
+
+@functools.lru_cache(maxsize=HOME_FRAME_CACHE_SIZE)
+def __home_frame(latitude: float, longitude: float, altitude: float) -> HomeFrame:
+    """
+    Cached HomeFrame for the home position with these values.
+    """
+    result, home_position = position_global.PositionGlobal.create(latitude, longitude, altitude)
+    assert result
+
+    _, home_frame = HomeFrame.create(home_position)
+
+    return home_frame
+
+
+class LocalFrameTracker:
+    """
+    Converts a stream of nearby global positions to local, reusing the last exact conversion.
+
+    Each exact conversion anchors a linearization: later positions are converted by adding
+    the Jacobian times the latitude/longitude/altitude step to the anchor's local position,
+    which needs no trigonometry. The error is second order in the step (millimetres at 100 m),
+    and does not accumulate as every update is relative to the anchor.
+    """
+
+    __create_key = object()
+
+    @classmethod
+    def create(
+        cls,
+        home_position: position_global.PositionGlobal,
+        resync_interval: int = TRACKER_RESYNC_INTERVAL,
+    ) -> Tuple[bool, Optional["LocalFrameTracker"]]:
+        """
+        Create a LocalFrameTracker instance.
+
+        Parameters
+        ----------
+        home_position : position_global.PositionGlobal
+            The home position in global coordinates.
+        resync_interval : int, optional
+            Linearized updates between exact conversions, by default TRACKER_RESYNC_INTERVAL.
+
+        Returns
+        -------
+        Tuple[bool, Optional[LocalFrameTracker]]
+            Success status and the created LocalFrameTracker object.
+            Returns (False, None) if resync_interval is negative.
+        """
+        if resync_interval < 0:
+            return False, None
+
+        _, home_frame = HomeFrame.create(home_position)
+
+        return True, LocalFrameTracker(cls.__create_key, home_frame, resync_interval)
+
+    def __init__(
+        self, class_private_create_key: object, home_frame: HomeFrame, resync_interval: int
+    ) -> None:
+        """
+        Private constructor, use create() method.
+        """
+        assert class_private_create_key is LocalFrameTracker.__create_key, "Use create() method"
+
+        self.__home_frame = home_frame
+        self.__resync_interval = resync_interval
+        self.__updates_since_resync = 0
+
+        # Anchor, set by the first update
+        self.__anchor: Optional[Tuple[float, float, float]] = None
+        self.__anchor_ned = (0.0, 0.0, 0.0)
+        # Rows of the Jacobian from (latitude, longitude, altitude) steps to NED steps
+        self.__jacobian = ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+
+    def __resync(self, latitude: float, longitude: float, altitude: float) -> None:
+        """
+        Exact conversion, and re-linearization around this position.
+        """
+        self.__anchor = (latitude, longitude, altitude)
+        self.__anchor_ned = self.__home_frame.geodetic_to_ned_scalar(latitude, longitude, altitude)
+        self.__updates_since_resync = 0
+
+        latitude_radians = math.radians(latitude)
+        longitude_radians = math.radians(longitude)
+        sin_latitude = math.sin(latitude_radians)
+        cos_latitude = math.cos(latitude_radians)
+        sin_longitude = math.sin(longitude_radians)
+        cos_longitude = math.cos(longitude_radians)
+
+        # Prime vertical and meridian radii of curvature
+        denominator = 1.0 - WGS84_ECCENTRICITY_SQUARED * sin_latitude * sin_latitude
+        prime_vertical_radius = WGS84_SEMIMAJOR_AXIS / math.sqrt(denominator)
+        meridian_radius = prime_vertical_radius * WGS84_POLAR_SCALE / denominator
+
+        # ECEF derivatives per degree of latitude and longitude, and per metre of altitude
+        latitude_scale = math.radians(meridian_radius + altitude)
+        longitude_scale = math.radians((prime_vertical_radius + altitude) * cos_latitude)
+        columns = (
+            self.__home_frame.ecef_offset_to_ned(
+                -latitude_scale * sin_latitude * cos_longitude,
+                -latitude_scale * sin_latitude * sin_longitude,
+                latitude_scale * cos_latitude,
+            ),
+            self.__home_frame.ecef_offset_to_ned(
+                -longitude_scale * sin_longitude, longitude_scale * cos_longitude, 0.0
+            ),
+            self.__home_frame.ecef_offset_to_ned(
+                cos_latitude * cos_longitude, cos_latitude * sin_longitude, sin_latitude
+            ),
+        )
+        self.__jacobian = tuple(zip(*columns))
+
+    def update(
+        self, global_position: position_global.PositionGlobal
+    ) -> Tuple[bool, Optional[position_local.PositionLocal]]:
+        """
+        Global coordinates to local coordinates for the next position in the stream.
+
+        Parameters
+        ----------
+        global_position : position_global.PositionGlobal
+            The global position to convert.
+
+        Returns
+        -------
+        Tuple[bool, Optional[position_local.PositionLocal]]
+            A tuple containing success status and local position.
+        """
+        latitude = global_position.latitude
+        longitude = global_position.longitude
+        altitude = global_position.altitude
+
+        if self.__anchor is None or self.__updates_since_resync >= self.__resync_interval:
+            self.__resync(latitude, longitude, altitude)
+            return position_local.PositionLocal.create(*self.__anchor_ned)
+
+        anchor_latitude, anchor_longitude, anchor_altitude = self.__anchor
+        delta_latitude = latitude - anchor_latitude
+        delta_longitude = longitude - anchor_longitude
+        if (
+            abs(delta_latitude) > TRACKER_MAX_DELTA_DEGREES
+            or abs(delta_longitude) > TRACKER_MAX_DELTA_DEGREES
+        ):
+            self.__resync(latitude, longitude, altitude)
+            return position_local.PositionLocal.create(*self.__anchor_ned)
+
+        delta_altitude = altitude - anchor_altitude
+        self.__updates_since_resync += 1
+
+        anchor_north, anchor_east, anchor_down = self.__anchor_ned
+        north_row, east_row, down_row = self.__jacobian
+
+        return position_local.PositionLocal.create(
+            anchor_north
+            + north_row[0] * delta_latitude
+            + north_row[1] * delta_longitude
+            + north_row[2] * delta_altitude,
+            anchor_east
+            + east_row[0] * delta_latitude
+            + east_row[1] * delta_longitude
+            + east_row[2] * delta_altitude,
+            anchor_down
+            + down_row[0] * delta_latitude
+            + down_row[1] * delta_longitude
+            + down_row[2] * delta_altitude,
+        )
 
 
 def position_global_from_position_local(
@@ -43,15 +436,8 @@ def position_global_from_position_local(
         home_position.altitude,
     )
 
-    result, global_position = position_global.PositionGlobal.create(
-        latitude,
-        longitude,
-        altitude,
-    )
-    if not result:
-        return False, None
-
-    return True, global_position
+    # Pass the result through rather than unpacking and repacking it
+    return position_global.PositionGlobal.create(latitude, longitude, altitude)
 
 
 def position_global_from_location_local(
@@ -83,6 +469,75 @@ def position_global_from_location_local(
     return position_global_from_position_local(home_position, local_position)
 
 
+def position_global_from_position_local_batch(
+    home_position: position_global.PositionGlobal,
+    north: np.ndarray,
+    east: np.ndarray,
+    down: np.ndarray,
+) -> Tuple[bool, Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]]:
+    """
+    Local coordinates to global coordinates for many positions at once.
+
+    Parameters
+    ----------
+    home_position : position_global.PositionGlobal
+        The home position in global coordinates.
+    north : np.ndarray
+        North components of the local positions in metres.
+        Any float type is accepted (e.g. float32), the conversion is done in float64.
+    east : np.ndarray
+        East components of the local positions in metres, same shape as north.
+    down : np.ndarray
+        Down components of the local positions in metres, same shape as north.
+
+    Returns
+    -------
+    Tuple[bool, Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]]
+        A tuple containing success status and latitude, longitude, altitude arrays.
+        Returns (False, None) if the input shapes do not match.
+    """
+    north = np.asarray(north, dtype=np.float64)
+    east = np.asarray(east, dtype=np.float64)
+    down = np.asarray(down, dtype=np.float64)
+    if north.shape != east.shape or north.shape != down.shape:
+        return False, None
+
+    latitude, longitude, altitude = pm.ned2geodetic(
+        north,
+        east,
+        down,
+        home_position.latitude,
+        home_position.longitude,
+        home_position.altitude,
+    )
+
+    return True, (latitude, longitude, altitude)
+
+
+def position_global_from_position_local_array(
+    home_position: position_global.PositionGlobal,
+    local_positions: position_local_array.PositionLocalArray,
+) -> Tuple[bool, Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]]:
+    """
+    Local coordinates to global coordinates for a PositionLocalArray.
+
+    Parameters
+    ----------
+    home_position : position_global.PositionGlobal
+        The home position in global coordinates.
+    local_positions : position_local_array.PositionLocalArray
+        The local positions to convert.
+
+    Returns
+    -------
+    Tuple[bool, Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]]
+        A tuple containing success status and latitude, longitude, altitude arrays.
+    """
+    return position_global_from_position_local_batch(
+        home_position, local_positions.north, local_positions.east, local_positions.down
+    )
+
+
 def position_local_from_position_global(
     home_position: position_global.PositionGlobal,
     global_position: position_global.PositionGlobal,
@@ -103,24 +558,17 @@ def position_local_from_position_global(
         A tuple containing success status and local position.
         Returns (False, None) if conversion fails.
     """
-    north, east, down = pm.geodetic2ned(
+    home_frame = __home_frame(
+        home_position.latitude, home_position.longitude, home_position.altitude
+    )
+    north, east, down = home_frame.geodetic_to_ned_scalar(
         global_position.latitude,
         global_position.longitude,
         global_position.altitude,
-        home_position.latitude,
-        home_position.longitude,
-        home_position.altitude,
-    )
-
-    result, local_position = position_local.PositionLocal.create(
-        north,
-        east,
-        down,
     )
-    if not result:
-        return False, None
 
-    return True, local_position
+    # Pass the result through rather than unpacking and repacking it
+    return position_local.PositionLocal.create(north, east, down)
 
 
 def position_local_from_location_global(
@@ -152,6 +600,57 @@ def position_local_from_location_global(
     return position_local_from_position_global(home_position, global_position)
 
 
+def position_local_from_position_global_batch(
+    home_position: position_global.PositionGlobal,
+    latitude: np.ndarray,
+    longitude: np.ndarray,
+    altitude: np.ndarray,
+    local_dtype: np.dtype = LOCAL_FLOAT_DTYPE,
+) -> Tuple[bool, Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]]:
+    """
+    Global coordinates to local coordinates for many positions at once.
+
+    The conversion is always done in float64: float32 resolves latitude only to
+    about 0.4 m and ECEF coordinates to 0.5 m.
+
+    Parameters
+    ----------
+    home_position : position_global.PositionGlobal
+        The home position in global coordinates.
+    latitude : np.ndarray
+        Latitudes of the global positions in degrees.
+    longitude : np.ndarray
+        Longitudes of the global positions in degrees, same shape as latitude.
+    altitude : np.ndarray
+        Altitudes of the global positions in metres, same shape as latitude.
+    local_dtype : np.dtype, optional
+        Type of the returned arrays, by default LOCAL_FLOAT_DTYPE.
+        np.float32 halves their size and resolves to a millimetre within 10 km of home.
+
+    Returns
+    -------
+    Tuple[bool, Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]]
+        A tuple containing success status and north, east, down arrays.
+        Returns (False, None) if the input shapes do not match.
+    """
+    latitude = np.asarray(latitude, dtype=np.float64)
+    longitude = np.asarray(longitude, dtype=np.float64)
+    altitude = np.asarray(altitude, dtype=np.float64)
+    if latitude.shape != longitude.shape or latitude.shape != altitude.shape:
+        return False, None
+
+    home_frame = __home_frame(
+        home_position.latitude, home_position.longitude, home_position.altitude
+    )
+    north, east, down = home_frame.geodetic_to_ned(latitude, longitude, altitude)
+
+    return True, (
+        north.astype(local_dtype, copy=False),
+        east.astype(local_dtype, copy=False),
+        down.astype(local_dtype, copy=False),
+    )
+
+
 def drone_odometry_local_from_global(
     home_position: position_global.PositionGlobal,
     odometry_global: drone_odometry_global.DroneOdometryGlobal,
@@ -179,7 +678,8 @@ def drone_odometry_local_from_global(
     if not result:
         return False, None
 
-    return drone_odometry_local.DroneOdometryLocal.create(
+    # Both parts come from successfully created objects
+    return True, drone_odometry_local.DroneOdometryLocal.create_unchecked(
         drone_position_local,
         odometry_global.orientation,
     )
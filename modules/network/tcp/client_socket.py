@@ -2,10 +2,19 @@
 Wrapper for TCP client socket operations.
 """
 
+import logging
 import socket
-from typing import Optional, Tuple
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 
-from .socket_wrapper import TcpSocket
+from .socket_wrapper import SOCKET_BUFFER_SIZE, TcpSocket, tune_socket
+
+
+LOGGER = logging.getLogger(__name__)
+
+# Seconds a resolved host and port is reused before looking it up again
+ADDRESS_CACHE_TTL = 30.0
 
 
 class TcpClientSocket(TcpSocket):
@@ -15,7 +24,16 @@ class TcpClientSocket(TcpSocket):
 
     __create_key = object()
 
-    def __init__(self, class_private_create_key: object, socket_instance: socket.socket) -> None:
+    # (host, port) -> (expiry time, getaddrinfo results), shared by all connections
+    __address_cache: Dict[Tuple[str, int], Tuple[float, List[tuple]]] = {}
+    __address_cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        class_private_create_key: object,
+        socket_instance: socket.socket,
+        write_buffer_size: int = 0,
+    ) -> None:
         """
         Private constructor, use create() method.
 
@@ -25,11 +43,13 @@ class TcpClientSocket(TcpSocket):
             Private key to ensure constructor is only called from create() method.
         socket_instance : socket.socket
             The socket instance to wrap.
+        write_buffer_size : int, optional
+            Bytes of small sends to collect before writing them together, by default 0.
         """
 
         assert class_private_create_key is TcpClientSocket.__create_key, "Use create() method"
 
-        super().__init__(socket_instance=socket_instance)
+        super().__init__(socket_instance=socket_instance, write_buffer_size=write_buffer_size)
 
     @classmethod
     def create(
@@ -38,6 +58,8 @@ class TcpClientSocket(TcpSocket):
         host: str = "localhost",
         port: int = 5000,
         connection_timeout: float = 60.0,
+        write_buffer_size: int = 0,
+        socket_buffer_size: int = SOCKET_BUFFER_SIZE,
     ) -> Tuple[bool, Optional["TcpClientSocket"]]:
         """
         Establishes socket connection through provided host and port.
@@ -52,6 +74,11 @@ class TcpClientSocket(TcpSocket):
             The port number to connect to, by default 5000.
         connection_timeout : float, optional
             Timeout for establishing connection, in seconds, by default 60.0.
+        write_buffer_size : int, optional
+            Bytes of small sends to collect before writing them together, by default 0.
+        socket_buffer_size : int, optional
+            Kernel send and receive buffer size in bytes, by default SOCKET_BUFFER_SIZE.
+            0 keeps the system defaults.
 
         Returns
         -------
@@ -64,24 +91,79 @@ class TcpClientSocket(TcpSocket):
         # Reassign instance before check or Pylance will complain
         socket_instance = instance
         if socket_instance is not None:
-            return True, TcpClientSocket(cls.__create_key, socket_instance)
+            return True, TcpClientSocket(cls.__create_key, socket_instance, write_buffer_size)
 
         if connection_timeout <= 0:
             # Zero puts it on non-blocking mode, which complicates things
-            print("Must be a positive non-zero value")
+            LOGGER.error("Must be a positive non-zero value")
             return False, None
 
         try:
-            socket_instance = socket.create_connection((host, port), connection_timeout)
-            return True, TcpClientSocket(cls.__create_key, socket_instance)
-        except TimeoutError:
-            print("Connection timed out.")
+            address_infos = cls.__resolve(host, port)
         except socket.gaierror as e:
-            print(
-                f"Could not connect to socket, address related error: {e}. "
-                "Make sure the host and port are correct."
+            LOGGER.error(
+                "Could not connect to socket, address related error: %s. "
+                "Make sure the host and port are correct.",
+                e,
             )
+            return False, None
+
+        try:
+            socket_instance = cls.__connect(address_infos, connection_timeout, socket_buffer_size)
+            return True, TcpClientSocket(cls.__create_key, socket_instance, write_buffer_size)
+        except TimeoutError:
+            LOGGER.error("Connection timed out.")
         except socket.error as e:
-            print(f"Could not connect to socket, connection error: {e}.")
+            LOGGER.error("Could not connect to socket, connection error: %s.", e)
+
+        # The address may be stale, look it up again next time
+        with cls.__address_cache_lock:
+            cls.__address_cache.pop((host, port), None)
 
         return False, None
+
+    @classmethod
+    def __resolve(cls, host: str, port: int) -> List[tuple]:
+        """
+        Looks up the address, reusing a recent lookup of the same host and port.
+
+        Raises socket.gaierror if the address cannot be resolved.
+        """
+        key = (host, port)
+        now = time.monotonic()
+        with cls.__address_cache_lock:
+            cached = cls.__address_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        address_infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        with cls.__address_cache_lock:
+            cls.__address_cache[key] = (now + ADDRESS_CACHE_TTL, address_infos)
+
+        return address_infos
+
+    @staticmethod
+    def __connect(
+        address_infos: List[tuple], connection_timeout: float, socket_buffer_size: int
+    ) -> socket.socket:
+        """
+        Connects to the first address that accepts, like socket.create_connection().
+
+        Raises the last connection error if none accept.
+        """
+        last_error: Optional[OSError] = None
+        for family, socket_type, protocol, _, address in address_infos:
+            socket_instance = socket.socket(family, socket_type, protocol)
+            try:
+                socket_instance.settimeout(connection_timeout)
+                tune_socket(socket_instance, socket_buffer_size)
+                socket_instance.connect(address)
+                return socket_instance
+            except OSError as e:
+                socket_instance.close()
+                last_error = e
+
+        if last_error is None:
+            raise socket.error("getaddrinfo returned an empty list")
+
+        raise last_error
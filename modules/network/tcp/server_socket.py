@@ -2,10 +2,14 @@
 Wrapper for TCP server socket operations.
 """
 
+import logging
 import socket
 from typing import Optional, Tuple
 
-from .socket_wrapper import TcpSocket
+from .socket_wrapper import SOCKET_BUFFER_SIZE, TcpSocket, tune_socket
+
+
+LOGGER = logging.getLogger(__name__)
 
 
 class TcpServerSocket(TcpSocket):
@@ -15,7 +19,12 @@ class TcpServerSocket(TcpSocket):
 
     __create_key = object()
 
-    def __init__(self, class_private_create_key: object, socket_instance: socket.socket) -> None:
+    def __init__(
+        self,
+        class_private_create_key: object,
+        socket_instance: socket.socket,
+        write_buffer_size: int = 0,
+    ) -> None:
         """
         Private constructor, use create() method.
 
@@ -25,11 +34,13 @@ class TcpServerSocket(TcpSocket):
             Private key to ensure constructor is only called from create() method.
         socket_instance : socket.socket
             The socket instance to wrap.
+        write_buffer_size : int, optional
+            Bytes of small sends to collect before writing them together, by default 0.
         """
 
         assert class_private_create_key is TcpServerSocket.__create_key, "Use create() method"
 
-        super().__init__(socket_instance=socket_instance)
+        super().__init__(socket_instance=socket_instance, write_buffer_size=write_buffer_size)
 
     @classmethod
     def create(
@@ -38,6 +49,8 @@ class TcpServerSocket(TcpSocket):
         host: str = "",
         port: int = 5000,
         connection_timeout: float = 60.0,
+        write_buffer_size: int = 0,
+        socket_buffer_size: int = SOCKET_BUFFER_SIZE,
     ) -> Tuple[bool, Optional["TcpServerSocket"]]:
         """
         Establishes socket connection through provided host and port.
@@ -55,6 +68,11 @@ class TcpServerSocket(TcpSocket):
             The port number to bind to, by default 5000.
         connection_timeout : float, optional
             Timeout for operations such as receive, by default 60.0.
+        write_buffer_size : int, optional
+            Bytes of small sends to collect before writing them together, by default 0.
+        socket_buffer_size : int, optional
+            Kernel send and receive buffer size in bytes, by default SOCKET_BUFFER_SIZE.
+            0 keeps the system defaults.
 
         Returns
         -------
@@ -68,7 +86,7 @@ class TcpServerSocket(TcpSocket):
         # Reassign instance before check or Pylance will complain
         socket_instance = instance
         if socket_instance is not None:
-            return True, TcpServerSocket(cls.__create_key, socket_instance)
+            return True, TcpServerSocket(cls.__create_key, socket_instance, write_buffer_size)
 
         if socket.has_dualstack_ipv6():
             # Create server which can accept both IPv6 and IPv4 if possible
@@ -79,26 +97,28 @@ class TcpServerSocket(TcpSocket):
                     dualstack_ipv6=True,
                 )
             except socket.gaierror as e:
-                print(
-                    f"Could not connect to socket, address related error: {e}.",
+                LOGGER.error(
+                    "Could not connect to socket, address related error: %s. "
                     "Make sure the host and port are correct.",
+                    e,
                 )
                 return False, None
             except socket.error as e:
-                print(f"Could not connect to socket, connection error: {e}.")
+                LOGGER.error("Could not connect to socket, connection error: %s.", e)
                 return False, None
         else:
             # Otherwise, server can only accept IPv4
             try:
                 server = socket.create_server((host, port))
             except socket.gaierror as e:
-                print(
-                    f"Could not connect to socket, address related error: {e}. "
-                    "Make sure the host and port are correct."
+                LOGGER.error(
+                    "Could not connect to socket, address related error: %s. "
+                    "Make sure the host and port are correct.",
+                    e,
                 )
                 return False, None
             except socket.error as e:
-                print(f"Could not connect to socket, connection error: {e}.")
+                LOGGER.error("Could not connect to socket, connection error: %s.", e)
                 return False, None
 
         # Currently listening, waiting for a connection
@@ -107,6 +127,8 @@ class TcpServerSocket(TcpSocket):
         else:
             print(f"Listening for internal connections on {host}:{port}")
 
+        # Accepted connections inherit these from the listening socket
+        tune_socket(server, socket_buffer_size)
         server.settimeout(connection_timeout)
         # This is in blocking mode, nothing can happen until this finishes, even keyboard interrupt
         socket_instance, addr = server.accept()
@@ -119,4 +141,4 @@ class TcpServerSocket(TcpSocket):
         server.close()
         print("No longer accepting new connections.")
 
-        return True, TcpServerSocket(cls.__create_key, socket_instance)
+        return True, TcpServerSocket(cls.__create_key, socket_instance, write_buffer_size)
@@ -2,8 +2,51 @@
 Wrapper for a TCP socket.
 """
 
+import logging
 import socket
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+
+
+# Largest single read, bigger chunks mean fewer syscalls for large messages
+RECV_CHUNK_SIZE = 2**16  # 64 kb
+# Where available, the kernel fills the whole request in one call instead of one call per chunk
+RECV_WAITALL = getattr(socket, "MSG_WAITALL", 0)
+# Most buffers a single sendmsg call accepts (IOV_MAX on Linux)
+SEND_MAX_BUFFERS = 1024
+
+# Kernel send and receive buffer size set on new connections, bursts stall less on full buffers
+SOCKET_BUFFER_SIZE = 2**20  # 1 mb
+
+LOGGER = logging.getLogger(__name__)
+
+
+def tune_socket(socket_instance: socket.socket, buffer_size: int = SOCKET_BUFFER_SIZE) -> None:
+    """
+    Sets connection options, best effort (unsupported options are skipped).
+
+    Call before connecting or listening so the buffer sizes apply to the TCP window.
+
+    Parameters
+    ----------
+    socket_instance : socket.socket
+        The socket to configure.
+    buffer_size : int, optional
+        Kernel send and receive buffer size in bytes, by default SOCKET_BUFFER_SIZE.
+        0 keeps the system defaults.
+    """
+    options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    if buffer_size > 0:
+        options.append((socket.SOL_SOCKET, socket.SO_SNDBUF, buffer_size))
+        options.append((socket.SOL_SOCKET, socket.SO_RCVBUF, buffer_size))
+
+    for level, option, value in options:
+        try:
+            socket_instance.setsockopt(level, option, value)
+        except OSError:
+            pass
 
 
 class TcpSocket:
@@ -11,7 +54,7 @@ class TcpSocket:
     Wrapper for a TCP socket.
     """
 
-    def __init__(self, socket_instance: socket.socket) -> None:
+    def __init__(self, socket_instance: socket.socket, write_buffer_size: int = 0) -> None:
         """
         Initialize the TcpSocket wrapper.
 
@@ -19,9 +62,21 @@ class TcpSocket:
         ----------
         socket_instance : socket.socket
             For initializing Socket with an existing socket object.
+        write_buffer_size : int, optional
+            Bytes of small sends to collect before writing them to the socket together,
+            by default 0 (every send is written immediately).
+            Buffered data is written by flush(), recv() and close().
         """
 
         self.__socket = socket_instance
+        self.__write_buffer_size = write_buffer_size
+        self.__write_buffer = bytearray()
+
+        # Small messages go out immediately instead of waiting on Nagle's algorithm
+        try:
+            self.__socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (OSError, AttributeError):
+            pass
 
     def send(self, data: bytes) -> bool:
         """
@@ -35,13 +90,83 @@ class TcpSocket:
         Returns
         -------
         bool
-            True if the data was sent successfully, False otherwise.
+            True if the data was sent (or buffered) successfully, False otherwise.
         """
 
+        if self.__write_buffer_size > 0:
+            if len(self.__write_buffer) + len(data) < self.__write_buffer_size:
+                self.__write_buffer += data
+                return True
+
+            # Too large to buffer, write out what is pending together with it
+            return self.send_many([data])
+
         try:
             self.__socket.sendall(data)
         except socket.error as e:
-            print(f"Could not send data: {e}.")
+            LOGGER.error("Could not send data: %s.", e)
+            return False
+
+        return True
+
+    def flush(self) -> bool:
+        """
+        Writes out data buffered by send().
+
+        Returns
+        -------
+        bool
+            True if the buffered data was sent successfully, False otherwise.
+        """
+
+        if len(self.__write_buffer) == 0:
+            return True
+
+        return self.send_many([])
+
+    def send_many(self, chunks: List[bytes]) -> bool:
+        """
+        Sends several pieces of data back to back, gathered into as few syscalls as possible.
+
+        Parameters
+        ----------
+        chunks : List[bytes]
+            The data to send over the socket, in order.
+
+        Returns
+        -------
+        bool
+            True if all the data was sent successfully, False otherwise.
+        """
+
+        # Anything buffered by send() goes first
+        if len(self.__write_buffer) > 0:
+            chunks = [self.__write_buffer, *chunks]
+            self.__write_buffer = bytearray()
+
+        # Platforms without sendmsg (e.g. Windows) get a single joined send
+        if not hasattr(self.__socket, "sendmsg"):
+            try:
+                self.__socket.sendall(b"".join(chunks))
+            except socket.error as e:
+                LOGGER.error("Could not send data: %s.", e)
+                return False
+
+            return True
+
+        views = [memoryview(chunk).cast("B") for chunk in chunks if len(chunk) > 0]
+        try:
+            while len(views) > 0:
+                bytes_sent = self.__socket.sendmsg(views[:SEND_MAX_BUFFERS])
+
+                # Drop fully sent chunks and trim a partially sent one
+                while len(views) > 0 and bytes_sent >= len(views[0]):
+                    bytes_sent -= len(views[0])
+                    views.pop(0)
+                if bytes_sent > 0:
+                    views[0] = views[0][bytes_sent:]
+        except socket.error as e:
+            LOGGER.error("Could not send data: %s.", e)
             return False
 
         return True
@@ -63,21 +188,57 @@ class TcpSocket:
             - If it is successful, the second parameter will be the data that is read.
         """
 
-        message = b""
+        # Receive directly into one buffer instead of concatenating chunks
+        message = bytearray(buf_size)
+        if not self.recv_into(memoryview(message)):
+            return False, None
+
+        return True, bytes(message)
+
+    def recv_into(self, buffer: memoryview) -> bool:
+        """
+        Fills a caller-owned buffer with exactly len(buffer) bytes from the socket.
+
+        Avoids allocating a new bytes object per message, useful for fixed-size framing
+        where the destination buffer can be reused.
+
+        Parameters
+        ----------
+        buffer : memoryview
+            Writable buffer to receive into, its length is the number of bytes to read.
+
+        Returns
+        -------
+        bool
+            True if the buffer was filled, False otherwise (contents are then incomplete).
+        """
+
+        # The peer may be waiting on buffered data before it replies
+        if not self.flush():
+            return False
+
+        buffer = buffer.cast("B")
+        buf_size = len(buffer)
         bytes_recd = 0
         while bytes_recd < buf_size:
-            # 4096 or other low powers of 2 is recommended
-            # Although while testing without a limit, it has been observed to reach above 100000
-            chunk = self.__socket.recv(min(buf_size - bytes_recd, 4096))
+            # With MSG_WAITALL a blocking socket returns once everything has arrived
+            # A timeout (non-blocking underneath) or a signal can still return short, so loop
+            if RECV_WAITALL != 0:
+                chunk_size = self.__socket.recv_into(
+                    buffer[bytes_recd:], buf_size - bytes_recd, RECV_WAITALL
+                )
+            else:
+                chunk_size = self.__socket.recv_into(
+                    buffer[bytes_recd:], min(buf_size - bytes_recd, RECV_CHUNK_SIZE)
+                )
 
-            if chunk == b"":
-                print("Socket connection broken")  # When 0 is received, means error
-                return False, None
+            if chunk_size == 0:
+                LOGGER.warning("Socket connection broken")  # When 0 is received, means error
+                return False
 
-            message += chunk
-            bytes_recd += len(chunk)
+            bytes_recd += chunk_size
 
-        return True, message
+        return True
 
     def close(self) -> bool:
         """
@@ -89,10 +250,12 @@ class TcpSocket:
             True if the socket was closed successfully, False otherwise.
         """
 
+        self.flush()
+
         try:
             self.__socket.close()
         except socket.error as e:
-            print(f"Could not close socket: {e}.")
+            LOGGER.error("Could not close socket: %s.", e)
             return False
 
         return True
@@ -2,13 +2,20 @@
 Wrapper for a UDP socket.
 """
 
+import errno
+import select
 import socket
 import time
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 
 CHUNK_SIZE = 2**15  # 32 kb, may need to be shrunk on pi becasue its buffer may not be as large
-SEND_DELAY = 1e-4  # Delay in seconds in between sends to avoid filling socket buffer
+SEND_DELAY = 0.0  # Optional delay in seconds in between sends to pace a slow receiver
+SEND_BACKOFF = 1e-4  # Delay in seconds before retrying when the kernel is out of buffer space
+SEND_MAX_RETRIES = 100  # Consecutive retries of one chunk before giving up
+SEND_WRITABLE_TIMEOUT = 1.0  # Seconds to wait for a full send buffer to drain
+SOCKET_BUFFER_SIZE = 10 * 2**20  # 10 mb, kernel send and receive buffers (capped by the system)
+RECV_BUFFER_MIN_SIZE = 2**16  # 64 kb, smallest receive buffer kept between calls
 
 
 class UdpSocket:
@@ -28,6 +35,41 @@ class UdpSocket:
 
         self.__socket = socket_instance
 
+        # Reused by every receive, allocated on first use and grown when needed
+        self.__recv_buffer: Optional[bytearray] = None
+        # (host, port) -> resolved address for sendto()
+        self.__address_cache: Dict[Tuple[str, int], tuple] = {}
+
+        if self.__socket is not None:
+            self.tune()
+
+    def tune(
+        self,
+        send_buffer_size: int = SOCKET_BUFFER_SIZE,
+        recv_buffer_size: int = SOCKET_BUFFER_SIZE,
+    ) -> None:
+        """
+        Sets the kernel send and receive buffer sizes, best effort.
+
+        Larger buffers absorb bursts so that sends block or drop less often.
+
+        Parameters
+        ----------
+        send_buffer_size : int, optional
+            Kernel send buffer size in bytes, by default SOCKET_BUFFER_SIZE.
+        recv_buffer_size : int, optional
+            Kernel receive buffer size in bytes, by default SOCKET_BUFFER_SIZE.
+        """
+
+        for option, size in (
+            (socket.SO_SNDBUF, send_buffer_size),
+            (socket.SO_RCVBUF, recv_buffer_size),
+        ):
+            try:
+                self.__socket.setsockopt(socket.SOL_SOCKET, option, size)
+            except OSError:
+                pass
+
     def send_to(
         self,
         data: bytes,
@@ -50,7 +92,8 @@ class UdpSocket:
         chunk_size : int, optional
             Size of data chunks to send, by default CHUNK_SIZE.
         send_delay : float, optional
-            Delay in seconds between sends to avoid filling socket buffer, by default SEND_DELAY.
+            Delay in seconds between sends to pace a slow receiver, by default SEND_DELAY (none).
+            A full send buffer is waited on regardless.
 
         Returns
         -------
@@ -58,26 +101,109 @@ class UdpSocket:
             True if data was transferred successfully, False otherwise.
         """
 
-        address = (host, port)
+        result, address = self.__resolve(host, port)
+        if not result:
+            return False
+
+        # Chunks are views into data rather than sliced copies
+        view = memoryview(data).cast("B")
         data_sent = 0
-        data_size = len(data)
+        data_size = len(view)
 
         while data_sent < data_size:
-            if data_sent + chunk_size > data_size:
-                chunk = data[data_sent:data_size]
-            else:
-                chunk = data[data_sent : data_sent + chunk_size]
+            chunk = view[data_sent : data_sent + chunk_size]
+            if not self.__send_datagram(chunk, address):
+                return False
+
+            data_sent += len(chunk)
+
+            if send_delay > 0:
+                time.sleep(send_delay)
+
+        return True
+
+    def send_to_many(self, messages: List[bytes], host: str = "", port: int = 5000) -> bool:
+        """
+        Sends each message as its own datagram to the specified address.
+
+        The destination is resolved once for the whole batch.
+
+        Parameters
+        ----------
+        messages : List[bytes]
+            The messages to send, each must fit in one datagram.
+        host : str, optional
+            Empty string is interpreted as '0.0.0.0' (IPv4) or '::' (IPv6), which is an open address, by default "".
+        port : int, optional
+            The port number to send to, by default 5000.
+
+        Returns
+        -------
+        bool
+            True if all messages were sent successfully, False otherwise.
+        """
+
+        result, address = self.__resolve(host, port)
+        if not result:
+            return False
+
+        for message in messages:
+            if not self.__send_datagram(message, address):
+                return False
+
+        return True
+
+    def __resolve(self, host: str, port: int) -> Tuple[bool, Optional[tuple]]:
+        """
+        Address to pass to sendto(), resolved once per destination.
 
+        sendto() would otherwise look up a host name on every call.
+        """
+        address = self.__address_cache.get((host, port))
+        if address is not None:
+            return True, address
+
+        address = (host, port)
+        # Empty string and "<broadcast>" are special cased by sendto() and never looked up
+        if host not in ("", "<broadcast>"):
             try:
-                self.__socket.sendto(chunk, address)
-                data_sent += len(chunk)
+                address = socket.getaddrinfo(
+                    host, port, self.__socket.family, socket.SOCK_DGRAM, socket.IPPROTO_UDP
+                )[0][4]
             except socket.error as e:
                 print(f"Could not send data: {e}")
-                return False
+                return False, None
 
-            time.sleep(send_delay)
+        self.__address_cache[(host, port)] = address
+        return True, address
 
-        return True
+    def __send_datagram(self, datagram: bytes, address: tuple) -> bool:
+        """
+        Sends one datagram, backing off only when the kernel reports pressure.
+        """
+        retries = 0
+        while True:
+            try:
+                self.__socket.sendto(datagram, address)
+                return True
+            except socket.error as e:
+                if (
+                    e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK, errno.ENOBUFS)
+                    or retries >= SEND_MAX_RETRIES
+                ):
+                    print(f"Could not send data: {e}")
+                    return False
+
+                retries += 1
+                if e.errno == errno.ENOBUFS:
+                    time.sleep(SEND_BACKOFF)
+                    continue
+
+                # Wait for the send buffer to drain rather than polling
+                _, writable, _ = select.select([], [self.__socket], [], SEND_WRITABLE_TIMEOUT)
+                if len(writable) == 0:
+                    print(f"Could not send data: {e}")
+                    return False
 
     def recv(self, buf_size: int) -> Tuple[bool, Optional[bytes]]:
         """
@@ -95,28 +221,65 @@ class UdpSocket:
             Second element is the received data, or None if unsuccessful.
         """
 
-        data = b""
+        result, view = self.recv_zero_copy(buf_size)
+        if not result:
+            return False, None
+
+        # Get Pylance to stop complaining
+        assert view is not None
+
+        data = bytes(view)
+        view.release()
+        return True, data
+
+    def recv_zero_copy(self, buf_size: int) -> Tuple[bool, Optional[memoryview]]:
+        """
+        Receives data from the socket into a buffer owned by this socket, without copying it out.
+
+        The returned view is only valid until the next receive on this socket,
+        release it or copy what is needed before then.
+
+        Parameters
+        ----------
+        buf_size : int
+            The number of bytes to receive.
+
+        Returns
+        -------
+        Tuple[bool, Optional[memoryview]]
+            First element is True if data was received successfully, False otherwise.
+            Second element is a view of the received data, or None if unsuccessful.
+        """
+
+        # Replaced rather than resized, as views from earlier calls may still be held
+        if self.__recv_buffer is None or len(self.__recv_buffer) < buf_size:
+            self.__recv_buffer = bytearray(max(buf_size, RECV_BUFFER_MIN_SIZE))
+
+        view = memoryview(self.__recv_buffer)[:buf_size]
         addr = None
         data_size = 0
 
         while data_size < buf_size:
             try:
-                packet, current_addr = self.__socket.recvfrom(buf_size)
+                # Anything in a packet beyond buf_size is discarded by the kernel
+                packet_size, current_addr = self.__socket.recvfrom_into(
+                    view[data_size:], buf_size - data_size
+                )
                 if addr is None:
                     addr = current_addr
                 elif addr != current_addr:
+                    # Not advancing the size lets the next packet overwrite this one
                     print(f"Data received from multiple addresses: {addr} and {current_addr}")
-                    packet = b""
+                    continue
 
-                # Add the received packet to the accumulated data and increment the size accordingly
-                data += packet
-                data_size += len(packet)
+                data_size += packet_size
 
             except socket.error as e:
                 print(f"Could not receive data: {e}")
+                view.release()
                 return False, None
 
-        return True, data
+        return True, view
 
     def get_socket(self) -> socket.socket:
         """
@@ -3,7 +3,7 @@ Orientation of object in 3D space.
 """
 
 import math
-from typing import Tuple, Literal, Optional
+from typing import ClassVar, Tuple, Literal, Optional
 
 
 class Orientation:
@@ -14,7 +14,10 @@ class Orientation:
     Orientation is identical in local and global space.
     """
 
-    __create_key = object()
+    # Attached to every odometry sample
+    __slots__ = ("yaw", "pitch", "roll")
+
+    __create_key: ClassVar[object] = object()
 
     @classmethod
     def create(
@@ -41,13 +44,11 @@ class Orientation:
             Success status and the created Orientation object if successful,
             or False and None if parameters are out of range.
         """
-        if yaw < -math.pi or yaw > math.pi:
-            return False, None
-
-        if pitch < -math.pi or pitch > math.pi:
-            return False, None
-
-        if roll < -math.pi or roll > math.pi:
+        if not (
+            -math.pi <= yaw <= math.pi
+            and -math.pi <= pitch <= math.pi
+            and -math.pi <= roll <= math.pi
+        ):
             return False, None
 
         return True, Orientation(cls.__create_key, yaw, pitch, roll)
@@ -84,7 +85,7 @@ class Orientation:
         str
             String representation of the Orientation object.
         """
-        return f"{self.__class__} YPR radians: {self.yaw}, {self.pitch}, {self.roll}"
+        return f"{type(self).__name__} YPR radians: {self.yaw}, {self.pitch}, {self.roll}"
 
     def __repr__(self) -> str:
         """
@@ -0,0 +1,151 @@
+"""
+Many orientations of objects in 3D space, stored as columns.
+"""
+
+import math
+from typing import Iterator, List, Literal, Tuple
+
+import numpy as np
+
+from . import orientation
+
+
+class OrientationArray:
+    """
+    Yaw, pitch, roll following NED system, see Orientation.
+
+    Each angle is a contiguous float64 array.
+    """
+
+    __create_key = object()
+
+    @classmethod
+    def create(
+        cls, yaw: np.ndarray, pitch: np.ndarray, roll: np.ndarray
+    ) -> Tuple[Literal[True], "OrientationArray"] | Tuple[Literal[False], None]:
+        """
+        Create an OrientationArray instance.
+
+        Parameters
+        ----------
+        yaw : np.ndarray
+            Radians of [-pi, pi], 1 dimensional.
+        pitch : np.ndarray
+            Radians of [-pi, pi], same shape as yaw.
+        roll : np.ndarray
+            Radians of [-pi, pi], same shape as yaw.
+
+        Returns
+        -------
+        Tuple[Literal[True], OrientationArray] | Tuple[Literal[False], None]
+            Success status and the created OrientationArray object if successful,
+            or False and None if the shapes do not match or any angle is out of range.
+        """
+        yaw = np.ascontiguousarray(yaw, dtype=np.float64)
+        pitch = np.ascontiguousarray(pitch, dtype=np.float64)
+        roll = np.ascontiguousarray(roll, dtype=np.float64)
+
+        if yaw.ndim != 1:
+            return False, None
+
+        if yaw.shape != pitch.shape or yaw.shape != roll.shape:
+            return False, None
+
+        if (
+            yaw.shape[0] > 0
+            and max(np.abs(yaw).max(), np.abs(pitch).max(), np.abs(roll).max()) > math.pi
+        ):
+            return False, None
+
+        return True, OrientationArray(cls.__create_key, yaw, pitch, roll)
+
+    @classmethod
+    def create_from_orientations(
+        cls, orientations: List[orientation.Orientation]
+    ) -> Tuple[Literal[True], "OrientationArray"] | Tuple[Literal[False], None]:
+        """
+        Create an OrientationArray instance from Orientation objects.
+
+        Parameters
+        ----------
+        orientations : List[orientation.Orientation]
+            Orientations to copy, can be empty.
+
+        Returns
+        -------
+        Tuple[Literal[True], OrientationArray] | Tuple[Literal[False], None]
+            Success status and the created OrientationArray object.
+        """
+        values = np.array(
+            [(item.yaw, item.pitch, item.roll) for item in orientations], dtype=np.float64
+        ).reshape(-1, 3)
+
+        return cls.create(values[:, 0], values[:, 1], values[:, 2])
+
+    def __init__(
+        self,
+        class_private_create_key: object,
+        yaw: np.ndarray,
+        pitch: np.ndarray,
+        roll: np.ndarray,
+    ) -> None:
+        """
+        Private constructor, use create() method.
+
+        Parameters
+        ----------
+        class_private_create_key : object
+            Private key to prevent direct instantiation.
+        yaw : np.ndarray
+            Radians of [-pi, pi].
+        pitch : np.ndarray
+            Radians of [-pi, pi].
+        roll : np.ndarray
+            Radians of [-pi, pi].
+        """
+        assert class_private_create_key is OrientationArray.__create_key, "Use create() method."
+
+        self.yaw = yaw
+        self.pitch = pitch
+        self.roll = roll
+
+    def __len__(self) -> int:
+        """
+        Number of orientations.
+        """
+        return self.yaw.shape[0]
+
+    def to_orientations(self) -> Iterator[orientation.Orientation]:
+        """
+        Convert back to Orientation objects, one at a time.
+
+        Returns
+        -------
+        Iterator[orientation.Orientation]
+            The orientations in order.
+        """
+        for yaw, pitch, roll in zip(self.yaw.tolist(), self.pitch.tolist(), self.roll.tolist()):
+            _, item = orientation.Orientation.create(yaw, pitch, roll)
+            yield item
+
+    def __str__(self) -> str:
+        """
+        Convert to string representation.
+
+        Returns
+        -------
+        str
+            String representation of the OrientationArray object.
+        """
+        return f"{type(self).__name__}: {len(self)} orientations"
+
+    def __repr__(self) -> str:
+        """
+        Representation for collections (e.g. list).
+
+        Returns
+        -------
+        str
+            String representation of the OrientationArray object.
+        """
+        return str(self)
@@ -12,6 +12,8 @@ class PositionGlobal:
     WGS 84 following ISO 6709 (latitude before longitude).
     """
 
+    __slots__ = ("latitude", "longitude", "altitude")
+
     __create_key = object()
 
     @classmethod
@@ -37,6 +39,30 @@ class PositionGlobal:
         """
         return True, PositionGlobal(cls.__create_key, latitude, longitude, altitude)
 
+    @classmethod
+    def from_decoded(cls, latitude: float, longitude: float, altitude: float) -> "PositionGlobal":
+        """
+        Create a PositionGlobal instance from values decoded from a trusted source.
+
+        The values were already checked when the sender created its PositionGlobal,
+        so this skips create() and its success status.
+
+        Parameters
+        ----------
+        latitude : float
+            Decimal degrees.
+        longitude : float
+            Decimal degrees.
+        altitude : float
+            Metres above mean sea level (MSL). Can be negative.
+
+        Returns
+        -------
+        PositionGlobal
+            The created PositionGlobal object.
+        """
+        return PositionGlobal(cls.__create_key, latitude, longitude, altitude)
+
     def __init__(
         self, class_private_create_key: object, latitude: float, longitude: float, altitude: float
     ) -> None:
@@ -69,7 +95,7 @@ class PositionGlobal:
         str
             String representation of the PositionGlobal object.
         """
-        return f"{self.__class__}: latitude: {self.latitude}, longitude: {self.longitude}, altitude: {self.altitude}"
+        return f"{type(self).__name__}: latitude: {self.latitude}, longitude: {self.longitude}, altitude: {self.altitude}"
 
     def __repr__(self) -> str:
         """
@@ -88,6 +114,8 @@ class NamedPositionGlobal(PositionGlobal):
     Named PositionGlobal.
     """
 
+    __slots__ = ("name",)
+
     __create_key = object()
 
     @classmethod
@@ -160,4 +188,4 @@ class NamedPositionGlobal(PositionGlobal):
         str
             String representation of the NamedPositionGlobal object.
         """
-        return f"{self.__class__}: name: {self.name}, latitude: {self.latitude}, longitude: {self.longitude}, altitude: {self.altitude}"
+        return f"{type(self).__name__}: name: {self.name}, latitude: {self.latitude}, longitude: {self.longitude}, altitude: {self.altitude}"
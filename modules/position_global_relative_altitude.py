@@ -14,6 +14,8 @@ class PositionGlobalRelativeAltitude:
     Relative altitude to home position.
     """
 
+    __slots__ = ("latitude", "longitude", "relative_altitude")
+
     __create_key = object()
 
     @classmethod
@@ -79,7 +81,7 @@ class PositionGlobalRelativeAltitude:
         str
             String representation of the PositionGlobalRelativeAltitude object.
         """
-        return f"{self.__class__}: latitude: {self.latitude}, longitude: {self.longitude}, relative altitude: {self.relative_altitude}"
+        return f"{type(self).__name__}: latitude: {self.latitude}, longitude: {self.longitude}, relative altitude: {self.relative_altitude}"
 
     def __repr__(self) -> str:
         """
@@ -98,6 +100,8 @@ class NamedPositionGlobalRelativeAltitude(PositionGlobalRelativeAltitude):
     Named PositionGlobalRelativeAltitude.
     """
 
+    __slots__ = ("name",)
+
     __create_key = object()
 
     @classmethod
@@ -133,6 +137,40 @@ class NamedPositionGlobalRelativeAltitude(PositionGlobalRelativeAltitude):
             cls.__create_key, name, latitude, longitude, relative_altitude
         )
 
+    @classmethod
+    def from_values(
+        cls,
+        name: str,
+        latitude: float,
+        longitude: float,
+        relative_altitude: float,
+    ) -> "NamedPositionGlobalRelativeAltitude":
+        """
+        Create a NamedPositionGlobalRelativeAltitude instance without a success status.
+
+        create() cannot fail, so this is for building many objects at once
+        without unpacking a result for each one.
+
+        Parameters
+        ----------
+        name : str
+            Name for the position. Can be empty.
+        latitude : float
+            Decimal degrees.
+        longitude : float
+            Decimal degrees.
+        relative_altitude : float
+            Metres above home position. Can be negative.
+
+        Returns
+        -------
+        NamedPositionGlobalRelativeAltitude
+            The created NamedPositionGlobalRelativeAltitude object.
+        """
+        return NamedPositionGlobalRelativeAltitude(
+            cls.__create_key, name, latitude, longitude, relative_altitude
+        )
+
     def __init__(
         self,
         class_private_create_key: object,
@@ -179,4 +217,4 @@ class NamedPositionGlobalRelativeAltitude(PositionGlobalRelativeAltitude):
         str
             String representation of the NamedPositionGlobalRelativeAltitude object.
         """
-        return f"{self.__class__}: name: {self.name}, latitude: {self.latitude}, longitude: {self.longitude}, relative_altitude: {self.relative_altitude}"
+        return f"{type(self).__name__}: name: {self.name}, latitude: {self.latitude}, longitude: {self.longitude}, relative_altitude: {self.relative_altitude}"
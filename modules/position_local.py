@@ -10,6 +10,9 @@ class PositionLocal:
     Position in NED system relative to home position.
     """
 
+    # One per telemetry sample, slots keep instances small
+    __slots__ = ("north", "east", "down")
+
     __create_key = object()
 
     @classmethod
@@ -67,7 +70,7 @@ class PositionLocal:
         str
             String representation of the PositionLocal object.
         """
-        return f"{self.__class__}: north: {self.north}, east: {self.east}, down: {self.down}"
+        return f"{type(self).__name__}: north: {self.north}, east: {self.east}, down: {self.down}"
 
     def __repr__(self) -> str:
         """
@@ -86,6 +89,8 @@ class NamedPositionLocal(PositionLocal):
     Named PositionLocal.
     """
 
+    __slots__ = ("name",)
+
     __create_key = object()
 
     @classmethod
@@ -153,4 +158,4 @@ class NamedPositionLocal(PositionLocal):
         str
             String representation of the NamedPositionLocal object.
         """
-        return f"{self.__class__}: name: {self.name}, north: {self.north}, east: {self.east}, down: {self.down}"
+        return f"{type(self).__name__}: name: {self.name}, north: {self.north}, east: {self.east}, down: {self.down}"
@@ -0,0 +1,214 @@
+"""
+Many positions in local Euclidean space (origin at home position global), stored as columns.
+"""
+
+from typing import Iterator, List, Literal, Tuple
+
+import numpy as np
+
+from . import orientation
+from . import position_local
+
+
+class PositionLocalArray:
+    """
+    Positions in NED system relative to home position.
+
+    Each axis is a contiguous float64 array, so operations over all positions are vectorized
+    instead of going through one PositionLocal object at a time.
+    """
+
+    __create_key = object()
+
+    @classmethod
+    def create(
+        cls, north: np.ndarray, east: np.ndarray, down: np.ndarray
+    ) -> Tuple[Literal[True], "PositionLocalArray"] | Tuple[Literal[False], None]:
+        """
+        Create a PositionLocalArray instance.
+
+        Parameters
+        ----------
+        north : np.ndarray
+            Metres, 1 dimensional.
+        east : np.ndarray
+            Metres, same shape as north.
+        down : np.ndarray
+            Metres, same shape as north. Allowed to be positive, which is below the home position.
+
+        Returns
+        -------
+        Tuple[Literal[True], PositionLocalArray] | Tuple[Literal[False], None]
+            Success status and the created PositionLocalArray object if successful,
+            or False and None if the shapes are not matching 1 dimensional arrays.
+        """
+        north = np.ascontiguousarray(north, dtype=np.float64)
+        east = np.ascontiguousarray(east, dtype=np.float64)
+        down = np.ascontiguousarray(down, dtype=np.float64)
+
+        if north.ndim != 1:
+            return False, None
+
+        if north.shape != east.shape or north.shape != down.shape:
+            return False, None
+
+        return True, PositionLocalArray(cls.__create_key, north, east, down)
+
+    @classmethod
+    def create_from_positions(
+        cls, positions: List[position_local.PositionLocal]
+    ) -> Tuple[Literal[True], "PositionLocalArray"] | Tuple[Literal[False], None]:
+        """
+        Create a PositionLocalArray instance from PositionLocal objects.
+
+        Parameters
+        ----------
+        positions : List[position_local.PositionLocal]
+            Positions to copy, can be empty.
+
+        Returns
+        -------
+        Tuple[Literal[True], PositionLocalArray] | Tuple[Literal[False], None]
+            Success status and the created PositionLocalArray object.
+        """
+        values = np.array(
+            [(position.north, position.east, position.down) for position in positions],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+
+        return cls.create(values[:, 0], values[:, 1], values[:, 2])
+
+    def __init__(
+        self,
+        class_private_create_key: object,
+        north: np.ndarray,
+        east: np.ndarray,
+        down: np.ndarray,
+    ) -> None:
+        """
+        Private constructor, use create() method.
+
+        Parameters
+        ----------
+        class_private_create_key : object
+            Private key to prevent direct instantiation.
+        north : np.ndarray
+            Metres.
+        east : np.ndarray
+            Metres.
+        down : np.ndarray
+            Metres.
+        """
+        assert class_private_create_key is PositionLocalArray.__create_key, "Use create() method."
+
+        self.north = north
+        self.east = east
+        self.down = down
+
+    def __len__(self) -> int:
+        """
+        Number of positions.
+        """
+        return self.north.shape[0]
+
+    def to_positions(self) -> Iterator[position_local.PositionLocal]:
+        """
+        Convert back to PositionLocal objects, one at a time.
+
+        Returns
+        -------
+        Iterator[position_local.PositionLocal]
+            The positions in order.
+        """
+        for north, east, down in zip(self.north.tolist(), self.east.tolist(), self.down.tolist()):
+            _, position = position_local.PositionLocal.create(north, east, down)
+            yield position
+
+    def distance_to(self, position: position_local.PositionLocal) -> np.ndarray:
+        """
+        Straight line distance from each position to the given position.
+
+        Parameters
+        ----------
+        position : position_local.PositionLocal
+            Position to measure to.
+
+        Returns
+        -------
+        np.ndarray
+            Metres, one per position.
+        """
+        return np.sqrt(
+            (self.north - position.north) ** 2
+            + (self.east - position.east) ** 2
+            + (self.down - position.down) ** 2
+        )
+
+    def rotate_by(self, rotation: orientation.Orientation) -> "PositionLocalArray":
+        """
+        Rotate every position about the origin by the given orientation.
+
+        Positions in the body frame of an object with this orientation become positions in the
+        NED frame.
+
+        Parameters
+        ----------
+        rotation : orientation.Orientation
+            Yaw, pitch, roll applied in the zyx order.
+
+        Returns
+        -------
+        PositionLocalArray
+            The rotated positions.
+        """
+        sin_yaw, cos_yaw = np.sin(rotation.yaw), np.cos(rotation.yaw)
+        sin_pitch, cos_pitch = np.sin(rotation.pitch), np.cos(rotation.pitch)
+        sin_roll, cos_roll = np.sin(rotation.roll), np.cos(rotation.roll)
+
+        # Rz(yaw) @ Ry(pitch) @ Rx(roll)
+        matrix = np.array(
+            [
+                [
+                    cos_yaw * cos_pitch,
+                    cos_yaw * sin_pitch * sin_roll - sin_yaw * cos_roll,
+                    cos_yaw * sin_pitch * cos_roll + sin_yaw * sin_roll,
+                ],
+                [
+                    sin_yaw * cos_pitch,
+                    sin_yaw * sin_pitch * sin_roll + cos_yaw * cos_roll,
+                    sin_yaw * sin_pitch * cos_roll - cos_yaw * sin_roll,
+                ],
+                [-sin_pitch, cos_pitch * sin_roll, cos_pitch * cos_roll],
+            ]
+        )
+
+        north, east, down = matrix @ np.stack((self.north, self.east, self.down))
+
+        return PositionLocalArray(
+            PositionLocalArray.__create_key,
+            np.ascontiguousarray(north),
+            np.ascontiguousarray(east),
+            np.ascontiguousarray(down),
+        )
+
+    def __str__(self) -> str:
+        """
+        Convert to string representation.
+
+        Returns
+        -------
+        str
+            String representation of the PositionLocalArray object.
+        """
+        return f"{type(self).__name__}: {len(self)} positions"
+
+    def __repr__(self) -> str:
+        """
+        Representation for collections (e.g. list).
+
+        Returns
+        -------
+        str
+            String representation of the PositionLocalArray object.
+        """
+        return str(self)
@@ -2,16 +2,37 @@
 Converts an image containing QR codes into text.
 """
 
+import threading
 from typing import Optional, Tuple
 
+import cv2
 import numpy as np
 from numpy.typing import NDArray
-from pyzbar import pyzbar
+
+# zbar is optional, OpenCV's detector is used unless pyzbar is asked for
+try:
+    from pyzbar import pyzbar
+except ImportError:
+    pyzbar = None
+
+
+BACKEND_OPENCV = "opencv"
+BACKEND_PYZBAR = "pyzbar"
+# Requires an OpenCV build with the contrib modules
+BACKEND_WECHAT = "wechat"
+
+# Frames larger than this are scanned downscaled first (pixels)
+DOWNSCALE_MAX_DIMENSION = 960
+# Margin kept around a located code when decoding it at full resolution (fraction of its size)
+REGION_MARGIN = 0.25
+
+# Detectors are kept per thread and reused between calls
+thread_local = threading.local()
 
 
 class QrScanner:
     """
-    Wrapper for pyzbar.
+    Wrapper for QR code detectors (OpenCV, pyzbar, or WeChat from OpenCV contrib).
     """
 
     def __init__(self) -> None:
@@ -20,7 +41,9 @@ class QrScanner:
         """
 
     @staticmethod
-    def get_qr_text(frame: NDArray[np.uint8]) -> Tuple[bool, Optional[str]]:
+    def get_qr_text(
+        frame: NDArray[np.uint8], backend: str = BACKEND_OPENCV
+    ) -> Tuple[bool, Optional[str]]:
         """
         Attempts to find and decode a QR code from the given frame.
 
@@ -28,16 +51,111 @@ class QrScanner:
         ----------
         frame : NDArray[np.uint8]
             The image frame to scan for QR codes.
+        backend : str, optional
+            Detector to use, one of BACKEND_OPENCV, BACKEND_PYZBAR, or BACKEND_WECHAT,
+            by default BACKEND_OPENCV.
 
         Returns
         -------
         Tuple[bool, Optional[str]]
             Success status and the decoded QR code text.
-            Returns (False, None) if no QR code is found.
+            Returns (False, None) if no QR code is found or the backend is not available.
         """
+        if backend not in (BACKEND_OPENCV, BACKEND_PYZBAR, BACKEND_WECHAT):
+            print(f"ERROR: Unknown QR backend: {backend}")
+            return False, None
+
+        if backend == BACKEND_WECHAT and not hasattr(cv2, "wechat_qrcode_WeChatQRCode"):
+            print("ERROR: OpenCV was built without the WeChat QR code module")
+            return False, None
+
+        if backend == BACKEND_PYZBAR and pyzbar is None:
+            print("ERROR: pyzbar or the zbar library is not installed")
+            return False, None
+
+        # Detectors only look at luminance, convert once here rather than inside each detector
+        if frame.ndim == 3 and frame.shape[2] == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+        # Detection cost grows with pixel count, scan large frames downscaled
+        largest_dimension = max(frame.shape[0], frame.shape[1])
+        if largest_dimension <= DOWNSCALE_MAX_DIMENSION:
+            result, qr_text, _ = QrScanner.__decode(frame, backend)
+            return result, qr_text
+
+        scale = DOWNSCALE_MAX_DIMENSION / largest_dimension
+        small_frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        result, qr_text, corners = QrScanner.__decode(small_frame, backend)
+        if result:
+            return True, qr_text
+
+        # Only OpenCV reports codes it found but could not decode, locate them for the others
+        if corners is None and backend != BACKEND_OPENCV:
+            found, corners = QrScanner.__opencv_detector().detect(small_frame)
+            if not found:
+                corners = None
+
+        # Nothing to decode at full resolution
+        if corners is None:
+            return False, None
+
+        # Small or dense codes may not survive downscaling, decode the located region at full size
+        x, y, width, height = cv2.boundingRect(
+            np.asarray(corners, dtype=np.float32).reshape(-1, 2) / scale
+        )
+        margin_x = int(width * REGION_MARGIN)
+        margin_y = int(height * REGION_MARGIN)
+        region = frame[
+            max(0, y - margin_y) : y + height + margin_y,
+            max(0, x - margin_x) : x + width + margin_x,
+        ]
+        result, qr_text, _ = QrScanner.__decode(region, backend)
+        return result, qr_text
+
+    @staticmethod
+    def __opencv_detector() -> cv2.QRCodeDetector:
+        """
+        Gets this thread's OpenCV detector.
+        """
+        detector = getattr(thread_local, "opencv_detector", None)
+        if detector is None:
+            detector = cv2.QRCodeDetector()
+            thread_local.opencv_detector = detector
+
+        return detector
+
+    @staticmethod
+    def __decode(
+        frame: NDArray[np.uint8], backend: str
+    ) -> Tuple[bool, Optional[str], Optional[NDArray[np.float32]]]:
+        """
+        Runs the given backend on the frame. The backend must be available.
+
+        Returns the success status, the decoded text, and the corners of a code that was
+        found but not decoded (OpenCV only, None otherwise).
+        """
+        if backend == BACKEND_OPENCV:
+            qr_text, corners, _ = QrScanner.__opencv_detector().detectAndDecode(frame)
+            if len(qr_text) == 0:
+                return False, None, corners
+
+            return True, qr_text, None
+
+        if backend == BACKEND_WECHAT:
+            detector = getattr(thread_local, "wechat_detector", None)
+            if detector is None:
+                detector = cv2.wechat_qrcode_WeChatQRCode()
+                thread_local.wechat_detector = detector
+
+            qr_texts, _ = detector.detectAndDecode(frame)
+            if len(qr_texts) == 0:
+                return False, None, None
+
+            return True, qr_texts[0], None
+
         decoded_qrs = pyzbar.decode(frame)
         if len(decoded_qrs) == 0:
-            return False, None
+            return False, None, None
 
         qr_text = decoded_qrs[0].data.decode()
-        return True, qr_text
+        return True, qr_text, None
@@ -2,6 +2,7 @@
 YAML reading module exports.
 """
 
-from .read_yaml import open_config
+from .compile_config import compile_to_module
+from .read_yaml import frozen_config_path, open_config
 
-__all__ = ["open_config"]
+__all__ = ["compile_to_module", "frozen_config_path", "open_config"]
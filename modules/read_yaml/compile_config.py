@@ -0,0 +1,50 @@
+"""
+Pre-parses YAML configs into Python modules, for configs that are fixed per release.
+"""
+
+import ast
+import pathlib
+
+from . import read_yaml
+
+
+def compile_to_module(yaml_path: pathlib.Path, out_py_path: pathlib.Path) -> bool:
+    """
+    Parse a YAML file and write its contents to a Python module as `CONFIG = {...}`.
+
+    open_config() loads the module instead of parsing the YAML when it is the file's sibling
+    `<name>_frozen.py` (see read_yaml.frozen_config_path()) and is newer than the YAML file.
+
+    Parameters
+    ----------
+    yaml_path : pathlib.Path
+        Path to the YAML configuration file.
+    out_py_path : pathlib.Path
+        Path of the Python module to write.
+
+    Returns
+    -------
+    bool
+        True if the module was written, False if the YAML could not be read or holds values
+        without a Python literal form (e.g. timestamps, inf, nan).
+    """
+    result, config = read_yaml.open_config(yaml_path)
+    if not result:
+        return False
+
+    literal = repr(config)
+    try:
+        ast.literal_eval(literal)
+    except (SyntaxError, ValueError) as exception:
+        print(f"ERROR: Config cannot be written as a Python literal: {exception}")
+        return False
+
+    source = f'"""\nGenerated from {yaml_path.name}, do not edit.\n"""\n\nCONFIG = {literal}\n'
+
+    try:
+        out_py_path.write_text(source, encoding="utf-8")
+    except IOError as exception:
+        print(f"ERROR: Could not write file: {exception}")
+        return False
+
+    return True
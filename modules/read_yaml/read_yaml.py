@@ -2,16 +2,74 @@
 For YAML files.
 """
 
+import importlib.util
 import pathlib
 from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+# The libyaml C parser is optional, PyYAML falls back to its pure Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def frozen_config_path(file_path: pathlib.Path) -> pathlib.Path:
+    """
+    Path of the pre-parsed module for a YAML file, written by compile_config.compile_to_module().
+
+    Parameters
+    ----------
+    file_path : pathlib.Path
+        Path to the YAML configuration file.
+
+    Returns
+    -------
+    pathlib.Path
+        `<name>_frozen.py` in the same directory.
+    """
+    return file_path.with_name(f"{file_path.stem}_frozen.py")
+
+
+def __open_frozen_config(file_path: pathlib.Path) -> Optional[Dict[str, Any]]:
+    """
+    Load the pre-parsed config if it exists and is not older than the YAML file.
+
+    Returns None otherwise, so the YAML file is parsed instead.
+    """
+    frozen_path = frozen_config_path(file_path)
+    try:
+        if frozen_path.stat().st_mtime_ns < file_path.stat().st_mtime_ns:
+            return None
+    except OSError:
+        return None
+
+    # Imported from source each call so the caller gets its own copy of the dictionary,
+    # the parsed module is cached in __pycache__
+    spec = importlib.util.spec_from_file_location(frozen_path.stem, frozen_path)
+    if spec is None or spec.loader is None:
+        return None
+
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    # Any error in the generated module falls back to the YAML file
+    # pylint: disable-next=broad-exception-caught
+    except Exception as exception:
+        print(f"WARNING: Could not load frozen config, parsing YAML: {exception}")
+        return None
+
+    return getattr(module, "CONFIG", None)
+
 
 def open_config(file_path: pathlib.Path) -> Tuple[bool, Optional[Dict[str, Any]]]:
     """
     Open and decode YAML file.
 
+    If a pre-parsed `<name>_frozen.py` module at least as new as the file is next to it,
+    its contents are returned without parsing the YAML.
+
     Parameters
     ----------
     file_path : pathlib.Path
@@ -23,10 +81,15 @@ def open_config(file_path: pathlib.Path) -> Tuple[bool, Optional[Dict[str, Any]]
         Success status and the parsed YAML configuration dictionary if successful,
         None otherwise.
     """
+    config = __open_frozen_config(file_path)
+    if config is not None:
+        return True, config
+
     try:
-        with file_path.open("r", encoding="utf8") as file:
+        # Binary, the parser decodes UTF-8 itself rather than after a separate decoding pass
+        with file_path.open("rb") as file:
             try:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=SafeLoader)
                 return True, config
             except yaml.YAMLError as exception:
                 print(f"ERROR: Could not parse YAML file: {exception}")
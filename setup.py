@@ -1,7 +1,33 @@
+import os
+from pathlib import Path
+
 from setuptools import setup
 
+# Compiled to C extensions when MYPYC_BUILD=1
+# The position modules are not listed: their Named subclasses override create() with an extra
+# name argument, which mypyc rejects for native classes
+MYPYC_MODULES = [
+    "warg_common/orientation.py",
+]
+
+ext_modules = []
+setup_requires = []
+if os.environ.get("MYPYC_BUILD") == "1":
+    setup_requires.append("mypy[mypyc]")
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        # Build requirements are still being collected, mypyc is installed before the build
+        mypycify = None
+
+    if mypycify is not None:
+        ext_modules = mypycify([path for path in MYPYC_MODULES if Path(path).exists()])
+
+# build_package.py --parallel-wheels gives each module group's wheel its own distribution name
+DIST_NAME = os.environ.get("WARG_COMMON_DIST_NAME", "warg_common")
+
 setup(
-    name="warg_common",
+    name=DIST_NAME,
     version="0.1.0",
     description="Abstractions for use across WARG's repositories.",
     author="WARG",
@@ -13,4 +39,6 @@ setup(
         "monotonic==1.6",
         "pymavlink==2.4.49",
     ],
+    setup_requires=setup_requires,
+    ext_modules=ext_modules,
 )
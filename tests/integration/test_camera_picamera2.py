@@ -48,6 +48,8 @@ def main() -> int:
         if cv2.waitKey(1) & 0xFF == ord("q"):
             break
 
+    device.close()
+
     return 0
 
 
@@ -37,6 +37,8 @@ def main() -> int:
         # Delay for 100 ms
         cv2.waitKey(100)
 
+    camera.close()
+
     print(text)
 
     return 0
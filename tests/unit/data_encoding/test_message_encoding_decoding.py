@@ -36,3 +36,63 @@ def test_encoding_decoding() -> None:
     assert original_position.latitude == decoded_position.latitude
     assert original_position.longitude == decoded_position.longitude
     assert original_position.altitude == decoded_position.altitude
+
+
+def test_encoding_decoding_raw_bytes() -> None:
+    """
+    Function to test encoding without base64
+    """
+    worker_id = worker_enum.WorkerEnum.COMMUNICATIONS_WORKER
+    success, original_position = position_global.PositionGlobal.create(
+        latitude=34.24902422, longitude=84.6233434, altitude=27.4343424
+    )
+    assert success
+
+    result, encoded_bytes = message_encoding_decoding.encode_position_global_bytes(
+        worker_id, original_position
+    )
+    assert result
+    assert len(encoded_bytes) == message_encoding_decoding.DATA_STRUCT.size
+
+    result, worker, decoded_position = message_encoding_decoding.decode_bytes_to_position_global(
+        encoded_bytes, encoded_is_base64=False
+    )
+    assert result
+
+    assert worker_id == worker
+
+    assert original_position.latitude == decoded_position.latitude
+    assert original_position.longitude == decoded_position.longitude
+    assert original_position.altitude == decoded_position.altitude
+
+
+def test_encoding_decoding_bulk() -> None:
+    """
+    Function to test encoding multiple positions at once
+    """
+    worker_id = worker_enum.WorkerEnum.COMMUNICATIONS_WORKER
+    original_positions = []
+    for i in range(3):
+        success, original_position = position_global.PositionGlobal.create(
+            latitude=34.24902422 + i, longitude=84.6233434 - i, altitude=27.4343424 * i
+        )
+        assert success
+        original_positions.append(original_position)
+
+    result, encoded_bytes = message_encoding_decoding.encode_positions_bulk(
+        worker_id, original_positions
+    )
+    assert result
+
+    result, worker, decoded_positions = message_encoding_decoding.decode_positions_bulk(
+        encoded_bytes
+    )
+    assert result
+
+    assert worker_id == worker
+    assert len(original_positions) == len(decoded_positions)
+
+    for original_position, decoded_position in zip(original_positions, decoded_positions):
+        assert original_position.latitude == decoded_position.latitude
+        assert original_position.longitude == decoded_position.longitude
+        assert original_position.altitude == decoded_position.altitude
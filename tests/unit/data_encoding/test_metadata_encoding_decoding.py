@@ -30,3 +30,40 @@ def test_encoding_metadata() -> None:
     assert worker_id == worker_class  # Checks if Enum type Matches
 
     assert number_of_messages == decoded_number_of_messages
+
+
+def test_encoding_metadata_raw_bytes() -> None:
+    """
+    Function to test encoding without base64
+    """
+    worker_id = worker_enum.WorkerEnum.COMMUNICATIONS_WORKER
+    number_of_messages = 5
+
+    result, encoded_bytes = metadata_encoding_decoding.encode_metadata_bytes(
+        worker_id, number_of_messages
+    )
+    assert result
+    assert len(encoded_bytes) == metadata_encoding_decoding.DATA_STRUCT.size
+
+    result, worker_class, decoded_number_of_messages = metadata_encoding_decoding.decode_metadata(
+        encoded_bytes, encoded_is_base64=False
+    )
+    assert result
+
+    assert worker_id == worker_class
+
+    assert number_of_messages == decoded_number_of_messages
+
+
+def test_decoding_metadata_unknown_worker() -> None:
+    """
+    Function to test decoding a worker ID that is not in WorkerEnum
+    """
+    encoded_bytes = metadata_encoding_decoding.DATA_STRUCT.pack(0, 5)
+
+    result, worker_class, decoded_number_of_messages = metadata_encoding_decoding.decode_metadata(
+        encoded_bytes, encoded_is_base64=False
+    )
+    assert not result
+    assert worker_class is None
+    assert decoded_number_of_messages is None
@@ -41,3 +41,21 @@ def test_image_encode_decode() -> None:
 
     # Check output shape
     assert img_array.shape == raw_data.shape
+
+
+def test_image_encode_batch() -> None:
+    """
+    Encoding several images at once gives the same images back in order.
+    """
+    # Get test image in numpy form
+    im = Image.open(pathlib.Path(PARENT_DIRECTORY, TEST_IMAGE_NAME))
+    raw_data = np.asarray(im)
+    images = [raw_data, np.ascontiguousarray(raw_data[::2, ::2]), np.flip(raw_data, axis=0)]
+
+    # Encode images into JPEG
+    jpeg_bytes_list = encoder.encode_batch(images)
+
+    # Check output shapes
+    assert len(jpeg_bytes_list) == len(images)
+    for image, jpeg_bytes in zip(images, jpeg_bytes_list):
+        assert decoder.decode(jpeg_bytes).shape == image.shape
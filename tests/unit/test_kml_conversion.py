@@ -183,6 +183,43 @@ class TestNamedPositions:
             encoding="utf-8"
         ) == expected_kml_document_path.read_text(encoding="utf-8")
 
+    def test_streamed(
+        self,
+        mocker: pytest_mock.MockerFixture,
+        named_positions: list[
+            position_global_relative_altitude.NamedPositionGlobalRelativeAltitude
+        ],
+        tmp_path: pathlib.Path,
+    ) -> None:
+        """
+        Large documents are streamed and match the document written in one call.
+        """
+        # Setup
+        expected_kml_document_path = pathlib.Path(PARENT_DIRECTORY, EXPECTED_NAMED_FILENAME)
+        actual_kml_document_name = "actual"
+
+        tmp_path.mkdir(parents=True, exist_ok=True)
+
+        mocker.patch.object(kml_conversion, "STREAM_MIN_POSITIONS", 1)
+
+        # Run
+        result, actual_kml_file_path = kml_conversion.named_positions_to_kml(
+            named_positions,
+            actual_kml_document_name,
+            tmp_path,
+        )
+
+        # Check
+        assert result
+        assert actual_kml_file_path is not None
+
+        assert actual_kml_file_path.exists()
+        assert actual_kml_file_path.suffix == KML_SUFFIX
+
+        assert actual_kml_file_path.read_text(
+            encoding="utf-8"
+        ) == expected_kml_document_path.read_text(encoding="utf-8")
+
     def test_nonexistent_save_path(
         self,
         named_positions: list[
@@ -2,6 +2,8 @@
 Test calls only, not conversion correctness as that is handled by the library.
 """
 
+import numpy as np
+import pymap3d as pm
 import pytest
 
 from modules import location_global
@@ -9,6 +11,7 @@ from modules import location_local
 from modules import orientation
 from modules import position_global
 from modules import position_local
+from modules import position_local_array
 from modules.mavlink import drone_odometry_global
 from modules.mavlink import drone_odometry_local
 from modules.mavlink import local_global_conversion
@@ -111,6 +114,173 @@ def test_position_local_from_location_global(home_position: position_global.Posi
     assert isinstance(actual, position_local.PositionLocal)
 
 
+def test_position_global_from_position_local_batch(
+    home_position: position_global.PositionGlobal,
+) -> None:
+    """
+    Normal.
+    """
+    # Setup
+    north = np.array([0.0, 10.0, -25.0])
+    east = np.array([0.0, 5.0, 40.0])
+    down = np.array([0.0, -20.0, 3.0])
+
+    # Run
+    result, actual = local_global_conversion.position_global_from_position_local_batch(
+        home_position, north, east, down
+    )
+
+    # Check
+    assert result
+    assert actual is not None
+    latitude, longitude, altitude = actual
+    assert latitude.shape == north.shape
+    assert longitude.shape == north.shape
+    assert altitude.shape == north.shape
+
+
+def test_position_global_from_position_local_batch_mismatched_shapes(
+    home_position: position_global.PositionGlobal,
+) -> None:
+    """
+    Input arrays of different shapes.
+    """
+    # Run
+    result, actual = local_global_conversion.position_global_from_position_local_batch(
+        home_position, np.zeros(3), np.zeros(2), np.zeros(3)
+    )
+
+    # Check
+    assert not result
+    assert actual is None
+
+
+def test_position_global_from_position_local_array(
+    home_position: position_global.PositionGlobal,
+) -> None:
+    """
+    Same result as the batch conversion.
+    """
+    # Setup
+    north = np.array([0.0, 10.0, -25.0])
+    east = np.array([0.0, 5.0, 40.0])
+    down = np.array([0.0, -20.0, 3.0])
+    result, local_positions = position_local_array.PositionLocalArray.create(north, east, down)
+    assert result
+    assert local_positions is not None
+
+    # Run
+    result, actual = local_global_conversion.position_global_from_position_local_array(
+        home_position, local_positions
+    )
+
+    # Check
+    assert result
+    assert actual is not None
+    expected = pm.ned2geodetic(
+        north,
+        east,
+        down,
+        home_position.latitude,
+        home_position.longitude,
+        home_position.altitude,
+    )
+    for actual_column, expected_column in zip(actual, expected):
+        np.testing.assert_allclose(actual_column, expected_column)
+
+
+def test_position_local_from_position_global_batch(
+    home_position: position_global.PositionGlobal,
+) -> None:
+    """
+    Normal.
+    """
+    # Setup
+    latitude = np.array([43.472978, 43.473, 43.4725])
+    longitude = np.array([-80.540103, -80.54, -80.5405])
+    altitude = np.array([336.0, 350.0, 330.0])
+
+    # Run
+    result, actual = local_global_conversion.position_local_from_position_global_batch(
+        home_position, latitude, longitude, altitude
+    )
+
+    # Check
+    assert result
+    assert actual is not None
+    north, east, down = actual
+    assert north.shape == latitude.shape
+    assert east.shape == latitude.shape
+    assert down.shape == latitude.shape
+
+
+def test_home_frame_geodetic_to_ned(home_position: position_global.PositionGlobal) -> None:
+    """
+    Matches pymap3d.
+    """
+    # Setup
+    latitude = np.array([43.472978, 43.5, 43.45])
+    longitude = np.array([-80.540103, -80.5, -80.6])
+    altitude = np.array([336.0, 400.0, 300.0])
+
+    result, home_frame = local_global_conversion.HomeFrame.create(home_position)
+    assert result
+    assert home_frame is not None
+
+    expected = pm.geodetic2ned(
+        latitude,
+        longitude,
+        altitude,
+        home_position.latitude,
+        home_position.longitude,
+        home_position.altitude,
+    )
+
+    # Run
+    actual = home_frame.geodetic_to_ned(latitude, longitude, altitude)
+
+    # Check
+    np.testing.assert_allclose(actual, expected, atol=1e-6)
+
+
+def test_local_frame_tracker(home_position: position_global.PositionGlobal) -> None:
+    """
+    Stream of nearby positions matches pymap3d.
+    """
+    # Setup
+    result, tracker = local_global_conversion.LocalFrameTracker.create(home_position, 10)
+    assert result
+    assert tracker is not None
+
+    steps = np.linspace(0.0, 5e-4, 30)
+
+    for step in steps:
+        result, drone_position = position_global.PositionGlobal.create(
+            home_position.latitude + step,
+            home_position.longitude - step,
+            home_position.altitude + 1000.0 * step,
+        )
+        assert result
+        assert drone_position is not None
+
+        expected = pm.geodetic2ned(
+            drone_position.latitude,
+            drone_position.longitude,
+            drone_position.altitude,
+            home_position.latitude,
+            home_position.longitude,
+            home_position.altitude,
+        )
+
+        # Run
+        result, actual = tracker.update(drone_position)
+
+        # Check
+        assert result
+        assert actual is not None
+        np.testing.assert_allclose((actual.north, actual.east, actual.down), expected, atol=1e-3)
+
+
 def test_drone_odometry_local_from_global(home_position: position_global.PositionGlobal) -> None:
     """
     Normal.
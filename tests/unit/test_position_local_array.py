@@ -0,0 +1,94 @@
+"""
+Test conversions between position objects and the column arrays.
+"""
+
+import math
+
+import numpy as np
+
+from modules import orientation
+from modules import orientation_array
+from modules import position_local
+from modules import position_local_array
+
+
+def test_position_local_array_round_trip() -> None:
+    """
+    Objects to arrays and back.
+    """
+    # Setup
+    positions = []
+    for i in range(5):
+        result, position = position_local.PositionLocal.create(float(i), -2.0 * i, 0.5 * i)
+        assert result
+        positions.append(position)
+
+    # Run
+    result, array = position_local_array.PositionLocalArray.create_from_positions(positions)
+
+    # Check
+    assert result
+    assert array is not None
+    assert len(array) == 5
+    for expected, actual in zip(positions, array.to_positions()):
+        assert actual.north == expected.north
+        assert actual.east == expected.east
+        assert actual.down == expected.down
+
+
+def test_position_local_array_shape_mismatch() -> None:
+    """
+    Columns of different lengths.
+    """
+    # Run
+    result, array = position_local_array.PositionLocalArray.create(
+        np.zeros(3), np.zeros(2), np.zeros(3)
+    )
+
+    # Check
+    assert not result
+    assert array is None
+
+
+def test_position_local_array_distance_and_rotation() -> None:
+    """
+    Distance to a point and a 90 degree yaw.
+    """
+    # Setup
+    result, array = position_local_array.PositionLocalArray.create(
+        np.array([3.0, 1.0]), np.array([4.0, 0.0]), np.array([0.0, 0.0])
+    )
+    assert result
+    assert array is not None
+
+    result, origin = position_local.PositionLocal.create(0.0, 0.0, 0.0)
+    assert result
+    assert origin is not None
+
+    result, yaw_right = orientation.Orientation.create(math.pi / 2, 0.0, 0.0)
+    assert result
+    assert yaw_right is not None
+
+    # Run
+    distances = array.distance_to(origin)
+    rotated = array.rotate_by(yaw_right)
+
+    # Check
+    np.testing.assert_allclose(distances, [5.0, 1.0])
+    np.testing.assert_allclose(rotated.north, [-4.0, 0.0], atol=1e-12)
+    np.testing.assert_allclose(rotated.east, [3.0, 1.0], atol=1e-12)
+    np.testing.assert_allclose(rotated.down, [0.0, 0.0], atol=1e-12)
+
+
+def test_orientation_array_out_of_range() -> None:
+    """
+    Angle outside of [-pi, pi].
+    """
+    # Run
+    result, array = orientation_array.OrientationArray.create(
+        np.array([0.0, 4.0]), np.zeros(2), np.zeros(2)
+    )
+
+    # Check
+    assert not result
+    assert array is None
@@ -2,8 +2,11 @@
 Test if read_yaml function correctly reads yaml files
 """
 
+import os
 import pathlib
+import shutil
 
+from modules.read_yaml import compile_config
 from modules.read_yaml import read_yaml
 
 
@@ -38,3 +41,75 @@ class TestOpenConfig:
 
         assert not result
         assert actual is None
+
+    def test_open_config_frozen(self, tmp_path: pathlib.Path) -> None:
+        """
+        Test if the function uses the pre-parsed module instead of the yaml file
+        """
+        config_path = pathlib.Path(tmp_path, "config.yaml")
+        config_path.write_text("config: from_yaml\n", encoding="utf-8")
+        frozen_path = read_yaml.frozen_config_path(config_path)
+        frozen_path.write_text('CONFIG = {"config": "from_frozen"}\n', encoding="utf-8")
+
+        expected = {"config": "from_frozen"}
+
+        result, actual = read_yaml.open_config(config_path)
+
+        assert result
+        assert actual == expected
+
+    def test_open_config_frozen_stale(self, tmp_path: pathlib.Path) -> None:
+        """
+        Test if the function ignores a pre-parsed module older than the yaml file
+        """
+        config_path = pathlib.Path(tmp_path, "config.yaml")
+        config_path.write_text("config: from_yaml\n", encoding="utf-8")
+        frozen_path = read_yaml.frozen_config_path(config_path)
+        frozen_path.write_text('CONFIG = {"config": "from_frozen"}\n', encoding="utf-8")
+        yaml_mtime_ns = frozen_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(config_path, ns=(yaml_mtime_ns, yaml_mtime_ns))
+
+        expected = {"config": "from_yaml"}
+
+        result, actual = read_yaml.open_config(config_path)
+
+        assert result
+        assert actual == expected
+
+
+class TestCompileToModule:
+    """
+    Test the compile_to_module function
+    """
+
+    def test_compile_to_module(self, tmp_path: pathlib.Path) -> None:
+        """
+        Test if the compiled module is loaded with the same contents as the yaml file
+        """
+        config_path = pathlib.Path(tmp_path, "config_no_error.yaml")
+        shutil.copy(pathlib.Path(PARENT_DIRECTORY, "config_no_error.yaml"), config_path)
+
+        expected = {"config": "no_error"}
+
+        result = compile_config.compile_to_module(
+            config_path, read_yaml.frozen_config_path(config_path)
+        )
+        assert result
+
+        result, actual = read_yaml.open_config(config_path)
+
+        assert result
+        assert actual == expected
+
+    def test_compile_to_module_not_literal(self, tmp_path: pathlib.Path) -> None:
+        """
+        Test if the function rejects values without a Python literal form
+        """
+        config_path = pathlib.Path(tmp_path, "config.yaml")
+        config_path.write_text("date: 2024-01-01\n", encoding="utf-8")
+        frozen_path = read_yaml.frozen_config_path(config_path)
+
+        result = compile_config.compile_to_module(config_path, frozen_path)
+
+        assert not result
+        assert not frozen_path.exists()